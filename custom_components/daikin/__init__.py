@@ -6,10 +6,13 @@ import asyncio
 import logging
 import ssl
 
-from aiohttp import ClientConnectionError
+from aiohttp import ClientConnectionError, ClientError
+from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from pydaikin.daikin_base import Appliance
+from pydaikin.exceptions import DaikinException
 from pydaikin.factory import DaikinFactory
 
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN
 from homeassistant.const import (
     CONF_API_KEY,
     CONF_HOST,
@@ -19,33 +22,44 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
+from homeassistant.helpers.typing import ConfigType
 
-from .const import KEY_MAC, TIMEOUT
+from .const import DOMAIN, FAST_START_TIMEOUT, KEY_MAC, TIMEOUT
 from .coordinator import DaikinConfigEntry, DaikinCoordinator
+from .energy import DaikinEnergyImporter
+from .orchestrator import async_get_poll_orchestrator
+from .services import async_setup_services
+from .ssl_context import (  # noqa: F401
+    async_get_daikin_ssl_context,
+    get_daikin_ssl_context,
+)
+from .store import (
+    DaikinDeviceStore,
+    DeviceSnapshot,
+    create_device,
+    device_capabilities,
+    restore_device,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def get_daikin_ssl_context() -> ssl.SSLContext:
-    """Create SSL context with legacy Daikin support."""
-    ssl_context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    # SSL_OP_LEGACY_SERVER_CONNECT — BRP072C legacy firmware needs legacy renegotiation
-    ssl_context.options |= 0x4
-    # Lower security level to allow legacy Daikin SSL/TLS configurations
-    # Fixes HA 2025.10 SSL WRONG_SIGNATURE_TYPE error
-    try:
-        ssl_context.set_ciphers('DEFAULT:@SECLEVEL=0')
-    except ssl.SSLError:
-        pass  # Fallback for systems that don't support SECLEVEL
-    return ssl_context
+PLATFORMS = [Platform.CLIMATE, Platform.SENSOR, Platform.SWITCH]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
-PLATFORMS = [Platform.CLIMATE, Platform.SENSOR, Platform.SWITCH]
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Daikin services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: DaikinConfigEntry) -> bool:
@@ -57,40 +71,186 @@ async def async_setup_entry(hass: HomeAssistant, entry: DaikinConfigEntry) -> bo
 
     session = async_get_clientsession(hass)
     host = conf[CONF_HOST]
-    # Create SSL context in executor to avoid blocking the event loop
-    ssl_context = await hass.async_add_executor_job(get_daikin_ssl_context)
-    try:
-        async with asyncio.timeout(TIMEOUT):
-            device: Appliance = await DaikinFactory(
-                host,
-                session,
-                key=entry.data.get(CONF_API_KEY),
-                uuid=entry.data.get(CONF_UUID),
-                password=entry.data.get(CONF_PASSWORD),
-                ssl_context=ssl_context,
-            )
-        _LOGGER.debug("Connection to %s successful", host)
-    except TimeoutError as err:
-        _LOGGER.debug("Connection to %s timed out in 60 seconds", host)
-        raise ConfigEntryNotReady from err
-    except ClientConnectionError as err:
-        _LOGGER.debug("ClientConnectionError to %s", host)
-        raise ConfigEntryNotReady from err
-
-    coordinator = DaikinCoordinator(hass, entry, device)
-
-    await coordinator.async_config_entry_first_refresh()
+    ssl_context = await async_get_daikin_ssl_context(hass)
+    store = DaikinDeviceStore(hass, entry.entry_id)
+
+    # Fast start: with a stored snapshot, set up right away from the last known
+    # values (entities start unavailable) and connect in the background, so an
+    # unreachable unit no longer holds up setup for the full TIMEOUT. The
+    # snapshot also records the adapter family, so reconnecting skips probing.
+    if (snapshot := await store.async_load()) is not None and (
+        device := restore_device(snapshot, conf, session, ssl_context)
+    ) is not None:
+        _LOGGER.debug("Fast-starting %s from its stored snapshot", host)
+        coordinator = DaikinCoordinator(hass, entry, device, store, connected=False)
+    else:
+        try:
+            async with asyncio.timeout(TIMEOUT):
+                device = await _async_create_device(hass, entry, ssl_context)
+            _LOGGER.debug("Connection to %s successful", host)
+        except TimeoutError as err:
+            _LOGGER.debug("Connection to %s timed out in 60 seconds", host)
+            raise ConfigEntryNotReady from err
+        except ClientConnectionError as err:
+            _LOGGER.debug("ClientConnectionError to %s", host)
+            raise ConfigEntryNotReady from err
+
+        coordinator = DaikinCoordinator(hass, entry, device, store)
+
+        await coordinator.async_config_entry_first_refresh()
 
     await async_migrate_unique_id(hass, entry, device)
 
     entry.runtime_data = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    if RECORDER_DOMAIN in hass.config.components:
+        # Long-term statistics need the recorder, which is only an
+        # after-dependency: without it the energy sensors still work
+        entry.async_on_unload(DaikinEnergyImporter(hass, coordinator).async_start())
+    coordinator.async_start_polling()
+    if not coordinator.connected:
+        entry.async_create_background_task(
+            hass,
+            _async_connect_in_background(hass, entry, ssl_context, snapshot),
+            name=f"{DOMAIN} {host} connect",
+        )
     return True
 
 
+async def _async_create_device(
+    hass: HomeAssistant,
+    entry: DaikinConfigEntry,
+    ssl_context: ssl.SSLContext,
+    device_type: type[Appliance] | None = None,
+) -> Appliance:
+    """Detect the adapter family and connect to the device.
+
+    With the family known from a snapshot, connect as that family directly:
+    DaikinFactory tries BRP084 and BRP069 requests first, which costs failed
+    round trips on every other family. Falls back to probing when the device
+    no longer answers as that family.
+    """
+    if device_type is not None:
+        device = create_device(
+            device_type, entry.data, async_get_clientsession(hass), ssl_context
+        )
+        try:
+            await device.init()
+        except (HTTPNotFound, DaikinException) as err:
+            _LOGGER.debug(
+                "%s did not answer as %s (%r), probing its family",
+                entry.data[CONF_HOST], device_type.__name__, err,
+            )
+        else:
+            # Same acceptance check as DaikinFactory
+            if device.values.get("mode"):
+                return device
+    return await DaikinFactory(
+        entry.data[CONF_HOST],
+        async_get_clientsession(hass),
+        key=entry.data.get(CONF_API_KEY),
+        uuid=entry.data.get(CONF_UUID),
+        password=entry.data.get(CONF_PASSWORD),
+        ssl_context=ssl_context,
+    )
+
+
+async def _async_connect_in_background(
+    hass: HomeAssistant,
+    entry: DaikinConfigEntry,
+    ssl_context: ssl.SSLContext,
+    snapshot: DeviceSnapshot,
+) -> None:
+    """Connect a fast-started entry, retrying with growing timeouts.
+
+    Then revalidate the snapshot the entities were built from. Runs as an
+    entry background task, so unloading the entry cancels it.
+    """
+    coordinator = entry.runtime_data
+    host = entry.data[CONF_HOST]
+    restored = coordinator.device
+    orchestrator = async_get_poll_orchestrator(hass)
+    timeout = FAST_START_TIMEOUT
+    while True:
+        try:
+            # Through a poll slot: after a restart every fast-started entry
+            # connects at once. Retries queue with the failing units.
+            async with orchestrator.async_poll_slot(
+                coordinator, failing=timeout > FAST_START_TIMEOUT
+            ) as budget, asyncio.timeout(min(timeout, budget)):
+                device = await _async_create_device(
+                    hass, entry, ssl_context, type(restored)
+                )
+        except HTTPForbidden:
+            entry.async_start_reauth(hass)
+            return
+        except (TimeoutError, ClientError, DaikinException, OSError) as err:
+            _LOGGER.debug(
+                "Connection to %s failed (%r), retrying in %ss", host, err, timeout
+            )
+        except Exception:
+            # Anything else (e.g. pydaikin choking on a half-booted adapter's
+            # answer) must not end the task: the entry would then stay
+            # disconnected until it is reloaded
+            _LOGGER.exception(
+                "Unexpected error connecting to %s, retrying in %ss", host, timeout
+            )
+        else:
+            break
+        await asyncio.sleep(timeout)
+        timeout = min(timeout * 2, TIMEOUT)
+
+    if type(device) is not type(restored):
+        # The adapter answers as another family than the snapshot recorded
+        # (e.g. after a firmware upgrade). Entities were built for the old one:
+        # drop the snapshot and reload through the regular, blocking setup.
+        _LOGGER.info(
+            "%s is now detected as %s (was %s), reloading",
+            host, type(device).__name__, type(restored).__name__,
+        )
+        await coordinator.store.async_remove()
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+    # Snapshots from before capabilities were stored: the entities were built
+    # from the restored values, so those are what to compare against
+    expected = snapshot.get("capabilities") or device_capabilities(restored)
+    if (capabilities := device_capabilities(device)) != expected:
+        # Same family, but another unit, firmware or feature set (e.g. zones
+        # added) than the entities were built for
+        _LOGGER.info(
+            "%s reports other capabilities than stored (mac %s, firmware %s; "
+            "was mac %s, firmware %s), reloading",
+            host, capabilities["mac"], capabilities["ver"],
+            expected["mac"], expected["ver"],
+        )
+        await coordinator.store.async_remove()
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+
+    _LOGGER.debug("Connection to %s successful", host)
+    coordinator.async_set_device(device)
+    await coordinator.async_refresh()
+
+
+async def async_update_options(hass: HomeAssistant, entry: DaikinConfigEntry) -> None:
+    """Reload the entry so the coordinator picks up changed options."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: DaikinConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, PLATFORMS
+    ):
+        # Flush the snapshot before async_remove_entry may delete it
+        await entry.runtime_data.store.async_close()
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: DaikinConfigEntry) -> None:
+    """Delete the stored snapshot of a removed entry."""
+    await DaikinDeviceStore(hass, entry.entry_id).async_remove()
 
 
 async def async_migrate_unique_id(
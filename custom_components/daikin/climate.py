@@ -25,17 +25,33 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from pydaikin.exceptions import DaikinException
 
+from .climate_state import (
+    DaikinClimateState,
+    DeviceReading,
+    command_failed,
+    displayed_hvac_mode,
+    expire,
+    next_expiry,
+    observe,
+    record_command,
+    record_expected,
+    record_optimistic,
+)
 from .const import (
     ATTR_INSIDE_TEMPERATURE,
     ATTR_OUTSIDE_TEMPERATURE,
     ATTR_STATE_OFF,
     ATTR_STATE_ON,
     ATTR_TARGET_TEMPERATURE,
+    COMMAND_MERGE_WINDOW,
+    CONF_SKIP_REDUNDANT_WRITES,
+    DEFAULT_SKIP_REDUNDANT_WRITES,
 )
 from .coordinator import DaikinConfigEntry, DaikinCoordinator
 from .entity import DaikinEntity
@@ -84,7 +100,9 @@ HA_ATTR_TO_DAIKIN = {
     ATTR_TARGET_TEMPERATURE: "stemp",
 }
 
-DAIKIN_ATTR_ADVANCED = "adv"
+# Settings adapters store per mode: a mode write restores the target mode's
+# stored value for any of these keys missing from the payload
+MODE_DEPENDENT_KEYS = ("stemp", "shum", "f_rate")
 
 
 async def async_setup_entry(
@@ -102,6 +120,120 @@ def format_target_temperature(target_temperature: float) -> str:
     return str(round(float(target_temperature) * 2, 0) / 2).rstrip("0").rstrip(".")
 
 
+class DaikinCommandQueue:
+    """Merge device.set() payloads sent close together into one write.
+
+    Commands queued within COMMAND_MERGE_WINDOW, or while the previous write
+    is still in flight, are folded into a single payload (last value wins per
+    key). Single-request adapters (BRP069, MAX_CONCURRENT_REQUESTS=1) would
+    otherwise run one slow read-modify-write round trip per command.
+
+    Unless disabled in the options, keys that already match the device are
+    dropped before writing, and a payload left empty is not sent at all —
+    automations that re-assert the same state would otherwise write every time.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: DaikinCoordinator) -> None:
+        """Initialize the queue."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._skip_redundant: bool = coordinator.config_entry.options.get(
+            CONF_SKIP_REDUNDANT_WRITES, DEFAULT_SKIP_REDUNDANT_WRITES
+        )
+        self._pending: dict[str, Any] = {}
+        # Write still accepting commands / write currently talking to the device
+        self._collecting: asyncio.Task | None = None
+        self._in_flight: asyncio.Task | None = None
+
+    def async_submit(self, values: dict[str, Any]) -> asyncio.Task:
+        """Queue values and return the task of the write that will carry them."""
+        stats = self._coordinator.command_stats
+        stats.commands += 1
+        if self._collecting is not None:
+            self._pending.update(values)
+            stats.merged += 1
+            return self._collecting
+        self._pending = dict(values)
+        self._collecting = self._hass.async_create_task(
+            self._async_write(self._in_flight),
+            name=f"daikin_set_{self._coordinator.name}",
+        )
+        return self._collecting
+
+    async def _async_write(self, previous: asyncio.Task | None) -> bool:
+        """Send the merged payload once the window has closed.
+
+        Returns whether anything was written to the device.
+        """
+        if previous is not None:
+            # Only ordering matters here; the previous write's outcome was
+            # already delivered to its own callers.
+            await asyncio.wait((previous,))
+        await asyncio.sleep(COMMAND_MERGE_WINDOW)
+        self._in_flight, self._collecting = self._collecting, None
+        payload, self._pending = self._pending, {}
+        stats = self._coordinator.command_stats
+        if self._skip_redundant and self._coordinator.last_update_success:
+            changed = self._changed_values(payload)
+            stats.skipped_keys += len(payload) - len(changed)
+            if not changed:
+                # An empty device.set() means "power on" to pydaikin — never
+                # send one, there is simply nothing to do.
+                stats.skipped += 1
+                self._coordinator.async_trace_skipped_write(payload)
+                _LOGGER.debug(
+                    "Skipping write of %s to %s: already in that state",
+                    payload, self._coordinator.name,
+                )
+                return False
+            payload = changed
+        stats.writes += 1
+        _LOGGER.debug("Sending merged payload %s to %s", payload, self._coordinator.name)
+        async with self._coordinator.async_track_write(payload):
+            await self._coordinator.device.set(payload)
+        return True
+
+    def _changed_values(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Return the part of payload the device does not already report.
+
+        Compares against device.values, which hold the last poll and are also
+        updated by pydaikin on every write. Values are compared as pydaikin's
+        human representation — the form _set() sends.
+        """
+        device = self._coordinator.device
+        values = device.values
+        changed: dict[str, Any] = {}
+        for key, value in payload.items():
+            # invalidate=False: reading through ApplianceValues.get() would
+            # mark the owning resource stale and force a refetch.
+            current = values.get(key, invalidate=False)
+            if key == "mode":
+                power = values.get("pow", invalidate=False)
+                if value == "off":
+                    same = power == "0"
+                else:
+                    same = power == "1" and device.daikin_to_human(key, current) == value
+            elif key == "stemp":
+                try:
+                    same = float(current) == float(value)
+                except (TypeError, ValueError):
+                    same = False
+            else:
+                same = (
+                    current is not None
+                    and str(device.daikin_to_human(key, current)).lower() == value
+                )
+            if not same:
+                changed[key] = value
+        if "mode" in changed:
+            # Keep what the caller asked for in the new mode, even if it equals
+            # the old mode's value — otherwise the adapter applies its own.
+            for key in MODE_DEPENDENT_KEYS:
+                if key in payload:
+                    changed[key] = payload[key]
+        return changed
+
+
 class DaikinClimate(DaikinEntity, ClimateEntity):
     """Representation of a Daikin HVAC."""
 
@@ -111,6 +243,9 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
     _attr_target_temperature_step = 0.5
     _attr_fan_modes: list[str]
     _attr_swing_modes: list[str]
+    _update_keys = frozenset(
+        ("pow", "mode", "stemp", "f_rate", "f_dir", "htemp", "cmpfreq", "adv", "en_hol")
+    )
 
     def __init__(self, coordinator: DaikinCoordinator) -> None:
         """Initialize the climate device."""
@@ -122,45 +257,28 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
             ATTR_FAN_MODE: self._attr_fan_modes,
             ATTR_SWING_MODE: self._attr_swing_modes,
         }
+        self._command_queue = DaikinCommandQueue(coordinator.hass, coordinator)
+        # extra_state_attributes and the command state they were built from
+        self._attributes: dict[str, Any] = {}
+        self._attributes_inputs: tuple[Any, ...] | None = None
 
-        # Optimistic state for instant UI updates (devices are slow to respond)
-        self._optimistic_target_temp = None
-        self._optimistic_hvac_mode = None
-        self._optimistic_fan_mode = None
-        self._optimistic_swing_mode = None
-        self._optimistic_set_time = None  # Timestamp to detect stale optimistic values
-
-        # Track last known power state for physical remote override detection
-        # Initialize from device state to enable detection on first command after HA restart
-        self._last_known_pow: str = self.device.values.get('pow', '1')
-        # Debounce: prevent duplicate override events from race conditions
-        self._last_override_event_time: float | None = None
         # Track entity initialization time for startup grace period (timezone-aware)
         self._entity_init_time: str = dt_util.now().isoformat()
-        # v2.36.0: Float timestamp for efficient startup grace comparison in override detection
-        self._entity_init_timestamp: float = time.time()
-        # v2.36.0: Track coordinator state for reconnect-grace logic.
-        # Init from current coordinator state (not hardcoded True) — first_refresh
-        # has already completed at this point per HA setup ordering, so this reflects reality.
-        self._last_coordinator_success: bool = self.coordinator.last_update_success
-        self._last_coordinator_recovery_time: float | None = None
-        # v2.37.0: Track ANY command sent (not just on/off) to suppress false override
-        # during mode transitions where Daikin bounces pow 1→0→1 (e.g., cool→fan_only)
-        self._last_any_command_time: float | None = None
-
-        # v2.36.0: Persistent expected state for blueprint override detection.
-        # Unlike optimistic state (clears after 30s), these persist for up to 1 hour
-        # so the blueprint can detect manual overrides well after the last command.
-        self._expected_hvac_mode: str | None = None
-        self._expected_set_time: float | None = None
-        # v2.40.0: Snapshot of expected state from before the in-flight command,
-        # restored if that command fails (a failed command must not blind the
-        # blueprint's expected-vs-actual safety net).
-        self._expected_state_snapshot: tuple[str | None, float | None] | None = None
-        # v2.40.0: Last coordinator-CONFIRMED active (non-off) HVAC mode.
-        # Written only in _handle_coordinator_update, mirroring _last_known_pow.
-        # Used by async_turn_on to restore the pre-off mode.
-        self._last_active_hvac_mode: HVACMode | None = None
+        # Optimistic, expected and override-detection state (climate_state.py)
+        self._state = DaikinClimateState(
+            init_at=time.monotonic(),
+            # Track last known power state for physical remote override detection
+            # Initialize from device state to enable detection on first command after HA restart
+            last_known_power=coordinator.data.power,
+            # v2.36.0: Init from current coordinator state (not hardcoded True) —
+            # first_refresh has already completed at this point per HA setup
+            # ordering, so this reflects reality.
+            last_coordinator_success=self.coordinator.last_update_success,
+        )
+        # Timer clearing optimistic/expected state when its window closes,
+        # and the monotonic deadline it is set for
+        self._unsub_expiry: CALLBACK_TYPE | None = None
+        self._expiry_at: float | None = None
 
         self._attr_supported_features = (
             ClimateEntityFeature.TURN_ON
@@ -177,21 +295,84 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
         if self.device.support_swing_mode:
             self._attr_supported_features |= ClimateEntityFeature.SWING_MODE
 
-    def _record_expected_state(self, hvac_mode: HVACMode | str) -> None:
-        """Record expected HVAC mode for the blueprint's safety-net detection.
+    async def async_added_to_hass(self) -> None:
+        """Take commands from the device's other entities."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_register_climate(self))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the expiry timer."""
+        await super().async_will_remove_from_hass()
+        self._cancel_expiry()
+
+    @callback
+    def _cancel_expiry(self) -> None:
+        """Cancel the expiry timer, if any."""
+        if self._unsub_expiry is not None:
+            self._unsub_expiry()
+            self._unsub_expiry = None
+        self._expiry_at = None
+
+    @callback
+    def _schedule_expiry(self) -> None:
+        """(Re)arm the timer for the next optimistic or expected window to close.
+
+        Stale state reverts the moment its window closes instead of on the
+        first poll after it. The grace windows get no timer: closing them
+        changes nothing shown, and polls compare against them directly.
+        """
+        if (deadline := next_expiry(self._state)) == self._expiry_at:
+            return
+        self._cancel_expiry()
+        if deadline is None:
+            return
+        self._expiry_at = deadline
+        self._unsub_expiry = async_call_later(
+            self.hass, max(deadline - time.monotonic(), 0), self._handle_expiry
+        )
 
-        Snapshots the previous expected state first so a failed command can
-        roll back to the last truthful value instead of wiping it.
+    @callback
+    def _handle_expiry(self, _now: datetime) -> None:
+        """Clear the state whose window closed and write the reverted state."""
+        self._unsub_expiry = None
+        self._expiry_at = None
+        changed = expire(self._state, time.monotonic())
+        self._schedule_expiry()
+        if changed:
+            self.async_write_ha_state()
+
+    def _device_hvac_mode(self) -> HVACMode:
+        """Return the HA mode of the device's 'mode' value."""
+        return DAIKIN_TO_HA_STATE.get(self.coordinator.data.mode, HVACMode.HEAT_COOL)
+
+    def _record_command(self, hvac_mode: HVACMode | None = None) -> None:
+        """Arm the any-command grace and, for mode commands, the expected state.
+
+        The expected state feeds the blueprint's safety-net detection.
         Called BEFORE _set() so the record survives mode:restart cancellation.
         """
-        self._expected_state_snapshot = (
-            self._expected_hvac_mode,
-            self._expected_set_time,
-        )
-        self._expected_hvac_mode = (
-            hvac_mode.value if isinstance(hvac_mode, HVACMode) else str(hvac_mode)
-        )
-        self._expected_set_time = time.time()
+        now = time.monotonic()
+        record_command(self._state, now)
+        if hvac_mode is not None:
+            record_expected(self._state, hvac_mode, now)
+            self._schedule_expiry()
+
+    def _validate_settings(self, settings: dict[str, Any]) -> None:
+        """Raise ServiceValidationError for a setting this unit cannot take."""
+        for attr in (ATTR_HVAC_MODE, ATTR_FAN_MODE, ATTR_SWING_MODE):
+            if (value := settings.get(attr)) is not None and value not in (
+                self._list[attr] or ()
+            ):
+                raise ServiceValidationError(
+                    f"Invalid {attr} value for {self.entity_id}: {value!r}"
+                )
+        if (temperature := settings.get(ATTR_TEMPERATURE)) is not None and not (
+            self.min_temp <= temperature <= self.max_temp
+        ):
+            raise ServiceValidationError(
+                f"Temperature {temperature} for {self.entity_id} is outside "
+                f"{self.min_temp}-{self.max_temp}"
+            )
 
     async def _set(self, settings: dict[str, Any]) -> None:
         """Set device settings using API."""
@@ -207,7 +388,11 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
 
             if (daikin_attr := HA_ATTR_TO_DAIKIN.get(attr)) is not None:
                 if attr == ATTR_HVAC_MODE:
-                    values[daikin_attr] = HA_STATE_TO_DAIKIN[value]
+                    if (daikin_mode := HA_STATE_TO_DAIKIN.get(value)) is None:
+                        raise ServiceValidationError(
+                            f"Invalid {attr} value: {value!r}"
+                        )
+                    values[daikin_attr] = daikin_mode
                 elif value in self._list[attr]:
                     # pydaikin human_to_daikin() reverse-map keys are lowercase
                     # (TRANSLATIONS values); device.fan_rate/swing_modes
@@ -228,25 +413,28 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
                     _LOGGER.error("Invalid temperature %s", value)
 
         if values:
-            # Store optimistic values for instant UI feedback
-            if ATTR_TEMPERATURE in settings:
+            # Store optimistic values for instant UI feedback, stamped for
+            # staleness detection
+            record_optimistic(
+                self._state,
+                time.monotonic(),
                 # Round to nearest 0.5 to match physical remote behavior
-                self._optimistic_target_temp = round(settings[ATTR_TEMPERATURE] * 2) / 2
-            if ATTR_HVAC_MODE in settings:
-                self._optimistic_hvac_mode = settings[ATTR_HVAC_MODE]
-            if ATTR_FAN_MODE in settings:
-                self._optimistic_fan_mode = settings[ATTR_FAN_MODE]
-            if ATTR_SWING_MODE in settings:
-                self._optimistic_swing_mode = settings[ATTR_SWING_MODE]
-
-            # Record timestamp for staleness detection
-            self._optimistic_set_time = time.time()
+                target_temp=(
+                    round(settings[ATTR_TEMPERATURE] * 2) / 2
+                    if ATTR_TEMPERATURE in settings
+                    else None
+                ),
+                hvac_mode=settings.get(ATTR_HVAC_MODE),
+                fan_mode=settings.get(ATTR_FAN_MODE),
+                swing_mode=settings.get(ATTR_SWING_MODE),
+            )
+            self._schedule_expiry()
 
             # Persistent expected state is recorded by the public handlers via
-            # _record_expected_state() BEFORE this method runs (survives
+            # _record_command() BEFORE this method runs (survives
             # mode:restart cancellation). No duplicate write here: it would
             # corrupt the rollback snapshot, and the old unconditional
-            # _expected_set_time refresh let fan/temp-only commands extend a
+            # expected_set_at refresh let fan/temp-only commands extend a
             # stale expected_hvac_mode past its 1h expiry.
 
             # Trigger immediate UI update
@@ -256,14 +444,16 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
             await asyncio.sleep(0)
 
             # v2.37.0: Track ANY command for mode-transition pow bounce suppression
-            self._last_any_command_time = time.time()
+            record_command(self._state, time.monotonic())
+            # Poll fast while the unit applies the command
+            self.coordinator.async_note_command()
 
             try:
                 # v2.32.0: SIMPLIFIED - Never pass expected_pow to pydaikin
                 # Physical remote detection is handled ONLY via coordinator polling in
                 # _handle_coordinator_update().
-                # DO NOT update _last_known_pow here — coordinator only.
-                # The 45s any-command grace (_last_any_command_time) is the
+                # DO NOT update last_known_power here — coordinator only.
+                # The 45s any-command grace (last_command_at) is the
                 # sole command protection window; the old 30s ON/OFF windows
                 # were unreachable under it and have been removed (v2.40.0).
 
@@ -285,7 +475,7 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
                 # legitimately outlive the 45s grace (60s wait_for, BRP084
                 # clipping retries) — the device's own pow flip would then land
                 # OUTSIDE the grace and fire a false override against our own
-                # command. The callback re-stamps _last_any_command_time when
+                # command. The callback re-stamps last_command_at when
                 # the command ACTUALLY completes (success, error, or cancel),
                 # so the grace is measured from completion. It also retrieves
                 # the orphaned task's exception, silencing asyncio's
@@ -294,13 +484,15 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
                 # Note: hass.async_create_task makes the set task
                 # HA-shutdown-cancellable (the old anonymous shield task was
                 # untracked); the callback's cancelled() branch handles that.
-                set_task = self.hass.async_create_task(
-                    self.device.set(values),
-                    name=f"daikin_set_{self.entity_id}",
-                )
+                # The task belongs to the command queue and may carry other
+                # commands merged with this one; it succeeds or fails for all
+                # of them, so each caller keeps its own rollback below.
+                set_task = self._command_queue.async_submit(values)
 
                 def _on_set_complete(task: asyncio.Task) -> None:
-                    self._last_any_command_time = time.time()
+                    record_command(self._state, time.monotonic())
+                    # pydaikin applied the command to device.values
+                    self.coordinator.async_refresh_data()
                     if task.cancelled():
                         _LOGGER.warning(
                             "device.set() cancelled before completion. entity=%s values=%s",
@@ -311,6 +503,10 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
                             "Shielded device.set() finished with error %r. entity=%s values=%s",
                             exc, self.entity_id, values
                         )
+                    elif task.result():
+                        # Confirm the new state in a second or two instead of
+                        # waiting for the next poll (shared by merged callers)
+                        self.coordinator.async_request_control_refresh()
 
                 set_task.add_done_callback(_on_set_complete)
 
@@ -364,26 +560,10 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
                 else:
                     _LOGGER.error("Error setting device values: %r", e, exc_info=True)
 
-                # Clear optimistic state on failure
-                self._optimistic_target_temp = None
-                self._optimistic_hvac_mode = None
-                self._optimistic_fan_mode = None
-                self._optimistic_swing_mode = None
-                self._optimistic_set_time = None
-                # v2.40.0: A failed MODE command rolls expected state back to
-                # the previous successful command's record (keeps the
-                # blueprint's expected-vs-actual safety net armed with
-                # truthful data). Failed fan/swing/temp-only commands never
-                # touched expected state, so nothing to do for them.
-                if (
-                    ATTR_HVAC_MODE in settings
-                    and self._expected_state_snapshot is not None
-                ):
-                    (
-                        self._expected_hvac_mode,
-                        self._expected_set_time,
-                    ) = self._expected_state_snapshot
-                    self._expected_state_snapshot = None
+                # Clear optimistic state on failure; a failed MODE command
+                # also rolls expected state back (v2.40.0)
+                command_failed(self._state, ATTR_HVAC_MODE in settings)
+                self._schedule_expiry()
                 self.async_write_ha_state()
                 raise
 
@@ -395,24 +575,29 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self.device.inside_temperature
+        return self.coordinator.data.inside_temperature
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
         # Return optimistic value if set, otherwise actual device value
-        if self._optimistic_target_temp is not None:
-            return self._optimistic_target_temp
-        return self.device.target_temperature
+        if (target := self._state.optimistic_target_temp) is not None:
+            return target
+        return self.coordinator.data.target_temperature
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
+        await self.async_set_settings(kwargs)
+
+    async def async_set_settings(self, settings: dict[str, Any]) -> None:
+        """Set any of temperature, HVAC, fan and swing mode in one write."""
+        # Rejected before anything is recorded: a command that never goes out
+        # must not arm the expected state
+        self._validate_settings(settings)
         # v2.37.1: Set command time BEFORE _set() to survive mode:restart cancellation
-        self._last_any_command_time = time.time()
-        # v2.39.0: Set expected state BEFORE _set() to survive mode:restart cancellation
-        if ATTR_HVAC_MODE in kwargs:
-            self._record_expected_state(kwargs[ATTR_HVAC_MODE])
-        await self._set(kwargs)
+        # v2.39.0: Same for the expected state
+        self._record_command(settings.get(ATTR_HVAC_MODE))
+        await self._set(settings)
 
     @property
     def hvac_action(self) -> HVACAction | None:
@@ -420,8 +605,7 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
         ret = HA_STATE_TO_CURRENT_HVAC.get(self.hvac_mode)
         if (
             ret in (HVACAction.COOLING, HVACAction.HEATING)
-            and self.device.support_compressor_frequency
-            and self.device.compressor_frequency == 0
+            and self.coordinator.data.compressor_frequency == 0
         ):
             return HVACAction.IDLE
         return ret
@@ -429,100 +613,57 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current operation ie. heat, cool, idle."""
-        power_state = self.device.values.get('pow', '1')
-
-        # Check optimistic value first for instant UI feedback
-        if self._optimistic_hvac_mode is not None:
-            # v2.34.0 FIX: If optimistic is OFF but device shows pow=1 (ON),
-            # only trust optimistic during the first 30s command window.
-            # After that, device pow=1 takes precedence (command may have failed
-            # or user turned AC back on via physical remote)
-            if self._optimistic_hvac_mode == HVACMode.OFF:
-                if power_state == '1':
-                    # Device is ON but we sent OFF - check if stale
-                    if self._optimistic_set_time is not None:
-                        age = time.time() - self._optimistic_set_time
-                        if age < 30:
-                            # Still within command processing window - trust optimistic OFF
-                            return HVACMode.OFF
-                    # Either no timestamp or >30s old - device is actually ON
-                    # Don't clear here - let _handle_coordinator_update do it
-                    # Return actual device state
-                    daikin_mode = self.device.represent(HA_ATTR_TO_DAIKIN[ATTR_HVAC_MODE])[1]
-                    return DAIKIN_TO_HA_STATE.get(daikin_mode, HVACMode.HEAT_COOL)
-                # Device is OFF (pow=0), optimistic OFF is correct
-                return HVACMode.OFF
-            # If optimistic is ON mode but device shows pow=0, check timing
-            # During command processing (first 30s), trust optimistic
-            # After that, device pow=0 takes precedence (physical remote override)
-            if power_state == '0':
-                if self._optimistic_set_time is not None:
-                    age = time.time() - self._optimistic_set_time
-                    if age < 30:
-                        # Still within command processing window - trust optimistic
-                        return self._optimistic_hvac_mode
-                # Either no timestamp or >30s old - device is actually off
-                # Don't clear here (side effect in property) - let _handle_coordinator_update do it
-                return HVACMode.OFF
-            # Device is on, return optimistic mode
-            return self._optimistic_hvac_mode
-
-        # No optimistic value - return actual device state
-        if power_state == '0':
-            return HVACMode.OFF
-
-        daikin_mode = self.device.represent(HA_ATTR_TO_DAIKIN[ATTR_HVAC_MODE])[1]
-        return DAIKIN_TO_HA_STATE.get(daikin_mode, HVACMode.HEAT_COOL)
+        # Optimistic value first for instant UI feedback, trusted over the
+        # device's pow only during the command window (v2.34.0)
+        return HVACMode(
+            displayed_hvac_mode(
+                self._state,
+                self.coordinator.data.power,
+                self._device_hvac_mode(),
+                time.monotonic(),
+            )
+        )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
-        self._last_any_command_time = time.time()
-        self._record_expected_state(hvac_mode)
+        self._record_command(hvac_mode)
         await self._set({ATTR_HVAC_MODE: hvac_mode})
 
     @property
     def fan_mode(self) -> str:
         """Return the fan setting."""
         # Return optimistic value if set, otherwise actual device value
-        if self._optimistic_fan_mode is not None:
-            return self._optimistic_fan_mode
-        return self.device.represent(HA_ATTR_TO_DAIKIN[ATTR_FAN_MODE])[1].title()
+        if (fan_mode := self._state.optimistic_fan_mode) is not None:
+            return fan_mode
+        return self.coordinator.data.fan_mode
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set fan mode."""
-        self._last_any_command_time = time.time()
+        self._record_command()
         await self._set({ATTR_FAN_MODE: fan_mode})
 
     @property
     def swing_mode(self) -> str:
         """Return the fan setting."""
         # Return optimistic value if set, otherwise actual device value
-        if self._optimistic_swing_mode is not None:
-            return self._optimistic_swing_mode
-        return self.device.represent(HA_ATTR_TO_DAIKIN[ATTR_SWING_MODE])[1].title()
+        if (swing_mode := self._state.optimistic_swing_mode) is not None:
+            return swing_mode
+        return self.coordinator.data.swing_mode
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
         """Set new target temperature."""
-        self._last_any_command_time = time.time()
+        self._record_command()
         await self._set({ATTR_SWING_MODE: swing_mode})
 
     @property
     def preset_mode(self) -> str:
         """Return the preset_mode."""
-        if (
-            self.device.represent(HA_ATTR_TO_DAIKIN[ATTR_PRESET_MODE])[1]
-            == HA_PRESET_TO_DAIKIN[PRESET_AWAY]
-        ):
+        data = self.coordinator.data
+        if data.holiday == HA_PRESET_TO_DAIKIN[PRESET_AWAY]:
             return PRESET_AWAY
-        if (
-            HA_PRESET_TO_DAIKIN[PRESET_BOOST]
-            in self.device.represent(DAIKIN_ATTR_ADVANCED)[1]
-        ):
+        if HA_PRESET_TO_DAIKIN[PRESET_BOOST] in data.advanced:
             return PRESET_BOOST
-        if (
-            HA_PRESET_TO_DAIKIN[PRESET_ECO]
-            in self.device.represent(DAIKIN_ATTR_ADVANCED)[1]
-        ):
+        if HA_PRESET_TO_DAIKIN[PRESET_ECO] in data.advanced:
             return PRESET_ECO
         return PRESET_NONE
 
@@ -531,28 +672,25 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
         # v2.40.0: Presets arm the 45s grace like every other command path —
         # away mode can change pow and powerful/econo can bounce reported
         # state, which previously fired false physical-remote overrides.
-        self._last_any_command_time = time.time()
+        device = self.device
+        if preset_mode == PRESET_AWAY:
+            key, args = "en_hol", (ATTR_STATE_ON,)
+        elif preset_mode in (PRESET_BOOST, PRESET_ECO):
+            key, args = "adv", (HA_PRESET_TO_DAIKIN[preset_mode], ATTR_STATE_ON)
+        elif (current := self.preset_mode) == PRESET_AWAY:
+            key, args = "en_hol", (ATTR_STATE_OFF,)
+        elif current in (PRESET_BOOST, PRESET_ECO):
+            key, args = "adv", (HA_PRESET_TO_DAIKIN[current], ATTR_STATE_OFF)
+        else:
+            # Already no preset: nothing to send
+            return
+        write = device.set_holiday if key == "en_hol" else device.set_advanced_mode
+        self._record_command()
+        self.coordinator.async_note_command()
         try:
-            if preset_mode == PRESET_AWAY:
-                await self.device.set_holiday(ATTR_STATE_ON)
-            elif preset_mode == PRESET_BOOST:
-                await self.device.set_advanced_mode(
-                    HA_PRESET_TO_DAIKIN[PRESET_BOOST], ATTR_STATE_ON
-                )
-            elif preset_mode == PRESET_ECO:
-                await self.device.set_advanced_mode(
-                    HA_PRESET_TO_DAIKIN[PRESET_ECO], ATTR_STATE_ON
-                )
-            elif self.preset_mode == PRESET_AWAY:
-                await self.device.set_holiday(ATTR_STATE_OFF)
-            elif self.preset_mode == PRESET_BOOST:
-                await self.device.set_advanced_mode(
-                    HA_PRESET_TO_DAIKIN[PRESET_BOOST], ATTR_STATE_OFF
-                )
-            elif self.preset_mode == PRESET_ECO:
-                await self.device.set_advanced_mode(
-                    HA_PRESET_TO_DAIKIN[PRESET_ECO], ATTR_STATE_OFF
-                )
+            # Timed and traced like the _set() writes
+            async with self.coordinator.async_track_write({key: " ".join(args)}):
+                await write(*args)
         except Exception as e:
             _LOGGER.error("Error setting preset mode %s: %s", preset_mode, e, exc_info=True)
             raise
@@ -560,7 +698,8 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
             # Re-stamp from completion so slow preset round-trips stay graced
             # (mirror of the _set() done-callback; these calls aren't shielded
             # so a finally suffices).
-            self._last_any_command_time = time.time()
+            record_command(self._state, time.monotonic())
+            self.coordinator.async_refresh_data()
 
     @property
     def preset_modes(self) -> list[str]:
@@ -581,227 +720,99 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
         Falls back to HEAT_COOL when no active mode was ever confirmed
         (e.g. first turn_on after HA restart with the unit off).
         """
-        self._last_any_command_time = time.time()
-        target_mode = self._last_active_hvac_mode or HVACMode.HEAT_COOL
-        self._record_expected_state(target_mode)
+        target_mode = self._state.last_active_hvac_mode or HVACMode.HEAT_COOL
+        self._record_command(target_mode)
         await self._set({ATTR_HVAC_MODE: target_mode})
 
     async def async_turn_off(self) -> None:
         """Turn device off."""
-        self._last_any_command_time = time.time()
-        self._record_expected_state(HVACMode.OFF)
+        self._record_command(HVACMode.OFF)
         await self._set({ATTR_HVAC_MODE: HVACMode.OFF})
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        # v2.36.0: Detect coordinator recovery (device reboot / network outage / power cut).
-        # Only apply grace if the device's pow value actually CHANGED across the outage —
-        # benign network blips where state didn't change shouldn't suppress real-remote
-        # detection that happens AFTER recovery.
-        coordinator_success = self.coordinator.last_update_success
-        if coordinator_success and not self._last_coordinator_success:
-            current_pow_at_recovery = self.device.values.get('pow', '1')
-            if self._last_known_pow != current_pow_at_recovery:
-                self._last_coordinator_recovery_time = time.time()
-                _LOGGER.info(
-                    "Coordinator recovered with pow change (%s -> %s) - applying 60s reconnect grace. entity=%s",
-                    self._last_known_pow, current_pow_at_recovery, self.entity_id
-                )
-            else:
-                _LOGGER.debug(
-                    "Coordinator recovered, pow unchanged (%s) - no grace needed. entity=%s",
-                    self._last_known_pow, self.entity_id
-                )
-        self._last_coordinator_success = coordinator_success
+        data = self.coordinator.data
+        state = self._state
+        command_state = state.command_state()
+        previous_pow = state.last_known_power
+        current_pow = data.power
+
+        # Decode only what the transitions compare against: the active mode
+        # while on, and the values an optimistic state is waiting for
+        active_mode = None
+        if current_pow == '1':
+            # v2.40.0: BRP069 auto variants normalize to 'auto' for turn_on
+            # restore; unmapped daikin modes are skipped (never stored wrong)
+            daikin_mode = data.mode
+            if daikin_mode in ('auto-1', 'auto-7'):
+                daikin_mode = 'auto'
+            active_mode = DAIKIN_TO_HA_STATE.get(daikin_mode)
+        reading = DeviceReading(
+            success=self.coordinator.last_update_success,
+            power=current_pow,
+            hvac_mode=(
+                self._device_hvac_mode() if current_pow == '1' else HVACMode.OFF
+            ),
+            active_mode=active_mode,
+            target_temperature=(
+                data.target_temperature
+                if state.optimistic_target_temp is not None
+                else None
+            ),
+            fan_mode=(
+                data.fan_mode
+                if state.optimistic_fan_mode is not None
+                else None
+            ),
+            swing_mode=(
+                data.swing_mode
+                if state.optimistic_swing_mode is not None
+                else None
+            ),
+        )
 
         # ===== PHYSICAL REMOTE OVERRIDE DETECTION =====
-        # Detect when AC turns OFF unexpectedly (user pressed remote)
+        # Detect when AC turns OFF/ON unexpectedly (user pressed remote)
         # Fire event so blueprint can set Override mode
-        current_pow = self.device.values.get('pow', '1')
-
-        # v2.36.0: Startup/reconnect grace period - silently sync _last_known_pow without
-        # firing override events. Prevents false positives from:
-        # - First 60s after entity init (HA startup, integration reload)
-        # - First 60s after coordinator reconnect with pow change (device reboot, network outage)
-        _init_age = time.time() - self._entity_init_timestamp
-        _recovery_age = (time.time() - self._last_coordinator_recovery_time) if self._last_coordinator_recovery_time else 9999
-        in_grace = _init_age < 60 or _recovery_age < 60
-        if in_grace:
-            if self._last_known_pow != current_pow:
-                _grace_reason = "startup" if _init_age < 60 else "reconnect"
-                _LOGGER.debug(
-                    "%s grace period (init=%.1fs, recovery=%.1fs): syncing _last_known_pow %s -> %s without detection. entity=%s",
-                    _grace_reason, _init_age, _recovery_age, self._last_known_pow, current_pow, self.entity_id
-                )
-                self._last_known_pow = current_pow
-            # Fall through to optimistic state handling below (skip override detection)
-        elif self._last_any_command_time and (time.time() - self._last_any_command_time) < 45:
-            # v2.37.0: Mode transition grace period — suppress override detection for 45s
-            # after ANY command. Daikin units bounce pow 1→0→1 during mode transitions
-            # (e.g., cool→fan_only), which looks like a physical remote press.
-            if self._last_known_pow != current_pow:
-                _LOGGER.debug(
-                    "Mode transition grace (%.1fs since last command): pow %s -> %s, suppressing detection. entity=%s",
-                    time.time() - self._last_any_command_time,
-                    self._last_known_pow, current_pow, self.entity_id
-                )
-                self._last_known_pow = current_pow
-        elif self._last_known_pow == '1' and current_pow == '0':
-            # AC was ON (coordinator-confirmed), now OFF, and no command was
-            # sent within the 45s grace — physical remote press.
-            # Debounce: skip if event was fired within last 5 seconds
-            # This prevents race condition if _set() and coordinator fire simultaneously
-            now = time.time()
-            should_fire = True
-
-            if self._last_override_event_time and (now - self._last_override_event_time) < 5:
-                _LOGGER.debug(
-                    "Skipping duplicate override event (debounce): last event %.1fs ago. entity=%s",
-                    now - self._last_override_event_time, self.entity_id
-                )
-                should_fire = False
-
-            if should_fire:
-                # AC was ON, now OFF - user turned it off via physical remote
-                _LOGGER.warning(
-                    "PHYSICAL REMOTE DETECTED: AC turned OFF unexpectedly. "
-                    "entity=%s, was_pow=%s, now_pow=%s",
-                    self.entity_id, self._last_known_pow, current_pow
-                )
-                # Fire event for blueprint to catch
-                self.hass.bus.async_fire(
-                    "daikin_physical_remote_override",
-                    {
-                        "entity_id": self.entity_id,
-                        # self.name is always None (_attr_name=None with
-                        # has_entity_name) — use the device-advertised name
-                        "device_name": self.device.values.get('name') or self.entity_id,
-                        "action": "turned_off",
-                    }
-                )
-                self._last_override_event_time = now
-
-        # Symmetric detection: AC turned ON unexpectedly (user turned on via physical remote)
-        elif self._last_known_pow == '0' and current_pow == '1':
-            # AC was OFF (coordinator-confirmed), now ON, and no command was
-            # sent within the 45s grace — physical remote press.
-            # Debounce: skip if event was fired within last 5 seconds
-            now = time.time()
-            should_fire = True
-            if self._last_override_event_time and (now - self._last_override_event_time) < 5:
-                _LOGGER.debug(
-                    "Skipping duplicate turn-ON override event (debounce): last event %.1fs ago. entity=%s",
-                    now - self._last_override_event_time, self.entity_id
-                )
-                should_fire = False
-
-            if should_fire:
-                # AC was OFF, now ON - user turned it on via physical remote
-                _LOGGER.warning(
-                    "PHYSICAL REMOTE DETECTED: AC turned ON unexpectedly. "
-                    "entity=%s, was_pow=%s, now_pow=%s",
-                    self.entity_id, self._last_known_pow, current_pow
-                )
-                # Fire event for blueprint to catch
-                self.hass.bus.async_fire(
-                    "daikin_physical_remote_override",
-                    {
-                        "entity_id": self.entity_id,
-                        "device_name": self.device.values.get('name') or self.entity_id,
-                        "action": "turned_on",
-                    }
-                )
-                self._last_override_event_time = now
-
-        # Update last known power state
-        self._last_known_pow = current_pow
-
-        # v2.40.0: Capture the coordinator-confirmed active mode for turn_on
-        # restore. BRP069 auto variants normalize to 'auto'; unmapped daikin
-        # modes are deliberately skipped (never stored wrong).
-        if current_pow == '1':
-            _daikin_mode = self.device.represent(HA_ATTR_TO_DAIKIN[ATTR_HVAC_MODE])[1]
-            if _daikin_mode in ('auto-1', 'auto-7'):
-                _daikin_mode = 'auto'
-            _ha_mode = DAIKIN_TO_HA_STATE.get(_daikin_mode)
-            if _ha_mode is not None and _ha_mode is not HVACMode.OFF:
-                self._last_active_hvac_mode = _ha_mode
-
-        # ===== END PHYSICAL REMOTE DETECTION =====
-
-        # v2.36.0: Clear stale persistent expected state (>1 hour old)
-        if self._expected_set_time is not None:
-            if (time.time() - self._expected_set_time) > 3600:
-                self._expected_hvac_mode = None
-                self._expected_set_time = None
-
-        # Check if optimistic values are stale (>30 seconds old)
-        # This prevents stuck optimistic state from manual changes or failed commands
-        optimistic_timeout = 30  # seconds
-        is_stale = False
-
-        if self._optimistic_set_time is not None:
-            age = time.time() - self._optimistic_set_time
-            is_stale = age > optimistic_timeout
-            if is_stale:
-                _LOGGER.debug(
-                    "Optimistic state is stale (%.1fs old), clearing unconditionally",
-                    age
-                )
-
-        # Clear optimistic values if they match device state OR are stale
-        if self._optimistic_target_temp is not None:
-            if is_stale or (self.device.target_temperature is not None and abs(self.device.target_temperature - self._optimistic_target_temp) < 0.1):
-                self._optimistic_target_temp = None
-
-        if self._optimistic_hvac_mode is not None:
-            power_state = self.device.values.get('pow', '1')
-            # If device is OFF and optimistic was an ON mode, clear it (stale after timeout)
-            if power_state == '0' and self._optimistic_hvac_mode != HVACMode.OFF:
-                if is_stale:
-                    self._optimistic_hvac_mode = None
-            # v2.34.0 FIX: If device is ON but optimistic was OFF, clear it if stale
-            # This handles the case where OFF command failed or user turned AC back on
-            elif power_state == '1' and self._optimistic_hvac_mode == HVACMode.OFF:
-                if is_stale:
-                    _LOGGER.debug(
-                        "Clearing stale optimistic OFF - device is ON (pow=1). entity=%s",
-                        self.entity_id
-                    )
-                    self._optimistic_hvac_mode = None
-            else:
-                # Device is ON or optimistic is OFF - normal comparison
-                daikin_mode = self.device.represent(HA_ATTR_TO_DAIKIN[ATTR_HVAC_MODE])[1]
-                actual_mode = DAIKIN_TO_HA_STATE.get(daikin_mode, HVACMode.HEAT_COOL)
-                # Also treat OFF state match: if device pow=0 and optimistic=OFF, clear it
-                if power_state == '0' and self._optimistic_hvac_mode == HVACMode.OFF:
-                    self._optimistic_hvac_mode = None
-                elif is_stale or actual_mode == self._optimistic_hvac_mode:
-                    self._optimistic_hvac_mode = None
-
-        if self._optimistic_fan_mode is not None:
-            actual_fan = self.device.represent(HA_ATTR_TO_DAIKIN[ATTR_FAN_MODE])[1].title()
-            if is_stale or actual_fan == self._optimistic_fan_mode:
-                self._optimistic_fan_mode = None
-
-        if self._optimistic_swing_mode is not None:
-            actual_swing = self.device.represent(HA_ATTR_TO_DAIKIN[ATTR_SWING_MODE])[1].title()
-            if is_stale or actual_swing == self._optimistic_swing_mode:
-                self._optimistic_swing_mode = None
-
-        # Clear timestamp if all optimistic values are gone
-        if (
-            self._optimistic_target_temp is None
-            and self._optimistic_hvac_mode is None
-            and self._optimistic_fan_mode is None
-            and self._optimistic_swing_mode is None
-        ):
-            self._optimistic_set_time = None
+        if (action := observe(state, reading, time.monotonic(), self.entity_id)):
+            _LOGGER.warning(
+                "PHYSICAL REMOTE DETECTED: AC %s unexpectedly. "
+                "entity=%s, was_pow=%s, now_pow=%s",
+                action.replace('_', ' '), self.entity_id, previous_pow, current_pow
+            )
+            # Fire event for blueprint to catch
+            self.hass.bus.async_fire(
+                "daikin_physical_remote_override",
+                {
+                    "entity_id": self.entity_id,
+                    # self.name is always None (_attr_name=None with
+                    # has_entity_name) — use the device-advertised name
+                    "device_name": data.name or self.entity_id,
+                    "action": action,
+                }
+            )
 
-        super()._handle_coordinator_update()
+        # Clearing optimistic or expected state changes what is shown even
+        # when the poll changed none of the device values
+        if (changed := state.command_state() != command_state):
+            self._schedule_expiry()
+        self._async_write_state_if_changed(force=changed)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
+        """Return extra state attributes, rebuilt only when their inputs change.
+
+        They only move when a command is sent or optimistic/expected state is
+        cleared; caching saves rebuilding the dict and formatting its
+        timestamp on every state write. Home Assistant still copies and
+        compares the attributes on each write.
+        """
+        if (inputs := self._state.command_state()) != self._attributes_inputs:
+            self._attributes_inputs = inputs
+            self._attributes = self._build_extra_state_attributes()
+        return self._attributes
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes for blueprint override detection.
 
         These attributes allow the Ultimate Climate Control blueprint to detect
@@ -812,31 +823,31 @@ class DaikinClimate(DaikinEntity, ClimateEntity):
         # Optimistic clears after 30s, but persistent expected stays for up to 1 hour,
         # keeping blueprint override detection active well after last command.
 
+        state = self._state
         # Expected HVAC mode: persistent first, then optimistic fallback
-        expected_hvac = self._expected_hvac_mode
-        if expected_hvac is None and self._optimistic_hvac_mode is not None:
+        expected_hvac = state.expected_hvac_mode
+        if expected_hvac is None and state.optimistic_hvac_mode is not None:
             expected_hvac = getattr(
-                self._optimistic_hvac_mode, 'value', str(self._optimistic_hvac_mode)
+                state.optimistic_hvac_mode, 'value', str(state.optimistic_hvac_mode)
             )
 
-        # Last command time: persistent first, then optimistic fallback
+        # Last command time: persistent first, then optimistic fallback.
+        # Stamps are monotonic; shift them onto the wall clock for display.
         last_cmd_time = None
-        if self._expected_set_time is not None:
-            last_cmd_time = dt_util.utc_from_timestamp(self._expected_set_time).isoformat()
-        elif self._optimistic_set_time is not None:
-            last_cmd_time = dt_util.utc_from_timestamp(self._optimistic_set_time).isoformat()
-
-        # Get entity init time for startup grace period
-        entity_init_time = None
-        if hasattr(self, '_entity_init_time'):
-            entity_init_time = self._entity_init_time
+        set_at = state.expected_set_at
+        if set_at is None:
+            set_at = state.optimistic_set_at
+        if set_at is not None:
+            last_cmd_time = dt_util.utc_from_timestamp(
+                time.time() - (time.monotonic() - set_at)
+            ).isoformat()
 
         return {
             "expected_hvac_mode": expected_hvac,
-            "expected_temperature": self._optimistic_target_temp,
-            "expected_fan_mode": self._optimistic_fan_mode,
-            "expected_swing_mode": self._optimistic_swing_mode,
+            "expected_temperature": state.optimistic_target_temp,
+            "expected_fan_mode": state.optimistic_fan_mode,
+            "expected_swing_mode": state.optimistic_swing_mode,
             "last_command_time": last_cmd_time,
-            "entity_init_time": entity_init_time,
+            "entity_init_time": self._entity_init_time,
             "device_type": type(self.device).__name__,
         }
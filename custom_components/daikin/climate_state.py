@@ -0,0 +1,362 @@
+"""Optimistic, expected and override-detection state of a Daikin climate entity.
+
+Kept free of Home Assistant so the transitions can be tested, benchmarked
+and fuzzed on their own. Every timestamp is time.monotonic(): wall-clock
+jumps (NTP, DST fixes) must not stretch or collapse the windows. Each
+transition takes the current time as `now` and never reads a clock itself.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Any, NamedTuple
+
+from .const import (
+    COMMAND_GRACE_PERIOD,
+    EXPECTED_STATE_TIMEOUT,
+    OPTIMISTIC_TIMEOUT,
+    OVERRIDE_EVENT_DEBOUNCE,
+    STARTUP_GRACE_PERIOD,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# HA climate mode strings (HVACMode is a StrEnum, so these compare equal)
+MODE_OFF = "off"
+
+OVERRIDE_TURNED_OFF = "turned_off"
+OVERRIDE_TURNED_ON = "turned_on"
+
+
+class DeviceReading(NamedTuple):
+    """What the coordinator reported, as the climate entity shows it."""
+
+    # Whether the last coordinator update succeeded
+    success: bool
+    # 'pow' value: '1' on, '0' off
+    power: str
+    # HA mode shown for the device's 'mode' value
+    hvac_mode: str
+    # HA mode to restore on turn_on; None when 'mode' has no HA equivalent
+    active_mode: str | None
+    # Device values an optimistic value is waiting for; None (not compared)
+    # while no optimistic value of that kind is pending, so the caller need
+    # not decode them
+    target_temperature: float | None
+    fan_mode: str | None
+    swing_mode: str | None
+
+
+@dataclass(slots=True)
+class DaikinClimateState:
+    """Everything a climate entity remembers between coordinator updates."""
+
+    # Monotonic time the entity was created (startup grace)
+    init_at: float
+    # Last coordinator-confirmed 'pow' value
+    last_known_power: str
+    last_coordinator_success: bool
+
+    # Values shown right after a command, until the device confirms them
+    optimistic_target_temp: float | None = None
+    optimistic_hvac_mode: str | None = None
+    optimistic_fan_mode: str | None = None
+    optimistic_swing_mode: str | None = None
+    optimistic_set_at: float | None = None
+
+    # v2.36.0: Persistent expected state for blueprint override detection.
+    # Unlike optimistic state (clears after 30s), this persists for up to
+    # 1 hour so the blueprint can detect manual overrides well after the
+    # last command.
+    expected_hvac_mode: str | None = None
+    expected_set_at: float | None = None
+    # v2.40.0: Expected state from before the in-flight command, restored if
+    # that command fails (a failed command must not blind the blueprint's
+    # expected-vs-actual safety net).
+    expected_snapshot: tuple[str | None, float | None] | None = None
+
+    # v2.37.0: Last time ANY command was sent, to suppress false overrides
+    # during mode transitions where Daikin bounces pow 1→0→1
+    last_command_at: float | None = None
+    # Last coordinator recovery that changed pow (reconnect grace)
+    recovery_at: float | None = None
+    # Debounce: prevent duplicate override events from race conditions
+    last_override_event_at: float | None = None
+    # v2.40.0: Last coordinator-CONFIRMED active (non-off) HVAC mode, used by
+    # turn_on to restore the pre-off mode
+    last_active_hvac_mode: str | None = None
+
+    def command_state(self) -> tuple[Any, ...]:
+        """Return the optimistic and expected state the entity's state reads."""
+        return (
+            self.optimistic_target_temp,
+            self.optimistic_hvac_mode,
+            self.optimistic_fan_mode,
+            self.optimistic_swing_mode,
+            self.optimistic_set_at,
+            self.expected_hvac_mode,
+            self.expected_set_at,
+        )
+
+
+def record_command(state: DaikinClimateState, now: float) -> None:
+    """Open (or extend) the any-command grace window."""
+    state.last_command_at = now
+
+
+def record_expected(state: DaikinClimateState, hvac_mode: str, now: float) -> None:
+    """Record the mode a command is about to set.
+
+    Snapshots the previous expected state first so a failed command can roll
+    back to the last truthful value instead of wiping it.
+    """
+    state.expected_snapshot = (state.expected_hvac_mode, state.expected_set_at)
+    state.expected_hvac_mode = str(hvac_mode)
+    state.expected_set_at = now
+
+
+def record_optimistic(
+    state: DaikinClimateState,
+    now: float,
+    *,
+    target_temp: float | None = None,
+    hvac_mode: str | None = None,
+    fan_mode: str | None = None,
+    swing_mode: str | None = None,
+) -> None:
+    """Show the values of a command before the device confirms them."""
+    if target_temp is not None:
+        state.optimistic_target_temp = target_temp
+    if hvac_mode is not None:
+        state.optimistic_hvac_mode = hvac_mode
+    if fan_mode is not None:
+        state.optimistic_fan_mode = fan_mode
+    if swing_mode is not None:
+        state.optimistic_swing_mode = swing_mode
+    state.optimistic_set_at = now
+
+
+def command_failed(state: DaikinClimateState, mode_command: bool) -> None:
+    """Drop the optimistic state of a failed command.
+
+    v2.40.0: A failed MODE command rolls expected state back to the previous
+    successful command's record. Failed fan/swing/temp-only commands never
+    touched expected state, so nothing to do for them.
+    """
+    _clear_optimistic(state)
+    if mode_command and state.expected_snapshot is not None:
+        state.expected_hvac_mode, state.expected_set_at = state.expected_snapshot
+        state.expected_snapshot = None
+
+
+def _clear_optimistic(state: DaikinClimateState) -> None:
+    """Forget every optimistic value."""
+    state.optimistic_target_temp = None
+    state.optimistic_hvac_mode = None
+    state.optimistic_fan_mode = None
+    state.optimistic_swing_mode = None
+    state.optimistic_set_at = None
+
+
+def _optimistic_fresh(state: DaikinClimateState, now: float) -> bool:
+    """Return whether the optimistic values are inside their window."""
+    return (
+        state.optimistic_set_at is not None
+        and now - state.optimistic_set_at < OPTIMISTIC_TIMEOUT
+    )
+
+
+def displayed_hvac_mode(
+    state: DaikinClimateState, power: str, device_mode: str, now: float
+) -> str:
+    """Return the mode to show, given the device's power and (powered) mode."""
+    optimistic = state.optimistic_hvac_mode
+    if optimistic is None:
+        return MODE_OFF if power == "0" else device_mode
+    if optimistic == MODE_OFF:
+        # v2.34.0: device still ON after we sent OFF — trust the optimistic
+        # OFF only during the command window; after that the device wins
+        # (command failed, or the unit was turned back on by remote)
+        if power == "1" and not _optimistic_fresh(state, now):
+            return device_mode
+        return MODE_OFF
+    if power == "0" and not _optimistic_fresh(state, now):
+        # Sent an ON mode but the device is still off past the window
+        return MODE_OFF
+    return optimistic
+
+
+def expire(state: DaikinClimateState, now: float) -> bool:
+    """Clear optimistic and expected state whose window has closed.
+
+    A window closes at exactly set_at + timeout, the deadline next_expiry()
+    reports. Returns whether anything was cleared.
+    """
+    changed = False
+    if (
+        state.expected_set_at is not None
+        and now - state.expected_set_at >= EXPECTED_STATE_TIMEOUT
+    ):
+        state.expected_hvac_mode = None
+        state.expected_set_at = None
+        changed = True
+    if (
+        state.optimistic_set_at is not None
+        and now - state.optimistic_set_at >= OPTIMISTIC_TIMEOUT
+    ):
+        _LOGGER.debug(
+            "Optimistic state is stale (%.1fs old), clearing unconditionally",
+            now - state.optimistic_set_at,
+        )
+        _clear_optimistic(state)
+        changed = True
+    return changed
+
+
+def next_expiry(state: DaikinClimateState) -> float | None:
+    """Return when the next optimistic or expected window closes, if any."""
+    deadlines = [
+        set_at + timeout
+        for set_at, timeout in (
+            (state.optimistic_set_at, OPTIMISTIC_TIMEOUT),
+            (state.expected_set_at, EXPECTED_STATE_TIMEOUT),
+        )
+        if set_at is not None
+    ]
+    return min(deadlines, default=None)
+
+
+def observe(
+    state: DaikinClimateState, reading: DeviceReading, now: float, name: str
+) -> str | None:
+    """Apply a coordinator update; return the override to report, if any.
+
+    Detects physical-remote power changes outside the grace windows, tracks
+    the last confirmed active mode and clears optimistic values the device
+    has confirmed (or that went stale). `name` is only used for logging.
+    """
+    # v2.36.0: Detect coordinator recovery (device reboot / network outage /
+    # power cut). Only apply grace if the device's pow value actually CHANGED
+    # across the outage — benign network blips where state didn't change
+    # shouldn't suppress real-remote detection that happens AFTER recovery.
+    power = reading.power
+    if reading.success and not state.last_coordinator_success:
+        if state.last_known_power != power:
+            state.recovery_at = now
+            _LOGGER.info(
+                "Coordinator recovered with pow change (%s -> %s) - applying "
+                "%ds reconnect grace. entity=%s",
+                state.last_known_power, power, STARTUP_GRACE_PERIOD, name,
+            )
+        else:
+            _LOGGER.debug(
+                "Coordinator recovered, pow unchanged (%s) - no grace needed. entity=%s",
+                state.last_known_power, name,
+            )
+    state.last_coordinator_success = reading.success
+
+    override = _detect_override(state, power, now, name)
+    state.last_known_power = power
+
+    # v2.40.0: Capture the coordinator-confirmed active mode for turn_on
+    # restore. Unmapped daikin modes are deliberately skipped (never stored
+    # wrong).
+    if power == "1" and reading.active_mode not in (None, MODE_OFF):
+        state.last_active_hvac_mode = reading.active_mode
+
+    expire(state, now)
+    _confirm_optimistic(state, reading, name)
+    return override
+
+
+def _detect_override(
+    state: DaikinClimateState, power: str, now: float, name: str
+) -> str | None:
+    """Return the physical-remote override a pow change means, if any."""
+    previous = state.last_known_power
+    if previous == power:
+        return None
+    # v2.36.0: Startup/reconnect grace - sync pow silently for the first
+    # minute after entity init (HA startup, integration reload) or after a
+    # reconnect with a pow change (device reboot, network outage).
+    init_age = now - state.init_at
+    recovery_age = None if state.recovery_at is None else now - state.recovery_at
+    if init_age < STARTUP_GRACE_PERIOD or (
+        recovery_age is not None and recovery_age < STARTUP_GRACE_PERIOD
+    ):
+        _LOGGER.debug(
+            "%s grace period: syncing pow %s -> %s without detection. entity=%s",
+            "startup" if init_age < STARTUP_GRACE_PERIOD else "reconnect",
+            previous, power, name,
+        )
+        return None
+    # v2.37.0: Mode transition grace — Daikin units bounce pow 1→0→1 during
+    # mode transitions (e.g. cool→fan_only), which looks like a remote press.
+    if (
+        state.last_command_at is not None
+        and now - state.last_command_at < COMMAND_GRACE_PERIOD
+    ):
+        _LOGGER.debug(
+            "Mode transition grace (%.1fs since last command): pow %s -> %s, "
+            "suppressing detection. entity=%s",
+            now - state.last_command_at, previous, power, name,
+        )
+        return None
+    # Debounce: a _set() racing the coordinator must not fire twice
+    if (
+        state.last_override_event_at is not None
+        and now - state.last_override_event_at < OVERRIDE_EVENT_DEBOUNCE
+    ):
+        _LOGGER.debug(
+            "Skipping duplicate override event (debounce): last event %.1fs ago. entity=%s",
+            now - state.last_override_event_at, name,
+        )
+        return None
+    if previous == "1" and power == "0":
+        override = OVERRIDE_TURNED_OFF
+    elif previous == "0" and power == "1":
+        override = OVERRIDE_TURNED_ON
+    else:
+        return None
+    state.last_override_event_at = now
+    return override
+
+
+def _confirm_optimistic(
+    state: DaikinClimateState, reading: DeviceReading, name: str
+) -> None:
+    """Clear the optimistic values the device now reports itself."""
+    if state.optimistic_target_temp is not None and (
+        reading.target_temperature is not None
+        and abs(reading.target_temperature - state.optimistic_target_temp) < 0.1
+    ):
+        state.optimistic_target_temp = None
+
+    optimistic_mode = state.optimistic_hvac_mode
+    if optimistic_mode is not None:
+        if reading.power == "0":
+            # An ON mode the device does not show yet stays until it goes stale
+            if optimistic_mode == MODE_OFF:
+                state.optimistic_hvac_mode = None
+        elif optimistic_mode != MODE_OFF and reading.hvac_mode == optimistic_mode:
+            state.optimistic_hvac_mode = None
+
+    if (
+        state.optimistic_fan_mode is not None
+        and reading.fan_mode == state.optimistic_fan_mode
+    ):
+        state.optimistic_fan_mode = None
+    if (
+        state.optimistic_swing_mode is not None
+        and reading.swing_mode == state.optimistic_swing_mode
+    ):
+        state.optimistic_swing_mode = None
+
+    if (
+        state.optimistic_target_temp is None
+        and state.optimistic_hvac_mode is None
+        and state.optimistic_fan_mode is None
+        and state.optimistic_swing_mode is None
+    ):
+        state.optimistic_set_at = None
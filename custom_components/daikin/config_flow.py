@@ -5,44 +5,49 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Mapping
 import logging
-import ssl
 from typing import Any
 from uuid import uuid4
 
 from aiohttp import ClientError, web_exceptions
 from pydaikin.daikin_base import Appliance
-from pydaikin.discovery import Discovery
 from pydaikin.exceptions import DaikinException
 from pydaikin.factory import DaikinFactory
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_API_KEY, CONF_HOST, CONF_PASSWORD, CONF_UUID
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import format_mac
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
-from .const import DOMAIN, KEY_MAC, TIMEOUT
+from .const import (
+    CONF_FILTER_SENSOR_UPDATES,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_SENSOR_HEARTBEAT,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_SKIP_REDUNDANT_WRITES,
+    DEFAULT_FILTER_SENSOR_UPDATES,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_SKIP_REDUNDANT_WRITES,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    KEY_MAC,
+    MAX_UPDATE_INTERVAL_LIMIT,
+    SENSOR_HEARTBEAT_LIMIT,
+    TIMEOUT,
+)
+from .discovery import async_get_discovery
+from .ssl_context import async_get_daikin_ssl_context
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def get_daikin_ssl_context() -> ssl.SSLContext:
-    """Create SSL context with legacy Daikin support."""
-    ssl_context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    # SSL_OP_LEGACY_SERVER_CONNECT — BRP072C legacy firmware needs legacy renegotiation
-    ssl_context.options |= 0x4
-    # Lower security level to allow legacy Daikin SSL/TLS configurations
-    # Fixes HA 2025.10 SSL WRONG_SIGNATURE_TYPE error
-    try:
-        ssl_context.set_ciphers('DEFAULT:@SECLEVEL=0')
-    except ssl.SSLError:
-        pass  # Fallback for systems that don't support SECLEVEL
-    return ssl_context
-
-
 class FlowHandler(ConfigFlow, domain=DOMAIN):
     """Handle a config flow."""
 
@@ -52,6 +57,12 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
         """Initialize the Daikin config flow."""
         self.host: str | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> DaikinOptionsFlow:
+        """Return the options flow for this handler."""
+        return DaikinOptionsFlow()
+
     @property
     def schema(self) -> vol.Schema:
         """Return current schema."""
@@ -115,8 +126,7 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
         if not password:
             password = None
 
-        # Build the SSL context in the executor — loading certs is blocking I/O
-        ssl_context = await self.hass.async_add_executor_job(get_daikin_ssl_context)
+        ssl_context = await async_get_daikin_ssl_context(self.hass)
         try:
             async with asyncio.timeout(TIMEOUT):
                 device: Appliance = await DaikinFactory(
@@ -210,8 +220,7 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
         password = user_input.get(CONF_PASSWORD) or None
         uuid = str(uuid4()) if key else None
 
-        # Build the SSL context in the executor — loading certs is blocking I/O
-        ssl_context = await self.hass.async_add_executor_job(get_daikin_ssl_context)
+        ssl_context = await async_get_daikin_ssl_context(self.hass)
         try:
             async with asyncio.timeout(TIMEOUT):
                 device: Appliance = await DaikinFactory(
@@ -277,10 +286,7 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
             password = user_input.get(CONF_PASSWORD) or None
             uuid = str(uuid4()) if key else None
 
-            # Build the SSL context in the executor — loading certs is blocking I/O
-            ssl_context = await self.hass.async_add_executor_job(
-                get_daikin_ssl_context
-            )
+            ssl_context = await async_get_daikin_ssl_context(self.hass)
             try:
                 async with asyncio.timeout(TIMEOUT):
                     device: Appliance = await DaikinFactory(
@@ -326,28 +332,16 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
         """Prepare configuration for a discovered Daikin device."""
         _LOGGER.debug("Zeroconf user_input: %s", discovery_info)
 
-        def _discover() -> list[dict]:
-            """Run UDP discovery off the event loop.
-
-            Both the Discovery() constructor (socket bind, can raise OSError if
-            UDP 30000 is taken) and poll() (~1s of blocking recv) block, so the
-            whole closure runs in the executor. The socket is closed afterwards
-            — pydaikin's Discovery never closes it (fd leak / busy-port risk).
-            """
-            discovery = Discovery()
-            try:
-                return list(discovery.poll(ip=discovery_info.host))
-            finally:
-                discovery.sock.close()
-
         try:
-            devices = await self.hass.async_add_executor_job(_discover)
+            mac = await async_get_discovery(self.hass).async_get_mac(
+                discovery_info.host
+            )
         except OSError as err:
             _LOGGER.debug(
                 "UDP discovery failed for %s: %s", discovery_info.host, err
             )
             return self.async_abort(reason="cannot_connect")
-        if not devices:
+        if mac is None:
             _LOGGER.debug(
                 (
                     "Could not find MAC-address for %s, make sure the required UDP"
@@ -356,7 +350,50 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
                 discovery_info.host,
             )
             return self.async_abort(reason="cannot_connect")
-        await self.async_set_unique_id(devices[0][KEY_MAC])
+        await self.async_set_unique_id(mac)
         self._abort_if_unique_id_configured()
         self.host = discovery_info.host
         return await self.async_step_user()
+
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_MAX_UPDATE_INTERVAL, default=DEFAULT_MAX_UPDATE_INTERVAL
+        ): vol.All(
+            vol.Coerce(int),
+            vol.Range(min=DEFAULT_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL_LIMIT),
+        ),
+        vol.Required(
+            CONF_SKIP_REDUNDANT_WRITES, default=DEFAULT_SKIP_REDUNDANT_WRITES
+        ): bool,
+        vol.Required(
+            CONF_FILTER_SENSOR_UPDATES, default=DEFAULT_FILTER_SENSOR_UPDATES
+        ): bool,
+        # Left empty: each sensor's own default
+        vol.Optional(CONF_SENSOR_MIN_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=SENSOR_HEARTBEAT_LIMIT)
+        ),
+        vol.Optional(CONF_SENSOR_HEARTBEAT): vol.All(
+            vol.Coerce(int),
+            vol.Range(min=DEFAULT_UPDATE_INTERVAL, max=SENSOR_HEARTBEAT_LIMIT),
+        ),
+    }
+)
+
+
+class DaikinOptionsFlow(OptionsFlow):
+    """Handle Daikin options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the polling, write and sensor publishing options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
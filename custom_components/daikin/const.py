@@ -18,14 +18,47 @@ ATTR_HEAT_ENERGY = "heat_energy"
 ATTR_TOTAL_POWER = "total_power"
 ATTR_TOTAL_ENERGY_TODAY = "total_energy_today"
 
+ATTR_POLL_INTERVAL = "poll_interval"
+ATTR_POLL_INTERVAL_REASON = "poll_interval_reason"
+ATTR_POLL_LATENCY = "poll_latency"
+ATTR_MERGED_COMMANDS = "merged_commands"
+ATTR_SKIPPED_WRITES = "skipped_writes"
+ATTR_POLL_LATENCY_P50 = "poll_latency_p50"
+ATTR_POLL_LATENCY_P95 = "poll_latency_p95"
+ATTR_POLL_LATENCY_P99 = "poll_latency_p99"
+ATTR_TIMEOUT_RATE = "timeout_rate"
+ATTR_LAST_ERROR = "last_error"
+
 ATTR_STATE_ON = "on"
 ATTR_STATE_OFF = "off"
 
 KEY_MAC = "mac"
 KEY_IP = "ip"
 
+# daikin.bulk_set: set many units at once, a bounded number in parallel
+SERVICE_BULK_SET = "bulk_set"
+ATTR_MAX_PARALLEL = "max_parallel"
+ATTR_DEVICE_TIMEOUT = "device_timeout"
+DEFAULT_BULK_MAX_PARALLEL = 8
+DEFAULT_BULK_DEVICE_TIMEOUT = 30
+
 TIMEOUT = 60
 
+# Zeroconf MAC lookup over UDP (seconds): lookups queued within the batch
+# window share one send, each waits DISCOVERY_TIMEOUT for the reply (as long
+# as pydaikin's Discovery does), and replies are reused for DISCOVERY_CACHE_TTL
+DISCOVERY_BATCH_WINDOW = 0.1
+DISCOVERY_TIMEOUT = 1
+DISCOVERY_CACHE_TTL = 60
+
+# Fast start: entries with a stored snapshot are set up without waiting for the
+# device. The DaikinFactory handshake then runs in the background, starting
+# with this timeout (seconds) and doubling it per failed attempt up to TIMEOUT.
+FAST_START_TIMEOUT = 5
+
+# Minimum time (seconds) between two writes of a device's stored snapshot
+SNAPSHOT_SAVE_DELAY = 300
+
 # Overall ceiling for one coordinator poll (seconds).
 # 90s: above pydaikin's worst-case tenacity budget (3x20s + backoff ~= 62s) and
 # above 4 serialized 20s requests on MAX_CONCURRENT_REQUESTS=1 BRP069 devices
@@ -35,5 +68,94 @@ COORDINATOR_UPDATE_TIMEOUT = 90
 
 # Default polling interval for state updates (seconds)
 # Reduced to 10s for better responsiveness to manual remote changes
-# Can be overridden via options flow in the future
+# This is the base of the adaptive scheduler below, not a fixed rate
 DEFAULT_UPDATE_INTERVAL = 10
+
+# Adaptive polling (seconds).
+# After a command or a detected pow change the coordinator polls every
+# FAST_UPDATE_INTERVAL for FAST_POLL_WINDOW, then returns to
+# DEFAULT_UPDATE_INTERVAL and doubles the interval on every poll that shows no
+# control-state change, up to the configurable ceiling. Sensor drift (htemp,
+# otemp, cmpfreq) does not count as a change — it never stops on a running unit.
+FAST_UPDATE_INTERVAL = 5
+FAST_POLL_WINDOW = 60
+UPDATE_INTERVAL_BACKOFF_FACTOR = 2
+DEFAULT_MAX_UPDATE_INTERVAL = 120
+MAX_UPDATE_INTERVAL_LIMIT = 900
+
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+
+# Energy counters (day/week power) are fetched at most this often (seconds),
+# and only while an entity reading them is enabled. The adapters count energy
+# in 100 Wh steps, so polling them every few seconds buys nothing; on
+# single-request adapters (BRP069) they are half of every poll's round trips.
+ENERGY_UPDATE_INTERVAL = 180
+
+# Hourly energy history import into long-term statistics: every hour at this
+# minute (the adapters close an hour a few minutes late), and once this many
+# seconds after setup to backfill what was missed while HA was down
+ENERGY_IMPORT_MINUTE = 10
+ENERGY_IMPORT_STARTUP_DELAY = 60
+
+# Commands sent within this window (seconds) are merged into one device.set()
+COMMAND_MERGE_WINDOW = 0.3
+
+# Climate command windows (seconds)
+# Optimistic values are shown for at most this long without confirmation
+OPTIMISTIC_TIMEOUT = 30
+# Expected state stays available to the blueprint for this long
+EXPECTED_STATE_TIMEOUT = 3600
+# No override detection this long after any command (pow bounces 1→0→1
+# while the unit changes mode)
+COMMAND_GRACE_PERIOD = 45
+# No override detection this long after startup or a reconnect with pow change
+STARTUP_GRACE_PERIOD = 60
+# Minimum gap between two override events of one entity
+OVERRIDE_EVENT_DEBOUNCE = 5
+
+# Drop payload keys that already match the last poll before writing
+CONF_SKIP_REDUNDANT_WRITES = "skip_redundant_writes"
+DEFAULT_SKIP_REDUNDANT_WRITES = True
+
+# High-churn sensors (temperatures, humidity, compressor frequency, power)
+# publish through per-sensor deadband / minimum interval / heartbeat policies.
+# Options turn them off or override every sensor's interval and heartbeat
+# (seconds; unset = the sensor's own default).
+CONF_FILTER_SENSOR_UPDATES = "filter_sensor_updates"
+DEFAULT_FILTER_SENSOR_UPDATES = True
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+CONF_SENSOR_HEARTBEAT = "sensor_heartbeat"
+SENSOR_HEARTBEAT_LIMIT = 3600
+
+# Number of recent polls and writes kept per device for latency statistics
+# (about 15 minutes of polling at the default interval)
+LATENCY_SAMPLES = 100
+
+# Number of recent polls and writes kept per device for the diagnostics trace
+TRACE_SIZE = 50
+
+# Domain-wide cap on polls in flight at once, across all config entries.
+# Protects the event loop and shared Wi-Fi APs when many units poll together.
+MAX_CONCURRENT_POLLS = 4
+
+# How long (seconds) a poll may hold one of those slots. A reachable adapter
+# answers in well under a second per request; an unreachable one would
+# otherwise keep the slot for pydaikin's whole retry budget. A unit whose last
+# poll failed polls outside the shared slots, with the full
+# COORDINATOR_UPDATE_TIMEOUT, at most MAX_CONCURRENT_FAILING_POLLS at a time.
+POLL_SLOT_TIMEOUT = 20
+MAX_CONCURRENT_FAILING_POLLS = 2
+
+# Why the coordinator is polling at its current interval (diagnostics)
+POLL_REASON_STARTUP = "startup"
+POLL_REASON_COMMAND = "command"
+POLL_REASON_POWER_CHANGE = "power_change"
+POLL_REASON_STATE_CHANGE = "state_change"
+POLL_REASON_IDLE = "idle"
+POLL_REASONS = [
+    POLL_REASON_STARTUP,
+    POLL_REASON_COMMAND,
+    POLL_REASON_POWER_CHANGE,
+    POLL_REASON_STATE_CHANGE,
+    POLL_REASON_IDLE,
+]
@@ -1,31 +1,116 @@
 """Coordinator for Daikin integration."""
 
 import asyncio
-from datetime import timedelta
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 import logging
+import time
+from typing import Any, Protocol
 
 from aiohttp import ClientError
 from aiohttp.web_exceptions import HTTPForbidden
+from pydaikin.daikin_airbase import DaikinAirBase
 from pydaikin.daikin_base import Appliance
+from pydaikin.daikin_brp069 import DaikinBRP069
+from pydaikin.daikin_brp084 import DaikinBRP084
+from pydaikin.daikin_skyfi import DaikinSkyFi
 from pydaikin.exceptions import DaikinException
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import COORDINATOR_UPDATE_TIMEOUT, DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .const import (
+    CONF_MAX_UPDATE_INTERVAL,
+    COORDINATOR_UPDATE_TIMEOUT,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    ENERGY_UPDATE_INTERVAL,
+    FAST_POLL_WINDOW,
+    FAST_UPDATE_INTERVAL,
+    LATENCY_SAMPLES,
+    POLL_REASON_COMMAND,
+    POLL_REASON_IDLE,
+    POLL_REASON_POWER_CHANGE,
+    POLL_REASON_STARTUP,
+    POLL_REASON_STATE_CHANGE,
+    TRACE_SIZE,
+    UPDATE_INTERVAL_BACKOFF_FACTOR,
+)
+from .data import DaikinData
+from .orchestrator import async_get_poll_orchestrator
+from .stats import OUTCOME_OK, OUTCOME_SKIPPED, DaikinCallStats, DaikinTrace
+from .store import DaikinDeviceStore
 
 _LOGGER = logging.getLogger(__name__)
 
+# Keys whose change means the unit was actually operated (remote, app, HA).
+# 'pow' must stay first: _adapt_poll_interval compares it on its own.
+CONTROL_KEYS = ("pow", "mode", "stemp", "shum", "f_rate", "f_dir", "adv", "en_hol")
+
+# Resources of the slow energy tier; everything else is fetched every poll
+ENERGY_RESOURCES = ("aircon/get_day_power_ex", "aircon/get_week_power")
+
+# Per adapter family: the resources holding the control state (None = the
+# adapter only knows a full update) and how long (seconds) the unit takes to
+# apply a command before reading them back reflects it. Looked up along the
+# MRO, so BRP072C uses the BRP069 entry.
+CONTROL_REFRESH: dict[type[Appliance], tuple[list[str] | None, float]] = {
+    DaikinAirBase: (["aircon/get_control_info", "aircon/get_zone_setting"], 1.5),
+    DaikinBRP069: (["aircon/get_control_info"], 1.0),
+    DaikinBRP084: (None, 2.0),
+    DaikinSkyFi: (["ac.cgi"], 1.0),
+}
+DEFAULT_CONTROL_REFRESH: tuple[list[str] | None, float] = (None, 2.0)
+
 type DaikinConfigEntry = ConfigEntry[DaikinCoordinator]
 
 
-class DaikinCoordinator(DataUpdateCoordinator[None]):
+class DaikinClimateControl(Protocol):
+    """Commands the device's climate entity takes from other entities.
+
+    Going through the climate entity keeps its override bookkeeping (command
+    grace, expected state, optimistic UI, last-active-mode restore) in one
+    place.
+    """
+
+    async def async_turn_on(self) -> None:
+        """Turn the device on, restoring the last active mode."""
+
+    async def async_turn_off(self) -> None:
+        """Turn the device off."""
+
+
+@dataclass(slots=True)
+class DaikinCommandStats:
+    """Counters of the commands sent to one device."""
+
+    # Commands queued by the climate entity
+    commands: int = 0
+    # Commands folded into an already queued write
+    merged: int = 0
+    # device.set() calls actually made
+    writes: int = 0
+    # Writes dropped because the device already was in the requested state
+    skipped: int = 0
+    # Payload keys dropped for the same reason (from writes that still went out)
+    skipped_keys: int = 0
+
+
+class DaikinCoordinator(DataUpdateCoordinator[DaikinData]):
     """Class to manage fetching Daikin data."""
 
     def __init__(
-        self, hass: HomeAssistant, entry: DaikinConfigEntry, device: Appliance
+        self,
+        hass: HomeAssistant,
+        entry: DaikinConfigEntry,
+        device: Appliance,
+        store: DaikinDeviceStore,
+        *,
+        connected: bool = True,
     ) -> None:
         """Initialize global Daikin data updater."""
         super().__init__(
@@ -33,22 +118,407 @@ class DaikinCoordinator(DataUpdateCoordinator[None]):
             _LOGGER,
             config_entry=entry,
             name=device.values.get("name", DOMAIN),
-            update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+            # Polls are scheduled by the coordinator itself, on its phase of
+            # the orchestrator's grid (see _async_schedule_poll)
+            update_interval=None,
         )
         self.device = device
+        # Restored values until the first poll (fast start) or the values
+        # read during setup
+        self.data = DaikinData.from_device(device)
+        self.store = store
+        self.command_stats = DaikinCommandStats()
+        # Durations and outcomes of recent update_status() and set() calls
+        self.poll_stats = DaikinCallStats(LATENCY_SAMPLES)
+        self.write_stats = DaikinCallStats(LATENCY_SAMPLES)
+        # CPU time of handing an update to every entity: their
+        # _handle_coordinator_update() and the state writes it triggers
+        self.listener_stats = DaikinCallStats(LATENCY_SAMPLES)
+        # (time, duration, outcome, changed keys) of recent polls and
+        # (time, duration, outcome, payload) of recent writes
+        self.poll_trace = DaikinTrace(TRACE_SIZE)
+        self.write_trace = DaikinTrace(TRACE_SIZE)
+        # Keys of device.values that changed since the values last handed to
+        # the listeners (None until known: listeners must assume everything
+        # changed). Compared against what was published rather than what the
+        # device held before the fetch: pydaikin applies writes to
+        # device.values locally, so a command's keys never differ across the
+        # poll that confirms it.
+        self.changed_keys: frozenset[str] | None = None
+        self._published_values = self._values_snapshot()
+        # The climate entity while it is added to hass (not disabled/unloaded)
+        self.climate: DaikinClimateControl | None = None
+        # False while a fast-started entry still runs its background handshake;
+        # device then holds restored values only and must not be polled.
+        self.connected = connected
+        if not connected:
+            self.last_update_success = False
+        self.max_update_interval: float = entry.options.get(
+            CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+        )
+        self._poll_interval: float = DEFAULT_UPDATE_INTERVAL
+        self.poll_interval_reason = POLL_REASON_STARTUP
+        # Whether the entry polls at all (set once it is set up, cleared on
+        # shutdown) and the timer of the next poll
+        self._polling = False
+        self._cancel_poll: CALLBACK_TYPE | None = None
+        # Monotonic deadline of the fast-poll window (0 = not active)
+        self._fast_poll_until = 0.0
+        self._control_state = self._control_snapshot()
+        self._cancel_control_refresh: CALLBACK_TYPE | None = None
+        # Enabled entities reading the energy tier, and when it is next due
+        # (monotonic, 0 = on the next poll)
+        self._energy_consumers = 0
+        self._energy_due = 0.0
+        self._orchestrator = async_get_poll_orchestrator(hass)
+        entry.async_on_unload(self._orchestrator.async_register(self))
+
+    @property
+    def poll_interval(self) -> float:
+        """Return the current polling interval in seconds."""
+        return self._poll_interval
+
+    @property
+    def poll_latency(self) -> float | None:
+        """Return the duration of the last poll in seconds."""
+        return self.poll_stats.last_duration
+
+    @property
+    def timeout_rate(self) -> float | None:
+        """Return the share (%) of recent polls and writes that timed out."""
+        if not (count := self.poll_stats.count + self.write_stats.count):
+            return None
+        return 100 * (self.poll_stats.timeouts + self.write_stats.timeouts) / count
+
+    @property
+    def last_error(self) -> str | None:
+        """Return the exception class of the most recent failed poll or write."""
+        failed = [
+            stats
+            for stats in (self.poll_stats, self.write_stats)
+            if stats.last_error_at is not None
+        ]
+        if not failed:
+            return None
+        return max(failed, key=lambda stats: stats.last_error_at).last_error
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing the fan-out."""
+        started = time.perf_counter()
+        super().async_update_listeners()
+        self.listener_stats.record(time.perf_counter() - started)
+
+    async def async_shutdown(self) -> None:
+        """Stop polling, cancel a pending control refresh and shut down."""
+        self._polling = False
+        self._async_cancel_poll()
+        if self._cancel_control_refresh is not None:
+            self._cancel_control_refresh()
+            self._cancel_control_refresh = None
+        await super().async_shutdown()
+
+    @asynccontextmanager
+    async def async_track_write(self, payload: dict[str, Any]) -> AsyncIterator[None]:
+        """Time the device.set() made inside the block and trace it."""
+        try:
+            async with self.write_stats.async_track():
+                yield
+        finally:
+            self.write_trace.append(
+                (
+                    time.time(),
+                    self.write_stats.last_duration,
+                    self.write_stats.last_outcome,
+                    payload,
+                )
+            )
+
+    @callback
+    def async_trace_skipped_write(self, payload: dict[str, Any]) -> None:
+        """Trace a write that was not sent because nothing would change."""
+        self.write_trace.append((time.time(), None, OUTCOME_SKIPPED, payload))
+
+    def _values_snapshot(self) -> dict[str, Any]:
+        """Return a copy of device.values without marking resources stale."""
+        values = self.device.values
+        return {key: values.get(key, invalidate=False) for key in values}
+
+    def _changed_keys(self) -> frozenset[str]:
+        """Return the keys changed since the last publish and publish the values.
+
+        Called right before the listeners are updated with the values.
+        """
+        previous, current = self._published_values, self._values_snapshot()
+        self._published_values = current
+        return frozenset(
+            key
+            for key, value in current.items()
+            if key not in previous or previous[key] != value
+        )
+
+    @property
+    def failing(self) -> bool:
+        """Return whether the last poll failed (the unit is backing off)."""
+        return self.poll_stats.last_outcome not in (None, OUTCOME_OK)
+
+    @callback
+    def async_set_device(self, device: Appliance) -> None:
+        """Replace the restored device with the connected one and start polling."""
+        self.device = device
+        self.connected = True
+        self.data = DaikinData.from_device(device)
+        self._control_state = self._control_snapshot()
+
+    @callback
+    def async_refresh_data(self) -> None:
+        """Rebuild data from device.values after a command updated them.
+
+        pydaikin applies what it sent to device.values; this shows it without
+        waiting for the next poll. Listeners are not called.
+        """
+        self.data = DaikinData.from_device(self.device)
+
+    @callback
+    def async_start_polling(self) -> None:
+        """Start the regular polls, once the entry is set up.
 
-    async def _async_update_data(self) -> None:
+        A fast-started entry starts them with its first poll after connecting.
+        """
+        self._polling = True
+        self._async_schedule_poll()
+
+    @callback
+    def _async_schedule_poll(self) -> None:
+        """Schedule the next poll on this coordinator's phase of the shared grid.
+
+        The coordinator runs its own timer (update_interval is None): the base
+        class rounds its schedule to whole seconds plus a random fraction, so
+        polls would drift off the grid.
+        """
+        self._async_cancel_poll()
+        if (
+            not self._polling
+            or not self.connected
+            or self.config_entry.pref_disable_polling
+        ):
+            return
+        when = self._orchestrator.async_next_poll_time(self, self._poll_interval)
+        self._cancel_poll = self.hass.loop.call_at(
+            when, self._handle_poll_tick, when
+        ).cancel
+
+    @callback
+    def _async_cancel_poll(self) -> None:
+        """Cancel the scheduled poll, if any."""
+        if self._cancel_poll is not None:
+            self._cancel_poll()
+            self._cancel_poll = None
+
+    @callback
+    def _handle_poll_tick(self, when: float) -> None:
+        """Run the poll scheduled for loop time when."""
+        self._cancel_poll = None
+        if self.hass.is_stopping:
+            return
+        self._orchestrator.async_record_tick(self.hass.loop.time() - when)
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_refresh(),
+            name=f"{self.name} - {self.config_entry.title} - refresh",
+            eager_start=True,
+        )
+
+    def _control_snapshot(self) -> tuple[str | None, ...]:
+        """Return the current values of CONTROL_KEYS.
+
+        invalidate=False: reading through ApplianceValues.get() would mark the
+        owning resource stale and force pydaikin to refetch it.
+        """
+        values = self.device.values
+        return tuple(values.get(key, invalidate=False) for key in CONTROL_KEYS)
+
+    @callback
+    def async_note_command(self) -> None:
+        """Poll fast for a while after a command was sent to the device."""
+        self._start_fast_polling(POLL_REASON_COMMAND)
+
+    @callback
+    def _start_fast_polling(self, reason: str) -> None:
+        """Open the fast-poll window and reschedule if the next poll is too far."""
+        self._fast_poll_until = time.monotonic() + FAST_POLL_WINDOW
+        slower = self.poll_interval > FAST_UPDATE_INTERVAL
+        self._set_poll_interval(FAST_UPDATE_INTERVAL, reason)
+        if slower and self._cancel_poll is not None:
+            # A poll is scheduled at the old (slow) interval — move it up.
+            # While a poll is running none is scheduled, and the poll
+            # schedules the next one with the new interval when it finishes.
+            self._async_schedule_poll()
+
+    @callback
+    def async_register_climate(self, climate: DaikinClimateControl) -> CALLBACK_TYPE:
+        """Expose the climate entity's commands; return the callback removing it."""
+        self.climate = climate
+
+        @callback
+        def _unregister() -> None:
+            if self.climate is climate:
+                self.climate = None
+
+        return _unregister
+
+    def async_add_energy_consumer(self) -> CALLBACK_TYPE:
+        """Poll the energy tier for an entity; return the callback that stops it."""
+        if not self._energy_consumers:
+            # Nothing has kept the counters fresh — fetch them on the next poll
+            self._energy_due = 0.0
+        self._energy_consumers += 1
+
+        @callback
+        def _remove_consumer() -> None:
+            self._energy_consumers -= 1
+
+        return _remove_consumer
+
+    def _poll_resources(self) -> tuple[list[str] | None, bool]:
+        """Return the resources to fetch this poll and whether energy is among them.
+
+        None stands for the adapter's full default set. Adapters that do not
+        poll energy resources separately (BRP084, SkyFi) always get None.
+        """
+        resources = self.device.get_info_resources()
+        if not any(resource in ENERGY_RESOURCES for resource in resources):
+            return None, False
+        if self._energy_consumers and time.monotonic() >= self._energy_due:
+            return None, True
+        return [
+            resource for resource in resources if resource not in ENERGY_RESOURCES
+        ], False
+
+    @callback
+    def async_request_control_refresh(self) -> None:
+        """Read back the control state shortly after a command completed.
+
+        Debounced: a request made while one is pending restarts its delay, so
+        a burst of commands is confirmed by one read once the last has landed.
+        """
+        if not self.connected:
+            return
+        if self._cancel_control_refresh is not None:
+            self._cancel_control_refresh()
+        _, delay = self._control_refresh_config()
+        self._cancel_control_refresh = self.hass.loop.call_later(
+            delay, self._handle_control_refresh
+        ).cancel
+
+    @callback
+    def _handle_control_refresh(self) -> None:
+        """Run the delayed control refresh."""
+        self._cancel_control_refresh = None
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_refresh_control(),
+            name=f"{self.name} - {self.config_entry.title} - control refresh",
+            eager_start=True,
+        )
+
+    def _control_refresh_config(self) -> tuple[list[str] | None, float]:
+        """Return the control resources and refresh delay of the device."""
+        for cls in type(self.device).__mro__:
+            if (config := CONTROL_REFRESH.get(cls)) is not None:
+                return config
+        return DEFAULT_CONTROL_REFRESH
+
+    async def _async_refresh_control(self) -> None:
+        """Fetch only the control resources and push them to the entities.
+
+        Best effort: a failure is left to the next regular poll, and the poll
+        schedule is not touched.
+        """
+        resources, _ = self._control_refresh_config()
+        device = self.device
+        try:
+            async with asyncio.timeout(COORDINATOR_UPDATE_TIMEOUT):
+                if resources is None:
+                    await device.update_status()
+                else:
+                    # Bypass pydaikin's per-resource TTL cache
+                    for resource in resources:
+                        device.values.invalidate_resource(resource)
+                    await device.update_status(resources)
+        except (
+            asyncio.TimeoutError,
+            ClientError,
+            DaikinException,
+            ValueError,
+        ) as err:
+            _LOGGER.debug("%s: control refresh failed: %r", self.name, err)
+            return
+        if self.last_update_success:
+            self.changed_keys = self._changed_keys()
+            self.data = DaikinData.from_device(device)
+            self.async_update_listeners()
+
+    @callback
+    def _set_poll_interval(self, seconds: float, reason: str) -> None:
+        """Set the interval used to schedule the next poll."""
+        if reason != self.poll_interval_reason or seconds != self.poll_interval:
+            _LOGGER.debug(
+                "%s: poll interval %.0fs -> %.0fs (%s)",
+                self.name, self.poll_interval, seconds, reason,
+            )
+        self.poll_interval_reason = reason
+        self._poll_interval = seconds
+
+    @callback
+    def _adapt_poll_interval(self) -> None:
+        """Pick the next interval from what changed since the previous poll.
+
+        Runs after every poll, failed ones included — a failed poll leaves
+        device.values untouched, so an unreachable unit backs off as well.
+        """
+        previous, self._control_state = self._control_state, self._control_snapshot()
+        if self._control_state[0] != previous[0]:
+            self._start_fast_polling(POLL_REASON_POWER_CHANGE)
+        elif time.monotonic() < self._fast_poll_until:
+            return
+        elif self._control_state != previous:
+            self._set_poll_interval(DEFAULT_UPDATE_INTERVAL, POLL_REASON_STATE_CHANGE)
+        else:
+            self._set_poll_interval(
+                min(
+                    self.poll_interval * UPDATE_INTERVAL_BACKOFF_FACTOR,
+                    self.max_update_interval,
+                ),
+                POLL_REASON_IDLE,
+            )
+
+    async def _async_update_data(self) -> DaikinData:
         """Fetch data from Daikin device."""
         name = self.device.values.get("name", "device")
+        if not self.connected:
+            raise UpdateFailed(f"{name} has not connected yet")
+        resources, with_energy = self._poll_resources()
+        self.changed_keys = frozenset()
+        # A refresh requested outside the schedule replaces the scheduled poll
+        self._async_cancel_poll()
+        reauth = False
         try:
-            async with asyncio.timeout(COORDINATOR_UPDATE_TIMEOUT):
-                await self.device.update_status()
+            # The timeout only covers the device: time spent queued for a
+            # domain-wide slot must not eat into this poll's budget.
+            async with (
+                self._orchestrator.async_poll_slot(self) as budget,
+                self.poll_stats.async_track(),
+                asyncio.timeout(budget),
+            ):
+                await self.device.update_status(resources)
         except HTTPForbidden as err:
             # pydaikin raises HTTPForbidden on a genuine 403 — credentials are
             # wrong/expired, so suspend polling and start reauth.
             # Cross-cluster contract: for multi-resource base-class devices this
             # only fires once pydaikin's H3 fix lands (TaskGroup currently
             # swallows single-task failures); the mapping is correct to land now.
+            reauth = True
             raise ConfigEntryAuthFailed(f"Authentication failed for {name}") from err
         except asyncio.TimeoutError as err:
             raise UpdateFailed(f"Timeout communicating with {name}") from err
@@ -56,3 +526,21 @@ class DaikinCoordinator(DataUpdateCoordinator[None]):
             raise UpdateFailed(f"Error communicating with {name}: {err}") from err
         except (ClientError, ValueError) as err:
             raise UpdateFailed(f"Error communicating with {name}: {err!r}") from err
+        else:
+            if with_energy:
+                self._energy_due = time.monotonic() + ENERGY_UPDATE_INTERVAL
+            self.changed_keys = self._changed_keys()
+            self.store.async_schedule_save(self.device)
+            return DaikinData.from_device(self.device)
+        finally:
+            self.poll_trace.append(
+                (
+                    time.time(),
+                    self.poll_stats.last_duration,
+                    self.poll_stats.last_outcome,
+                    self.changed_keys,
+                )
+            )
+            self._adapt_poll_interval()
+            if not reauth:
+                self._async_schedule_poll()
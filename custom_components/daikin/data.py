@@ -0,0 +1,92 @@
+"""Per-poll view of a Daikin device shared by its entities."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Self
+
+from pydaikin.daikin_base import Appliance
+
+
+def _round2(value: float | None) -> float | None:
+    """Round to 2 decimals, passing None through (sensor shows unknown).
+
+    The power-mixin and energy_consumption properties (current_total_power_consumption,
+    last_hour_cool/heat_energy_consumption, today_total_energy_consumption) can return
+    None before energy data is populated; today_energy_consumption currently cannot
+    (pydaikin coalesces with `or 0`) but is wrapped anyway for uniformity and to
+    future-proof against pydaikin changes.
+    """
+    return None if value is None else round(value, 2)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DaikinData:
+    """Decoded and derived values of a device, built once per poll.
+
+    Entities read their state from here instead of the live Appliance:
+    represent() decoding and pydaikin's energy arithmetic run once per poll
+    rather than on every state write of every entity. Built through
+    represent() and the Appliance properties, so each read still marks its
+    resource as used for pydaikin's TTL cache.
+    """
+
+    name: str | None
+    # Raw 'pow' ('1' when the adapter does not report it)
+    power: str
+    # Decoded 'mode': 'off' while pow=0, None when not reported
+    mode: str | None
+    target_temperature: float | None
+    inside_temperature: float | None
+    outside_temperature: float | None
+    humidity: float | None
+    target_humidity: float | None
+    compressor_frequency: float | None
+    # Title-cased, as listed in device.fan_rate / device.swing_modes
+    fan_mode: str
+    swing_mode: str
+    # Decoded 'en_hol' and 'adv'
+    holiday: str
+    advanced: str
+    # (name, on/off, ...) per zone, None without zones
+    zones: tuple[tuple[str, ...], ...] | None
+    # Energy values (kW / kWh, 2 decimals), None without energy support
+    total_power: float | None = None
+    cool_energy: float | None = None
+    heat_energy: float | None = None
+    energy_today: float | None = None
+    total_energy_today: float | None = None
+
+    @classmethod
+    def from_device(cls, device: Appliance) -> Self:
+        """Build the view of the device's current values."""
+        values = device.values
+        zones = device.zones
+        energy: dict[str, float | None] = {}
+        if device.support_energy_consumption:
+            energy = {
+                "total_power": _round2(device.current_total_power_consumption),
+                "cool_energy": _round2(device.last_hour_cool_energy_consumption),
+                "heat_energy": _round2(device.last_hour_heat_energy_consumption),
+                "energy_today": _round2(device.today_energy_consumption),
+                "total_energy_today": _round2(
+                    device.today_total_energy_consumption
+                ),
+            }
+        return cls(
+            name=values.get("name"),
+            power=values.get("pow", "1"),
+            mode=device.represent("mode")[1] if "mode" in values else None,
+            target_temperature=device.target_temperature,
+            inside_temperature=device.inside_temperature,
+            outside_temperature=device.outside_temperature,
+            humidity=device.humidity,
+            target_humidity=device.target_humidity,
+            compressor_frequency=device.compressor_frequency,
+            fan_mode=device.represent("f_rate")[1].title(),
+            swing_mode=device.represent("f_dir")[1].title(),
+            holiday=device.represent("en_hol")[1],
+            advanced=device.represent("adv")[1],
+            zones=tuple(tuple(zone) for zone in zones) if zones else None,
+            **energy,
+        )
@@ -0,0 +1,98 @@
+"""Diagnostics support for Daikin."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_API_KEY, CONF_PASSWORD, CONF_UUID
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .coordinator import DaikinConfigEntry
+from .orchestrator import async_get_poll_orchestrator
+from .stats import DaikinCallStats
+
+# Config entry keys, plus the raw value names adapters may echo them under
+TO_REDACT = {CONF_API_KEY, CONF_PASSWORD, CONF_UUID, "key", "pass"}
+
+
+def _timestamp(value: float) -> str:
+    """Format a trace timestamp."""
+    return dt_util.utc_from_timestamp(value).isoformat()
+
+
+def _duration(value: float | None, digits: int = 3) -> float | None:
+    """Format a trace duration (seconds), by default to the millisecond."""
+    return None if value is None else round(value, digits)
+
+
+def _percentiles(stats: DaikinCallStats, digits: int = 3) -> dict[str, float | None]:
+    """Format the p50/p95/p99 of recent durations."""
+    return {
+        f"p{percent}": _duration(stats.percentile(percent), digits)
+        for percent in (50, 95, 99)
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: DaikinConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    device = coordinator.device
+    orchestrator = async_get_poll_orchestrator(hass)
+    values = device.values
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "device": {
+            "type": type(device).__name__,
+            "values": async_redact_data(
+                {key: values.get(key, invalidate=False) for key in values},
+                TO_REDACT,
+            ),
+        },
+        "coordinator": {
+            "connected": coordinator.connected,
+            "last_update_success": coordinator.last_update_success,
+            "poll_interval": coordinator.poll_interval,
+            "poll_interval_reason": coordinator.poll_interval_reason,
+            "poll_latency_p50": _duration(coordinator.poll_stats.percentile(50)),
+            "poll_latency_p95": _duration(coordinator.poll_stats.percentile(95)),
+            "poll_latency_p99": _duration(coordinator.poll_stats.percentile(99)),
+            "timeout_rate": coordinator.timeout_rate,
+            "last_error": coordinator.last_error,
+            "write_latency": _percentiles(coordinator.write_stats),
+            # Entity-side cost of one update, to the microsecond
+            "listener_update_time": _percentiles(coordinator.listener_stats, 6),
+            "command_stats": asdict(coordinator.command_stats),
+        },
+        # Load of the whole integration, to judge how many units this
+        # instance keeps up with
+        "fleet": {
+            "coordinators": orchestrator.coordinator_count,
+            "polls_per_minute": orchestrator.polls_per_minute,
+            # How late scheduled polls started: event loop lag
+            "poll_start_lag": _percentiles(orchestrator.tick_lag_stats),
+            "poll_slot_wait": _percentiles(orchestrator.slot_wait_stats),
+        },
+        "polls": [
+            {
+                "time": _timestamp(timestamp),
+                "duration": _duration(duration),
+                "outcome": outcome,
+                "changed": sorted(changed),
+            }
+            for timestamp, duration, outcome, changed in coordinator.poll_trace
+        ],
+        "writes": [
+            {
+                "time": _timestamp(timestamp),
+                "duration": _duration(duration),
+                "outcome": outcome,
+                "payload": async_redact_data(payload, TO_REDACT),
+            }
+            for timestamp, duration, outcome, payload in coordinator.write_trace
+        ],
+    }
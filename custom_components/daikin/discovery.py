@@ -0,0 +1,197 @@
+"""Shared UDP discovery of Daikin units for the config flows."""
+
+from __future__ import annotations
+
+import asyncio
+from ipaddress import IPv4Network, ip_address, ip_network
+import logging
+import socket
+import time
+from typing import Any
+
+import psutil
+from pydaikin.discovery import DISCOVERY_MSG, UDP_DST_PORT, UDP_SRC_PORT
+from pydaikin.response import parse_response
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    DISCOVERY_BATCH_WINDOW,
+    DISCOVERY_CACHE_TTL,
+    DISCOVERY_TIMEOUT,
+    DOMAIN,
+    KEY_MAC,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_DISCOVERY: HassKey[DaikinDiscovery] = HassKey(f"{DOMAIN}_discovery")
+
+
+def _broadcast_networks() -> list[IPv4Network]:
+    """Return the IPv4 networks of the local interfaces that take broadcasts.
+
+    The same interfaces pydaikin's Discovery broadcasts to.
+    """
+    return [
+        ip_network(f"{addr.address}/{addr.netmask}", strict=False)
+        for addrs in psutil.net_if_addrs().values()
+        for addr in addrs
+        if addr.family == socket.AF_INET and addr.broadcast and addr.netmask
+    ]
+
+
+class DaikinDiscovery(asyncio.DatagramProtocol):
+    """Look up the MAC address of units by IP over one shared UDP socket.
+
+    pydaikin's Discovery binds UDP_SRC_PORT and blocks on recv for a second
+    per lookup; with many units announced by zeroconf at once, the lookups
+    queue up in the executor and fight over the port. Here every pending
+    lookup shares one datagram endpoint: requests arriving within
+    DISCOVERY_BATCH_WINDOW go out together, replies are matched to the
+    waiting lookups by source IP, and answers are cached for
+    DISCOVERY_CACHE_TTL. The socket is closed once nobody is waiting.
+
+    A batch of several hosts on a local network is sent as one broadcast to
+    that network; every unit there answers, and the answers nobody waits
+    for yet fill the cache. A lone host, or one behind a router, is asked
+    directly.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the discovery service."""
+        self._hass = hass
+        self._transport: asyncio.DatagramTransport | None = None
+        self._open_lock = asyncio.Lock()
+        # IP -> futures of the lookups waiting for its reply
+        self._waiters: dict[str, list[asyncio.Future[str]]] = {}
+        # IPs to send the discovery message to when the batch window closes
+        self._pending: set[str] = set()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # IP -> (monotonic expiry, MAC)
+        self._cache: dict[str, tuple[float, str]] = {}
+        # Local networks to broadcast to, read when the socket opens
+        self._networks: list[IPv4Network] = []
+
+    async def async_get_mac(self, host: str) -> str | None:
+        """Return the MAC address of the unit at host, or None if it is silent.
+
+        Raises OSError when the discovery port cannot be bound.
+        """
+        if (cached := self._cache.get(host)) is not None:
+            if cached[0] > time.monotonic():
+                return cached[1]
+            del self._cache[host]
+        await self._async_open()
+        future: asyncio.Future[str] = self._hass.loop.create_future()
+        self._waiters.setdefault(host, []).append(future)
+        self._pending.add(host)
+        if self._flush_handle is None:
+            self._flush_handle = self._hass.loop.call_later(
+                DISCOVERY_BATCH_WINDOW, self._flush
+            )
+        try:
+            async with asyncio.timeout(DISCOVERY_BATCH_WINDOW + DISCOVERY_TIMEOUT):
+                return await future
+        except TimeoutError:
+            return None
+        finally:
+            waiters = self._waiters[host]
+            waiters.remove(future)
+            if not waiters:
+                del self._waiters[host]
+            if not self._waiters:
+                self._close()
+
+    async def _async_open(self) -> None:
+        """Bind the shared socket unless it is already open."""
+        async with self._open_lock:
+            if self._transport is not None:
+                return
+            # Bound like pydaikin's Discovery (some units answer to the fixed
+            # source port), but non-blocking and driven by the event loop
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind(("", UDP_SRC_PORT))
+                sock.setblocking(False)
+            except OSError:
+                sock.close()
+                raise
+            self._networks = await self._hass.async_add_executor_job(
+                _broadcast_networks
+            )
+            await self._hass.loop.create_datagram_endpoint(lambda: self, sock=sock)
+
+    @callback
+    def _close(self) -> None:
+        """Close the shared socket."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    @callback
+    def _flush(self) -> None:
+        """Send the discovery message for every host queued in the window."""
+        self._flush_handle = None
+        hosts, self._pending = self._pending, set()
+        if self._transport is None:
+            return
+        targets = {self._target(host) for host in hosts} if len(hosts) > 1 else hosts
+        _LOGGER.debug(
+            "Sending UDP discovery for %s to %s",
+            ", ".join(sorted(hosts)),
+            ", ".join(sorted(targets)),
+        )
+        message = DISCOVERY_MSG.encode()
+        for target in targets:
+            self._transport.sendto(message, (target, UDP_DST_PORT))
+
+    def _target(self, host: str) -> str:
+        """Return the broadcast address of host's local network, else host."""
+        try:
+            address = ip_address(host)
+        except ValueError:
+            return host
+        for network in self._networks:
+            if address in network:
+                return str(network.broadcast_address)
+        return host
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Keep the transport of the shared socket."""
+        self._transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        """Hand a unit's reply to the lookups waiting for its IP."""
+        try:
+            response = parse_response(data.decode())
+        except (UnicodeDecodeError, ValueError):
+            # Not a (valid) Daikin reply
+            return
+        if (mac := response.get(KEY_MAC)) is None:
+            return
+        host = addr[0]
+        _LOGGER.debug("Discovered %s at %s", mac, host)
+        self._cache[host] = (time.monotonic() + DISCOVERY_CACHE_TTL, mac)
+        for future in self._waiters.get(host, ()):
+            if not future.done():
+                future.set_result(mac)
+
+    def error_received(self, exc: Exception) -> None:
+        """Log a send error; the lookups it concerns time out."""
+        _LOGGER.debug("UDP discovery error: %s", exc)
+
+
+@callback
+def async_get_discovery(hass: HomeAssistant) -> DaikinDiscovery:
+    """Return the domain's discovery service, creating it on first use."""
+    if (discovery := hass.data.get(DATA_DISCOVERY)) is None:
+        discovery = hass.data[DATA_DISCOVERY] = DaikinDiscovery(hass)
+    return discovery
@@ -0,0 +1,198 @@
+"""Import the hourly energy history of Daikin units into long-term statistics."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+
+from aiohttp import ClientError
+from pydaikin.exceptions import DaikinException
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_change
+from homeassistant.util import dt as dt_util, slugify
+from homeassistant.util.unit_conversion import EnergyConverter
+
+from .const import (
+    DOMAIN,
+    ENERGY_IMPORT_MINUTE,
+    ENERGY_IMPORT_STARTUP_DELAY,
+)
+from .coordinator import DaikinCoordinator
+from .orchestrator import async_get_poll_orchestrator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Per-hour energy of today and yesterday, in 0.1 kWh (BRP069 family)
+DAY_POWER_RESOURCE = "aircon/get_day_power_ex"
+
+# Statistic kind -> (today's key, yesterday's key) in the day power response
+HOURLY_KEYS = {
+    "cool_energy": ("curr_day_cool", "prev_1day_cool"),
+    "heat_energy": ("curr_day_heat", "prev_1day_heat"),
+}
+
+
+def _hourly_energy(response: dict[str, str], key: str) -> list[float]:
+    """Return the kWh per hour of one day from the day power values."""
+    try:
+        return [int(value) / 10 for value in response[key].split("/")]
+    except (KeyError, AttributeError, ValueError):
+        return []
+
+
+class DaikinEnergyImporter:
+    """Write a unit's hourly cool/heat energy as external statistics.
+
+    The adapter keeps per-hour energy for today and yesterday. Reading it once
+    an hour gives the Energy dashboard exact hourly values without sampling the
+    energy sensors on every poll, and an outage of up to a day is backfilled
+    on the next run. Nothing older is: the adapter only keeps daily totals
+    beyond yesterday, which cannot be split into hours. Statistics continue
+    from the last imported hour, so runs are idempotent.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: DaikinCoordinator) -> None:
+        """Initialize the importer."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._lock = asyncio.Lock()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Import shortly after setup and then hourly; return the stop callback."""
+        unsubs = [
+            async_call_later(
+                self._hass, ENERGY_IMPORT_STARTUP_DELAY, self._handle_import
+            ),
+            async_track_time_change(
+                self._hass, self._handle_import, minute=ENERGY_IMPORT_MINUTE, second=0
+            ),
+        ]
+
+        @callback
+        def _stop() -> None:
+            for unsub in unsubs:
+                unsub()
+
+        return _stop
+
+    @callback
+    def _handle_import(self, _now: datetime) -> None:
+        """Run an import in the background."""
+        self._coordinator.config_entry.async_create_background_task(
+            self._hass,
+            self.async_import(),
+            name=f"{self._coordinator.name} - energy import",
+        )
+
+    def _statistic_id(self, kind: str) -> str:
+        """Return the external statistic id of one kind of energy."""
+        return f"{DOMAIN}:{slugify(self._coordinator.device.mac)}_{kind}"
+
+    async def async_import(self) -> None:
+        """Fetch the hourly history and import the hours not imported yet."""
+        coordinator = self._coordinator
+        device = coordinator.device
+        if (
+            not coordinator.connected
+            or not device.support_energy_consumption
+            or DAY_POWER_RESOURCE not in device.get_info_resources()
+        ):
+            return
+        async with self._lock:
+            try:
+                # Shares the domain-wide poll slots: every unit imports at
+                # the same minute
+                async with async_get_poll_orchestrator(self._hass).async_poll_slot(
+                    coordinator
+                ) as budget, asyncio.timeout(budget):
+                    await device.update_status(
+                        [DAY_POWER_RESOURCE], force_refresh=True
+                    )
+            except (
+                asyncio.TimeoutError,
+                ClientError,
+                DaikinException,
+                ValueError,
+            ) as err:
+                _LOGGER.debug("%s: energy import failed: %r", coordinator.name, err)
+                return
+
+            # Hour h of a day starts h hours after local midnight; only
+            # finished hours are imported (and on a 23-hour DST day, not
+            # yesterday's hours overlapping today's)
+            today = dt_util.as_utc(dt_util.start_of_local_day())
+            yesterday = dt_util.as_utc(
+                dt_util.start_of_local_day(dt_util.now() - timedelta(days=1))
+            )
+            current_hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+            # invalidate=False: reading through ApplianceValues.get() would
+            # have the next poll fetch the resource again
+            response = {
+                key: value
+                for keys in HOURLY_KEYS.values()
+                for key in keys
+                if (value := device.values.get(key, invalidate=False)) is not None
+            }
+            for kind, (today_key, yesterday_key) in HOURLY_KEYS.items():
+                hours = [
+                    (start, energy)
+                    for hour, energy in enumerate(
+                        _hourly_energy(response, yesterday_key)
+                    )
+                    if (start := yesterday + timedelta(hours=hour)) < today
+                ] + [
+                    (today + timedelta(hours=hour), energy)
+                    for hour, energy in enumerate(_hourly_energy(response, today_key))
+                ]
+                await self._async_import_hours(
+                    kind, [(start, kwh) for start, kwh in hours if start < current_hour]
+                )
+
+    async def _async_import_hours(
+        self, kind: str, hours: list[tuple[datetime, float]]
+    ) -> None:
+        """Add the hours after the last imported one to the statistic."""
+        statistic_id = self._statistic_id(kind)
+        last = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics, self._hass, 1, statistic_id, True, {"sum"}
+        )
+        total = 0.0
+        if rows := last.get(statistic_id):
+            last_start = dt_util.utc_from_timestamp(rows[0]["start"])
+            total = rows[0]["sum"] or 0.0
+            hours = [(start, kwh) for start, kwh in hours if start > last_start]
+        if not hours:
+            return
+
+        statistics: list[StatisticData] = []
+        for start, kwh in hours:
+            total += kwh
+            statistics.append(StatisticData(start=start, state=kwh, sum=total))
+        name = self._coordinator.data.name or DOMAIN
+        metadata = StatisticMetaData(
+            mean_type=StatisticMeanType.NONE,
+            has_sum=True,
+            name=f"{name} {kind.replace('_', ' ')}",
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_class=EnergyConverter.UNIT_CLASS,
+            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        )
+        _LOGGER.debug(
+            "%s: importing %d hours of %s", self._coordinator.name, len(hours), kind
+        )
+        async_add_external_statistics(self._hass, metadata, statistics)
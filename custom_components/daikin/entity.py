@@ -1,5 +1,8 @@
 """Base entity for Daikin."""
 
+from pydaikin.daikin_base import Appliance
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -10,11 +13,15 @@ class DaikinEntity(CoordinatorEntity[DaikinCoordinator]):
     """Base entity for Daikin."""
 
     _attr_has_entity_name = True
+    # Keys of device.values the state is derived from. A coordinator update
+    # that changed none of them (and not the availability) writes nothing.
+    # None: derived from something else too, always write.
+    _update_keys: frozenset[str] | None = None
 
     def __init__(self, coordinator: DaikinCoordinator) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
-        self.device = coordinator.device
+        self._last_available: bool | None = None
         info = self.device.values
         self._attr_device_info = DeviceInfo(
             connections={(CONNECTION_NETWORK_MAC, self.device.mac)},
@@ -23,3 +30,29 @@ class DaikinEntity(CoordinatorEntity[DaikinCoordinator]):
             name=info.get("name"),
             sw_version=info.get("ver", "").replace("_", "."),
         )
+
+    @property
+    def device(self) -> Appliance:
+        """Return the device, which a fast-started entry swaps once connected."""
+        return self.coordinator.device
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._async_write_state_if_changed()
+
+    @callback
+    def _async_write_state_if_changed(self, force: bool = False) -> None:
+        """Write the state unless the update cannot have changed it."""
+        available = self.available
+        changed = self.coordinator.changed_keys
+        if (
+            not force
+            and available == self._last_available
+            and self._update_keys is not None
+            and changed is not None
+            and self._update_keys.isdisjoint(changed)
+        ):
+            return
+        self._last_available = available
+        self.async_write_ha_state()
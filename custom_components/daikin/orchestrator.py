@@ -0,0 +1,149 @@
+"""Domain-wide poll orchestration for Daikin coordinators."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+import math
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    COORDINATOR_UPDATE_TIMEOUT,
+    DOMAIN,
+    LATENCY_SAMPLES,
+    MAX_CONCURRENT_FAILING_POLLS,
+    MAX_CONCURRENT_POLLS,
+    POLL_SLOT_TIMEOUT,
+)
+from .stats import DaikinCallStats
+
+if TYPE_CHECKING:
+    from .coordinator import DaikinCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ORCHESTRATOR: HassKey[DaikinPollOrchestrator] = HassKey(DOMAIN)
+
+# Log when a poll waited this long (seconds) for a free slot
+SLOT_WAIT_WARNING = 5
+
+
+class DaikinPollOrchestrator:
+    """Spread the polls of every Daikin coordinator over time.
+
+    Each registered coordinator gets an evenly spaced phase on a shared time
+    grid, so N units polling every T seconds start T/N apart instead of all at
+    once. A domain-wide semaphore caps how many polls run at the same time —
+    it also serializes the startup burst, when every entry does its first
+    refresh or connects at once. Units whose last poll failed queue on a
+    separate, smaller semaphore, so unreachable units retrying with long
+    timeouts never take slots from the reachable ones.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the orchestrator."""
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+        self._failing_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FAILING_POLLS)
+        self._coordinators: list[DaikinCoordinator] = []
+        # Origin of the phase grid (loop clock)
+        self._epoch = hass.loop.time()
+        # Fleet-wide load, for diagnostics: how late scheduled polls fire
+        # (event loop lag), how long polls queue for a slot, and when recent
+        # polls finished (throughput)
+        self.tick_lag_stats = DaikinCallStats(LATENCY_SAMPLES)
+        self.slot_wait_stats = DaikinCallStats(LATENCY_SAMPLES)
+        self._poll_times: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    @callback
+    def async_register(self, coordinator: DaikinCoordinator) -> CALLBACK_TYPE:
+        """Register a coordinator and return the callback that removes it."""
+        self._coordinators.append(coordinator)
+
+        @callback
+        def _unregister() -> None:
+            self._coordinators.remove(coordinator)
+
+        return _unregister
+
+    @callback
+    def async_next_poll_time(
+        self, coordinator: DaikinCoordinator, interval: float
+    ) -> float:
+        """Return the loop time of the coordinator's next poll.
+
+        The poll lands on the coordinator's phase of the grid, at least half
+        an interval from now so a late poll is not immediately followed by
+        another one.
+        """
+        index = self._coordinators.index(coordinator)
+        offset = interval * index / len(self._coordinators)
+        earliest = self._hass.loop.time() + interval / 2
+        cycles = math.ceil((earliest - self._epoch - offset) / interval)
+        return self._epoch + offset + cycles * interval
+
+    @property
+    def coordinator_count(self) -> int:
+        """Return the number of registered coordinators."""
+        return len(self._coordinators)
+
+    @property
+    def polls_per_minute(self) -> float | None:
+        """Return the fleet-wide poll rate over the recent polls."""
+        times = self._poll_times
+        if len(times) < 2 or (span := times[-1] - times[0]) <= 0:
+            return None
+        return round((len(times) - 1) * 60 / span, 1)
+
+    @callback
+    def async_record_tick(self, lag: float) -> None:
+        """Record how late a scheduled poll started, in seconds."""
+        self.tick_lag_stats.record(max(lag, 0.0))
+
+    @asynccontextmanager
+    async def async_poll_slot(
+        self, coordinator: DaikinCoordinator, *, failing: bool | None = None
+    ) -> AsyncIterator[float]:
+        """Hold a poll slot and yield the seconds the holder may take.
+
+        failing defaults to whether the coordinator's last poll failed.
+        """
+        if failing is None:
+            failing = coordinator.failing
+        if failing:
+            semaphore, limit = self._failing_semaphore, MAX_CONCURRENT_FAILING_POLLS
+            budget = COORDINATOR_UPDATE_TIMEOUT
+        else:
+            semaphore, limit = self._semaphore, MAX_CONCURRENT_POLLS
+            budget = POLL_SLOT_TIMEOUT
+        queued = time.monotonic()
+        async with semaphore:
+            started = time.monotonic()
+            self.slot_wait_stats.record(started - queued)
+            if started - queued > SLOT_WAIT_WARNING:
+                _LOGGER.debug(
+                    "%s waited %.1fs for a poll slot (limit: %d concurrent %s)",
+                    coordinator.name,
+                    started - queued,
+                    limit,
+                    "failing polls" if failing else "polls",
+                )
+            try:
+                yield budget
+            finally:
+                self._poll_times.append(time.monotonic())
+
+
+@callback
+def async_get_poll_orchestrator(hass: HomeAssistant) -> DaikinPollOrchestrator:
+    """Return the domain's poll orchestrator, creating it on first use."""
+    if (orchestrator := hass.data.get(DATA_ORCHESTRATOR)) is None:
+        orchestrator = hass.data[DATA_ORCHESTRATOR] = DaikinPollOrchestrator(hass)
+    return orchestrator
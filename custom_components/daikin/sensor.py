@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
-
-from pydaikin.daikin_base import Appliance
+from dataclasses import dataclass, replace
+from datetime import datetime
+import time
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -15,13 +15,17 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
     UnitOfEnergy,
     UnitOfFrequency,
     UnitOfPower,
     UnitOfTemperature,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.typing import StateType
 
 from .const import (
     ATTR_COMPRESSOR_FREQUENCY,
@@ -30,32 +34,82 @@ from .const import (
     ATTR_HEAT_ENERGY,
     ATTR_HUMIDITY,
     ATTR_INSIDE_TEMPERATURE,
+    ATTR_LAST_ERROR,
+    ATTR_MERGED_COMMANDS,
     ATTR_OUTSIDE_TEMPERATURE,
+    ATTR_POLL_INTERVAL,
+    ATTR_POLL_INTERVAL_REASON,
+    ATTR_POLL_LATENCY,
+    ATTR_POLL_LATENCY_P50,
+    ATTR_POLL_LATENCY_P95,
+    ATTR_POLL_LATENCY_P99,
+    ATTR_SKIPPED_WRITES,
     ATTR_TARGET_HUMIDITY,
+    ATTR_TIMEOUT_RATE,
     ATTR_TOTAL_ENERGY_TODAY,
     ATTR_TOTAL_POWER,
+    CONF_FILTER_SENSOR_UPDATES,
+    CONF_SENSOR_HEARTBEAT,
+    CONF_SENSOR_MIN_INTERVAL,
+    DEFAULT_FILTER_SENSOR_UPDATES,
+    POLL_REASONS,
 )
 from .coordinator import DaikinConfigEntry, DaikinCoordinator
+from .data import DaikinData
 from .entity import DaikinEntity
 
 
-def _round2(value: float | None) -> float | None:
-    """Round to 2 decimals, passing None through (sensor shows unknown).
+def _milliseconds(seconds: float | None) -> int | None:
+    """Convert a duration in seconds to whole milliseconds, passing None through."""
+    return None if seconds is None else round(seconds * 1000)
+
 
-    The power-mixin and energy_consumption properties (current_total_power_consumption,
-    last_hour_cool/heat_energy_consumption, today_total_energy_consumption) can return
-    None before energy data is populated; today_energy_consumption currently cannot
-    (pydaikin coalesces with `or 0`) but is wrapped anyway for uniformity and to
-    future-proof against pydaikin changes.
+@dataclass(frozen=True, kw_only=True)
+class DaikinPublishPolicy:
+    """When a sensor writes a new value.
+
+    A value is significant when it moves by at least the larger of deadband
+    and relative_deadband x the last written value; to or from unknown
+    always is. Significant values are written at most once per min_interval
+    (a held one goes out when the interval ends). Once heartbeat has passed
+    without a write, the current value is written anyway, changed or not:
+    smaller moves still land, and history shows the sensor is alive.
     """
-    return None if value is None else round(value, 2)
+
+    deadband: float = 0
+    relative_deadband: float = 0
+    # Seconds
+    min_interval: float = 0
+    heartbeat: float = 900
+
+    def is_significant(self, value: float | None, last: float | None) -> bool:
+        """Return whether value differs enough from the last written one."""
+        if value is None or last is None:
+            return True
+        threshold = max(self.deadband, self.relative_deadband * abs(last))
+        return abs(value - last) >= threshold
 
 
 @dataclass(frozen=True, kw_only=True)
 class DaikinSensorEntityDescription(SensorEntityDescription):
     """Describes Daikin sensor entity."""
 
-    value_func: Callable[[Appliance], float | None]
+    value_func: Callable[[DaikinData], float | None]
+    # Reads the energy counters, which are only polled while such a sensor
+    # is enabled
+    uses_energy: bool = False
+    # Keys of device.values the value is derived from (None: always update).
+    # The energy sensors keep None: pydaikin's power estimates decay with time.
+    update_keys: frozenset[str] | None = None
+    # None: write every change
+    publish_policy: DaikinPublishPolicy | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class DaikinDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a Daikin sensor reporting on the coordinator itself."""
+
+    value_func: Callable[[DaikinCoordinator], StateType]
 
 
 SENSOR_TYPES: tuple[DaikinSensorEntityDescription, ...] = (
@@ -65,7 +119,9 @@ SENSOR_TYPES: tuple[DaikinSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_func=lambda device: device.inside_temperature,
+        update_keys=frozenset(("htemp",)),
+        publish_policy=DaikinPublishPolicy(deadband=0.5, min_interval=60),
+        value_func=lambda data: data.inside_temperature,
     ),
     DaikinSensorEntityDescription(
         key=ATTR_OUTSIDE_TEMPERATURE,
@@ -73,14 +129,20 @@ SENSOR_TYPES: tuple[DaikinSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_func=lambda device: device.outside_temperature,
+        update_keys=frozenset(("otemp",)),
+        publish_policy=DaikinPublishPolicy(
+            deadband=1, min_interval=300, heartbeat=1800
+        ),
+        value_func=lambda data: data.outside_temperature,
     ),
     DaikinSensorEntityDescription(
         key=ATTR_HUMIDITY,
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_func=lambda device: device.humidity,
+        update_keys=frozenset(("hhum",)),
+        publish_policy=DaikinPublishPolicy(deadband=2, min_interval=120),
+        value_func=lambda data: data.humidity,
     ),
     DaikinSensorEntityDescription(
         key=ATTR_TARGET_HUMIDITY,
@@ -88,7 +150,8 @@ SENSOR_TYPES: tuple[DaikinSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_func=lambda device: device.target_humidity,
+        update_keys=frozenset(("shum",)),
+        value_func=lambda data: data.target_humidity,
     ),
     DaikinSensorEntityDescription(
         key=ATTR_TOTAL_POWER,
@@ -96,7 +159,9 @@ SENSOR_TYPES: tuple[DaikinSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
-        value_func=lambda device: _round2(device.current_total_power_consumption),
+        uses_energy=True,
+        publish_policy=DaikinPublishPolicy(relative_deadband=0.1, min_interval=60),
+        value_func=lambda data: data.total_power,
     ),
     DaikinSensorEntityDescription(
         key=ATTR_COOL_ENERGY,
@@ -104,7 +169,8 @@ SENSOR_TYPES: tuple[DaikinSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         entity_registry_enabled_default=False,
-        value_func=lambda device: _round2(device.last_hour_cool_energy_consumption),
+        uses_energy=True,
+        value_func=lambda data: data.cool_energy,
     ),
     DaikinSensorEntityDescription(
         key=ATTR_HEAT_ENERGY,
@@ -112,7 +178,8 @@ SENSOR_TYPES: tuple[DaikinSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         entity_registry_enabled_default=False,
-        value_func=lambda device: _round2(device.last_hour_heat_energy_consumption),
+        uses_energy=True,
+        value_func=lambda data: data.heat_energy,
     ),
     DaikinSensorEntityDescription(
         key=ATTR_ENERGY_TODAY,
@@ -120,7 +187,8 @@ SENSOR_TYPES: tuple[DaikinSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        value_func=lambda device: _round2(device.today_energy_consumption),
+        uses_energy=True,
+        value_func=lambda data: data.energy_today,
     ),
     DaikinSensorEntityDescription(
         key=ATTR_COMPRESSOR_FREQUENCY,
@@ -129,7 +197,10 @@ SENSOR_TYPES: tuple[DaikinSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         entity_registry_enabled_default=False,
-        value_func=lambda device: device.compressor_frequency,
+        update_keys=frozenset(("cmpfreq",)),
+        # Relative: a stop (to 0) or start (from 0) is always significant
+        publish_policy=DaikinPublishPolicy(relative_deadband=0.1, min_interval=60),
+        value_func=lambda data: data.compressor_frequency,
     ),
     DaikinSensorEntityDescription(
         key=ATTR_TOTAL_ENERGY_TODAY,
@@ -138,10 +209,112 @@ SENSOR_TYPES: tuple[DaikinSensorEntityDescription, ...] = (
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         entity_registry_enabled_default=False,
-        value_func=lambda device: _round2(device.today_total_energy_consumption),
+        uses_energy=True,
+        value_func=lambda data: data.total_energy_today,
     ),
 )
 
+DIAGNOSTIC_SENSOR_TYPES: tuple[DaikinDiagnosticSensorEntityDescription, ...] = (
+    DaikinDiagnosticSensorEntityDescription(
+        key=ATTR_POLL_INTERVAL,
+        translation_key="poll_interval",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_func=lambda coordinator: coordinator.poll_interval,
+    ),
+    DaikinDiagnosticSensorEntityDescription(
+        key=ATTR_POLL_INTERVAL_REASON,
+        translation_key="poll_interval_reason",
+        device_class=SensorDeviceClass.ENUM,
+        options=POLL_REASONS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_func=lambda coordinator: coordinator.poll_interval_reason,
+    ),
+    DaikinDiagnosticSensorEntityDescription(
+        key=ATTR_POLL_LATENCY,
+        translation_key="poll_latency",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_func=lambda coordinator: _milliseconds(coordinator.poll_latency),
+    ),
+    *(
+        DaikinDiagnosticSensorEntityDescription(
+            key=key,
+            translation_key=key,
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            suggested_display_precision=0,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            value_func=lambda coordinator, percent=percent: _milliseconds(
+                coordinator.poll_stats.percentile(percent)
+            ),
+        )
+        for key, percent in (
+            (ATTR_POLL_LATENCY_P50, 50),
+            (ATTR_POLL_LATENCY_P95, 95),
+            (ATTR_POLL_LATENCY_P99, 99),
+        )
+    ),
+    DaikinDiagnosticSensorEntityDescription(
+        key=ATTR_TIMEOUT_RATE,
+        translation_key="timeout_rate",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_func=lambda coordinator: coordinator.timeout_rate,
+    ),
+    DaikinDiagnosticSensorEntityDescription(
+        key=ATTR_LAST_ERROR,
+        translation_key="last_error",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_func=lambda coordinator: coordinator.last_error,
+    ),
+    DaikinDiagnosticSensorEntityDescription(
+        key=ATTR_MERGED_COMMANDS,
+        translation_key="merged_commands",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_func=lambda coordinator: coordinator.command_stats.merged,
+    ),
+    DaikinDiagnosticSensorEntityDescription(
+        key=ATTR_SKIPPED_WRITES,
+        translation_key="skipped_writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_func=lambda coordinator: coordinator.command_stats.skipped,
+    ),
+)
+
+
+def _publish_policy(
+    coordinator: DaikinCoordinator, description: DaikinSensorEntityDescription
+) -> DaikinPublishPolicy | None:
+    """Return the sensor's publishing policy with the entry's options applied."""
+    options = coordinator.config_entry.options
+    if (policy := description.publish_policy) is None or not options.get(
+        CONF_FILTER_SENSOR_UPDATES, DEFAULT_FILTER_SENSOR_UPDATES
+    ):
+        return None
+    if (min_interval := options.get(CONF_SENSOR_MIN_INTERVAL)) is not None:
+        policy = replace(policy, min_interval=min_interval)
+    if (heartbeat := options.get(CONF_SENSOR_HEARTBEAT)) is not None:
+        policy = replace(policy, heartbeat=heartbeat)
+    return policy
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -165,11 +338,17 @@ async def async_setup_entry(
     if daikin_api.device.support_compressor_frequency:
         sensors.append(ATTR_COMPRESSOR_FREQUENCY)
 
-    entities = [
+    entities: list[SensorEntity] = [
         DaikinSensor(daikin_api, description)
+        if (policy := _publish_policy(daikin_api, description)) is None
+        else DaikinFilteredSensor(daikin_api, description, policy)
         for description in SENSOR_TYPES
         if description.key in sensors
     ]
+    entities.extend(
+        DaikinDiagnosticSensor(daikin_api, description)
+        for description in DIAGNOSTIC_SENSOR_TYPES
+    )
     async_add_entities(entities)
 
 
@@ -185,8 +364,167 @@ class DaikinSensor(DaikinEntity, SensorEntity):
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{self.device.mac}-{description.key}"
+        self._update_keys = description.update_keys
+
+    async def async_added_to_hass(self) -> None:
+        """Ask the coordinator for the energy counters this sensor reads."""
+        await super().async_added_to_hass()
+        if self.entity_description.uses_energy:
+            self.async_on_remove(self.coordinator.async_add_energy_consumer())
 
     @property
     def native_value(self) -> float | None:
         """Return the state of the sensor."""
-        return self.entity_description.value_func(self.device)
+        return self.entity_description.value_func(self.coordinator.data)
+
+
+class DaikinFilteredSensor(DaikinSensor):
+    """A sensor writing its value through a publishing policy."""
+
+    # Every write is one the policy let through: a heartbeat repeating the
+    # last value must still reach the state machine and the recorder
+    _attr_force_update = True
+
+    def __init__(
+        self,
+        coordinator: DaikinCoordinator,
+        description: DaikinSensorEntityDescription,
+        policy: DaikinPublishPolicy,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description)
+        self._policy = policy
+        # Value last written and when (monotonic)
+        self._value = description.value_func(coordinator.data)
+        self._written_at = 0.0
+        # Timer writing a held-back value, and the monotonic time it fires at
+        self._unsub_publish: CALLBACK_TYPE | None = None
+        self._publish_at: float | None = None
+        # Timer writing the current value once heartbeat passed without a write
+        self._unsub_heartbeat: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Start the heartbeat; cancel the pending writes on removal."""
+        await super().async_added_to_hass()
+        # Adding the entity wrote its state: count that as the first write
+        self._last_available = self.available
+        self._written_at = time.monotonic()
+        self._async_schedule_heartbeat()
+        self.async_on_remove(self._cancel_publish)
+        self.async_on_remove(self._cancel_heartbeat)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the value last written."""
+        return self._value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new value when the publishing policy lets it through."""
+        self._async_publish()
+
+    @callback
+    def _handle_publish_timer(self, _now: datetime) -> None:
+        """Write the value held back when its interval ended."""
+        self._unsub_publish = None
+        self._publish_at = None
+        self._async_publish()
+
+    @callback
+    def _handle_heartbeat(self, _now: datetime) -> None:
+        """Write the current value, however little it moved."""
+        self._unsub_heartbeat = None
+        if not self.available:
+            # Unavailable was written when it happened; nothing to repeat
+            self._async_schedule_heartbeat()
+            return
+        self._async_write_value(
+            self.entity_description.value_func(self.coordinator.data)
+        )
+
+    @callback
+    def _async_publish(self) -> None:
+        """Write the current value now, later, or leave it to the heartbeat."""
+        value = self.entity_description.value_func(self.coordinator.data)
+        if self.available != self._last_available:
+            # Availability changes are written right away, with the value
+            self._async_write_value(value)
+            return
+        if value == self._value or not self._policy.is_significant(
+            value, self._value
+        ):
+            # A held-back value is superseded by one too close to the last
+            # written to go out before the heartbeat
+            self._cancel_publish()
+            return
+        now = time.monotonic()
+        due = self._written_at + self._policy.min_interval
+        if now >= due:
+            self._async_write_value(value)
+        elif due != self._publish_at:
+            self._cancel_publish()
+            self._publish_at = due
+            self._unsub_publish = async_call_later(
+                self.hass, due - now, self._handle_publish_timer
+            )
+
+    @callback
+    def _async_write_value(self, value: float | None) -> None:
+        """Write value as the sensor's state and restart the heartbeat."""
+        self._cancel_publish()
+        self._value = value
+        self._written_at = time.monotonic()
+        self._async_write_state_if_changed(force=True)
+        self._async_schedule_heartbeat()
+
+    @callback
+    def _async_schedule_heartbeat(self) -> None:
+        """(Re)arm the heartbeat for a full period from now."""
+        self._cancel_heartbeat()
+        policy = self._policy
+        self._unsub_heartbeat = async_call_later(
+            self.hass,
+            max(policy.heartbeat, policy.min_interval),
+            self._handle_heartbeat,
+        )
+
+    @callback
+    def _cancel_publish(self) -> None:
+        """Cancel the pending write of a held-back value, if any."""
+        if self._unsub_publish is not None:
+            self._unsub_publish()
+            self._unsub_publish = None
+        self._publish_at = None
+
+    @callback
+    def _cancel_heartbeat(self) -> None:
+        """Cancel the heartbeat timer, if any."""
+        if self._unsub_heartbeat is not None:
+            self._unsub_heartbeat()
+            self._unsub_heartbeat = None
+
+
+class DaikinDiagnosticSensor(DaikinEntity, SensorEntity):
+    """Representation of a coordinator diagnostic sensor."""
+
+    entity_description: DaikinDiagnosticSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: DaikinCoordinator,
+        description: DaikinDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{self.device.mac}-{description.key}"
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the device is not — that is when it matters."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        return self.entity_description.value_func(self.coordinator)
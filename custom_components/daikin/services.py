@@ -0,0 +1,160 @@
+"""Services for the Daikin integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.climate import (
+    ATTR_FAN_MODE,
+    ATTR_HVAC_MODE,
+    ATTR_SWING_MODE,
+    DATA_COMPONENT as CLIMATE_DATA_COMPONENT,
+    HVACMode,
+)
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE, ENTITY_MATCH_ALL
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.target import (
+    TargetSelection,
+    async_extract_referenced_entity_ids,
+)
+
+from .climate import DaikinClimate
+from .const import (
+    ATTR_DEVICE_TIMEOUT,
+    ATTR_MAX_PARALLEL,
+    DEFAULT_BULK_DEVICE_TIMEOUT,
+    DEFAULT_BULK_MAX_PARALLEL,
+    DOMAIN,
+    SERVICE_BULK_SET,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SETTINGS = (ATTR_TEMPERATURE, ATTR_HVAC_MODE, ATTR_FAN_MODE, ATTR_SWING_MODE)
+
+BULK_SET_SCHEMA = vol.All(
+    cv.make_entity_service_schema(
+        {
+            vol.Optional(ATTR_TEMPERATURE): vol.Coerce(float),
+            vol.Optional(ATTR_HVAC_MODE): vol.Coerce(HVACMode),
+            vol.Optional(ATTR_FAN_MODE): cv.string,
+            vol.Optional(ATTR_SWING_MODE): cv.string,
+            vol.Optional(
+                ATTR_MAX_PARALLEL, default=DEFAULT_BULK_MAX_PARALLEL
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=64)),
+            vol.Optional(
+                ATTR_DEVICE_TIMEOUT, default=DEFAULT_BULK_DEVICE_TIMEOUT
+            ): vol.All(vol.Coerce(float), vol.Range(min=1, max=120)),
+        }
+    ),
+    cv.has_at_least_one_key(*SETTINGS),
+)
+
+# Per-entity outcomes of daikin.bulk_set
+RESULT_OK = "ok"
+RESULT_TIMEOUT = "timeout"
+RESULT_ERROR = "error"
+RESULT_NOT_FOUND = "not_found"
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Daikin services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_SET,
+        _async_bulk_set,
+        schema=BULK_SET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def _async_bulk_set(call: ServiceCall) -> ServiceResponse:
+    """Apply the same settings to many climate entities at once.
+
+    Each device gets one write carrying all the settings, sent through the
+    entity like any other command (optimistic state, override grace, merging
+    with commands already queued for that device). At most max_parallel
+    devices are written at once, and each gets device_timeout seconds; a
+    device timing out or failing does not affect the others.
+    """
+    settings = {key: call.data[key] for key in SETTINGS if key in call.data}
+    timeout: float = call.data[ATTR_DEVICE_TIMEOUT]
+    semaphore = asyncio.Semaphore(call.data[ATTR_MAX_PARALLEL])
+    if (component := call.hass.data.get(CLIMATE_DATA_COMPONENT)) is None:
+        raise ServiceValidationError(
+            f"{DOMAIN}.{SERVICE_BULK_SET} needs the climate platform, which is "
+            "not loaded"
+        )
+
+    async def _async_set(entity_id: str) -> dict[str, Any]:
+        entity = component.get_entity(entity_id)
+        if not isinstance(entity, DaikinClimate):
+            return {"result": RESULT_NOT_FOUND}
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                async with asyncio.timeout(timeout):
+                    await entity.async_set_settings(dict(settings))
+            except TimeoutError:
+                result = {"result": RESULT_TIMEOUT}
+            except Exception as err:  # noqa: BLE001
+                # Already logged by the entity; report it and carry on
+                result = {"result": RESULT_ERROR, "error": repr(err)}
+            else:
+                result = {"result": RESULT_OK}
+            result["duration"] = round(time.monotonic() - started, 3)
+            return result
+
+    # One entry per entity even if targeted twice: a device takes one write
+    if call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL:
+        entity_ids = sorted(
+            entity.entity_id
+            for entity in component.entities
+            if isinstance(entity, DaikinClimate)
+        )
+    else:
+        selected = async_extract_referenced_entity_ids(
+            call.hass, TargetSelection(call.data)
+        )
+        # Areas, devices and labels pull in every entity they hold: only the
+        # Daikin climate entities among them are set, while an entity named
+        # explicitly is always reported on
+        entity_ids = sorted(
+            selected.referenced
+            | {
+                entity_id
+                for entity_id in selected.indirectly_referenced
+                if isinstance(component.get_entity(entity_id), DaikinClimate)
+            }
+        )
+    results = dict(
+        zip(
+            entity_ids,
+            await asyncio.gather(*(_async_set(entity_id) for entity_id in entity_ids)),
+            strict=True,
+        )
+    )
+    failed = [
+        entity_id for entity_id, result in results.items()
+        if result["result"] != RESULT_OK
+    ]
+    if failed:
+        _LOGGER.warning(
+            "%s.%s failed for %d of %d entities: %s",
+            DOMAIN, SERVICE_BULK_SET, len(failed), len(results), ", ".join(failed),
+        )
+    return {"results": results}
@@ -0,0 +1,49 @@
+"""Shared SSL context for talking to Daikin adapters.
+
+Kept out of the package __init__ so the config flow can import it without
+loading the whole integration.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+
+from homeassistant.core import HomeAssistant
+
+# Process-wide SSL context, built on first use (loading the default CA bundle
+# is blocking I/O costing tens of milliseconds) and shared by every entry and
+# config flow. pydaikin's BRP072C re-applies the same legacy options to the
+# context it is given, which is idempotent, so sharing it is safe.
+_SSL_CONTEXT: ssl.SSLContext | None = None
+_SSL_CONTEXT_LOCK = asyncio.Lock()
+
+
+def get_daikin_ssl_context() -> ssl.SSLContext:
+    """Create SSL context with legacy Daikin support."""
+    ssl_context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    # SSL_OP_LEGACY_SERVER_CONNECT — BRP072C legacy firmware needs legacy renegotiation
+    ssl_context.options |= 0x4
+    # Lower security level to allow legacy Daikin SSL/TLS configurations
+    # Fixes HA 2025.10 SSL WRONG_SIGNATURE_TYPE error
+    try:
+        ssl_context.set_ciphers('DEFAULT:@SECLEVEL=0')
+    except ssl.SSLError:
+        pass  # Fallback for systems that don't support SECLEVEL
+    return ssl_context
+
+
+async def async_get_daikin_ssl_context(hass: HomeAssistant) -> ssl.SSLContext:
+    """Return the shared SSL context, building it in the executor once."""
+    global _SSL_CONTEXT  # noqa: PLW0603
+    if _SSL_CONTEXT is None:
+        # Lock so entries set up concurrently at startup wait for the first
+        # build instead of each starting their own.
+        async with _SSL_CONTEXT_LOCK:
+            if _SSL_CONTEXT is None:
+                _SSL_CONTEXT = await hass.async_add_executor_job(
+                    get_daikin_ssl_context
+                )
+    return _SSL_CONTEXT
@@ -0,0 +1,118 @@
+"""Latency and outcome statistics of Daikin device calls and polling."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+import math
+import time
+from typing import Any
+
+from pydaikin.exceptions import DaikinException
+
+
+OUTCOME_OK = "ok"
+OUTCOME_SKIPPED = "skipped"
+
+
+def is_timeout(err: BaseException) -> bool:
+    """Return whether err is a timeout talking to the device.
+
+    BRP084 wraps its HTTP timeouts in DaikinException with 'timeout' in the
+    message instead of raising TimeoutError.
+    """
+    return isinstance(err, TimeoutError) or (
+        isinstance(err, DaikinException) and "timeout" in str(err).lower()
+    )
+
+
+class DaikinCallStats:
+    """Ring buffer of the duration and outcome of recent device calls."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize the statistics."""
+        # (duration in seconds, timed out)
+        self._samples: deque[tuple[float, bool]] = deque(maxlen=size)
+        # Durations of _samples, sorted; rebuilt on demand after a new sample
+        self._sorted: list[float] | None = None
+        self.last_duration: float | None = None
+        # OUTCOME_OK, or the class name of the exception the last call raised
+        self.last_outcome: str | None = None
+        # Class name of the last call's exception, kept until the next failure,
+        # and when it happened (monotonic)
+        self.last_error: str | None = None
+        self.last_error_at: float | None = None
+
+    @asynccontextmanager
+    async def async_track(self) -> AsyncIterator[None]:
+        """Time the call made inside the block and record its outcome."""
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as err:
+            self.last_error_at = time.monotonic()
+            self._record(self.last_error_at - started, is_timeout(err))
+            self.last_outcome = self.last_error = type(err).__name__
+            raise
+        except BaseException as err:
+            # Cancelled: not a sample, but the trace still shows what happened
+            self.last_duration = time.monotonic() - started
+            self.last_outcome = type(err).__name__
+            raise
+        self._record(time.monotonic() - started, False)
+        self.last_outcome = OUTCOME_OK
+
+    def record(self, duration: float) -> None:
+        """Add a sample measured without async_track (never a timeout)."""
+        self._record(duration, False)
+
+    def _record(self, duration: float, timed_out: bool) -> None:
+        """Add one sample, dropping the oldest once the buffer is full."""
+        self._samples.append((duration, timed_out))
+        self._sorted = None
+        self.last_duration = duration
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the given percentile (nearest rank) of the recent durations."""
+        if not self._samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(duration for duration, _ in self._samples)
+        rank = math.ceil(percent / 100 * len(self._sorted))
+        return self._sorted[max(rank, 1) - 1]
+
+    @property
+    def count(self) -> int:
+        """Return the number of recent calls."""
+        return len(self._samples)
+
+    @property
+    def timeouts(self) -> int:
+        """Return how many of the recent calls timed out."""
+        return sum(timed_out for _, timed_out in self._samples)
+
+
+class DaikinTrace:
+    """Preallocated ring of the most recent trace records.
+
+    Records are plain tuples; once the ring is full each new one overwrites
+    the oldest, so keeping the trace always on costs one list store per call.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the trace."""
+        self._records: list[tuple[Any, ...] | None] = [None] * size
+        self._next = 0
+
+    def append(self, record: tuple[Any, ...]) -> None:
+        """Add a record, overwriting the oldest once the ring is full."""
+        self._records[self._next] = record
+        self._next = (self._next + 1) % len(self._records)
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        """Iterate over the records, oldest first."""
+        records = self._records
+        for record in records[self._next :] + records[: self._next]:
+            if record is not None:
+                yield record
@@ -0,0 +1,198 @@
+"""Persistent per-entry device snapshots and capabilities for Daikin fast start."""
+
+from __future__ import annotations
+
+import ssl
+from typing import Any, NotRequired, TypedDict
+
+from aiohttp import ClientSession
+from pydaikin.daikin_airbase import DaikinAirBase
+from pydaikin.daikin_base import Appliance
+from pydaikin.daikin_brp069 import DaikinBRP069
+from pydaikin.daikin_brp072c import DaikinBRP072C
+from pydaikin.daikin_brp084 import DaikinBRP084
+from pydaikin.daikin_skyfi import DaikinSkyFi
+
+from homeassistant.const import CONF_API_KEY, CONF_HOST, CONF_PASSWORD, CONF_UUID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY
+
+STORAGE_VERSION = 1
+
+# Appliance classes DaikinFactory can return, by class name
+DEVICE_TYPES: dict[str, type[Appliance]] = {
+    cls.__name__: cls
+    for cls in (DaikinAirBase, DaikinBRP069, DaikinBRP072C, DaikinBRP084, DaikinSkyFi)
+}
+
+
+# Appliance properties the platforms build their entity sets from
+CAPABILITY_FLAGS = (
+    "support_advanced_modes",
+    "support_away_mode",
+    "support_compressor_frequency",
+    "support_energy_consumption",
+    "support_fan_rate",
+    "support_humidity",
+    "support_outside_temperature",
+    "support_swing_mode",
+    "support_zone_temperature",
+)
+
+
+class DeviceCapabilities(TypedDict):
+    """What the entity sets of a device were built from."""
+
+    # The device and firmware the rest was probed on
+    mac: str
+    ver: str | None
+    flags: dict[str, bool]
+    fan_rate: list[str]
+    swing_modes: list[str]
+    zones: list[str]
+
+
+class DeviceSnapshot(TypedDict):
+    """Last known state of a device, as stored on disk."""
+
+    device_type: str
+    values: dict[str, Any]
+    # Missing from snapshots written before capabilities were stored
+    capabilities: NotRequired[DeviceCapabilities]
+
+
+def device_capabilities(device: Appliance) -> DeviceCapabilities:
+    """Return the capabilities of a device, keyed by its MAC and firmware.
+
+    A later startup builds its entities from the stored capabilities; when the
+    connected device reports different ones, the entry has to be set up again.
+    """
+    return DeviceCapabilities(
+        mac=device.mac,
+        ver=device.values.get("ver", invalidate=False),
+        flags={
+            flag: bool(getattr(device, flag, False)) for flag in CAPABILITY_FLAGS
+        },
+        fan_rate=list(device.fan_rate or []),
+        swing_modes=list(device.swing_modes or []),
+        zones=[zone[0] for zone in device.zones or []],
+    )
+
+
+class DaikinDeviceStore:
+    """Keep the last known values of one entry's device on disk."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[DeviceSnapshot] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._device: Appliance | None = None
+        self._save_pending = False
+        self._saved = False
+        self._closed = False
+
+    async def async_load(self) -> DeviceSnapshot | None:
+        """Return the stored snapshot, if any."""
+        return await self._store.async_load()
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        # Store.async_remove() also cancels a pending delayed write
+        self._save_pending = False
+        await self._store.async_remove()
+
+    async def async_close(self) -> None:
+        """Write a pending snapshot now and ignore later saves.
+
+        Called when the entry unloads: a delayed write still pending on this
+        Store would otherwise land after async_remove_entry deleted the file
+        and recreate it.
+        """
+        self._closed = True
+        if self._save_pending:
+            # async_save() also cancels the pending delayed write
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def async_schedule_save(self, device: Appliance) -> None:
+        """Save the device's values, at most once per SNAPSHOT_SAVE_DELAY.
+
+        The first snapshot of a session is written right away so a fresh entry
+        can fast-start on the next restart; later ones are coalesced. Store
+        flushes a pending write when Home Assistant stops.
+        """
+        if self._closed:
+            return
+        self._device = device
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(
+            self._data_to_save, SNAPSHOT_SAVE_DELAY if self._saved else 0
+        )
+
+    @callback
+    def _data_to_save(self) -> DeviceSnapshot:
+        """Return the snapshot to write."""
+        self._save_pending = False
+        self._saved = True
+        device = self._device
+        # invalidate=False: reading through ApplianceValues.get() would mark
+        # every resource stale and force a full refetch on the next poll.
+        return DeviceSnapshot(
+            device_type=type(device).__name__,
+            values={
+                key: device.values.get(key, invalidate=False)
+                for key in device.values
+            },
+            # What the next startup builds its entities from
+            capabilities=device_capabilities(device),
+        )
+
+
+def restore_device(
+    snapshot: DeviceSnapshot,
+    data: dict[str, Any],
+    session: ClientSession,
+    ssl_context: ssl.SSLContext,
+) -> Appliance | None:
+    """Rebuild an unconnected Appliance from a snapshot, without any I/O.
+
+    Returns None when the snapshot cannot be used (unknown adapter family, or
+    a host with an explicit port that only DaikinFactory knows how to apply).
+    """
+    if (device_type := DEVICE_TYPES.get(snapshot["device_type"])) is None:
+        return None
+    if ":" in data[CONF_HOST]:
+        return None
+    device = create_device(device_type, data, session, ssl_context)
+    device.values.update(snapshot["values"])
+    return device
+
+
+def create_device(
+    device_type: type[Appliance],
+    data: dict[str, Any],
+    session: ClientSession,
+    ssl_context: ssl.SSLContext,
+) -> Appliance:
+    """Create an unconnected Appliance of a known family for a config entry.
+
+    What DaikinFactory builds once it has found the family, without probing
+    the families it tries first.
+    """
+    host: str = data[CONF_HOST]
+    if device_type is DaikinBRP072C:
+        return DaikinBRP072C(
+            host,
+            session,
+            key=data.get(CONF_API_KEY),
+            uuid=data.get(CONF_UUID),
+            ssl_context=ssl_context,
+        )
+    if device_type is DaikinSkyFi:
+        return DaikinSkyFi(host, session, data.get(CONF_PASSWORD))
+    return device_type(host, session)
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
+from urllib.parse import quote
+
+from pydaikin.daikin_airbase import DaikinAirBase
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_OFF, SERVICE_TURN_ON
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import DOMAIN
+from .const import COMMAND_MERGE_WINDOW
 from .coordinator import DaikinConfigEntry, DaikinCoordinator
 from .entity import DaikinEntity
 
@@ -20,6 +22,8 @@ _LOGGER = logging.getLogger(__name__)
 DAIKIN_ATTR_ADVANCED = "adv"
 DAIKIN_ATTR_STREAMER = "streamer"
 DAIKIN_ATTR_MODE = "mode"
+DAIKIN_ATTR_ZONE_ONOFF = "zone_onoff"
+ZONE_SETTING_RESOURCE = "aircon/get_zone_setting"
 
 
 async def async_setup_entry(
@@ -31,8 +35,9 @@ async def async_setup_entry(
     daikin_api = entry.runtime_data
     switches: list[SwitchEntity] = []
     if zones := daikin_api.device.zones:
+        zone_batcher = DaikinZoneBatcher(hass, daikin_api)
         switches.extend(
-            DaikinZoneSwitch(daikin_api, zone_id)
+            DaikinZoneSwitch(daikin_api, zone_batcher, zone_id)
             for zone_id, zone in enumerate(zones)
             if zone[0] != "-"
         )
@@ -45,34 +50,141 @@ async def async_setup_entry(
     async_add_entities(switches)
 
 
+class DaikinZoneBatcher:
+    """Merge zone on/off changes sent close together into one zone write.
+
+    A scene switching several zones turns every zone switch at once, and
+    AirBase set_zone() is a full read-modify-write of the zone setting per
+    call: eight zones cost eight round trips that race each other. Changes
+    queued within COMMAND_MERGE_WINDOW, or while the previous write is still
+    in flight, go out together (last value wins per zone).
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: DaikinCoordinator) -> None:
+        """Initialize the batcher."""
+        self._hass = hass
+        self._coordinator = coordinator
+        # zone id -> "1"/"0"
+        self._pending: dict[int, str] = {}
+        # Write still accepting changes / write currently talking to the device
+        self._collecting: asyncio.Task | None = None
+        self._in_flight: asyncio.Task | None = None
+
+    def async_submit(self, zone_id: int, value: str) -> asyncio.Task:
+        """Queue a zone change and return the task of the write carrying it."""
+        stats = self._coordinator.command_stats
+        stats.commands += 1
+        self._pending[zone_id] = value
+        if self._collecting is not None:
+            stats.merged += 1
+            return self._collecting
+        self._collecting = self._hass.async_create_task(
+            self._async_write(self._in_flight),
+            name=f"daikin_set_zones_{self._coordinator.name}",
+        )
+        return self._collecting
+
+    async def _async_write(self, previous: asyncio.Task | None) -> None:
+        """Send the merged zone changes once the window has closed."""
+        if previous is not None:
+            # Only ordering matters here; the previous write's outcome was
+            # already delivered to its own callers.
+            await asyncio.wait((previous,))
+        await asyncio.sleep(COMMAND_MERGE_WINDOW)
+        self._in_flight, self._collecting = self._collecting, None
+        changes, self._pending = self._pending, {}
+        self._coordinator.command_stats.writes += 1
+        device = self._coordinator.device
+        _LOGGER.debug("Setting zones %s on %s", changes, self._coordinator.name)
+        async with self._coordinator.async_track_write(
+            {DAIKIN_ATTR_ZONE_ONOFF: changes}
+        ):
+            if isinstance(device, DaikinAirBase):
+                await self._async_set_airbase_zones(device, changes)
+            else:
+                # SkyFi sets one zone per request, without reading first
+                for zone_id, value in changes.items():
+                    await device.set_zone(zone_id, DAIKIN_ATTR_ZONE_ONOFF, value)
+        # The write updated the zone values in device.values
+        self._coordinator.async_refresh_data()
+
+    @staticmethod
+    async def _async_set_airbase_zones(
+        device: DaikinAirBase, changes: dict[int, str]
+    ) -> None:
+        """Apply all changes in one zone setting read-modify-write.
+
+        DaikinAirBase.set_zone() for several zones at once. pydaikin only
+        offers it for a single zone, and each call reads the zone setting
+        anew, so calling it per zone would cost two requests per zone. The
+        read goes through update_status(); only the write itself, the request
+        set_zone() sends, has no public counterpart.
+        """
+        await device.update_status([ZONE_SETTING_RESOURCE], force_refresh=True)
+        zone_onoff = device.represent(DAIKIN_ATTR_ZONE_ONOFF)[1]
+        for zone_id, value in changes.items():
+            zone_onoff[zone_id] = value
+        device.values[DAIKIN_ATTR_ZONE_ONOFF] = quote(";".join(zone_onoff)).lower()
+
+        params = {
+            key: device.values[key]
+            for key in ("zone_name", DAIKIN_ATTR_ZONE_ONOFF)
+        }
+        if device.support_zone_temperature:
+            params["lztemp_c"] = device.values["lztemp_c"]
+            params["lztemp_h"] = device.values["lztemp_h"]
+        # Query string built by hand, as pydaikin does: yarl would encode the
+        # %20 in zone names a second time
+        params_str = "&".join(f"{key}={value}" for key, value in params.items())
+        await device._get_resource(f"aircon/set_zone_setting?{params_str}")  # noqa: SLF001
+
+
 class DaikinZoneSwitch(DaikinEntity, SwitchEntity):
     """Representation of a zone."""
 
     _attr_translation_key = "zone"
-
-    def __init__(self, coordinator: DaikinCoordinator, zone_id: int) -> None:
+    # AirBase and SkyFi zone values
+    _update_keys = frozenset(
+        ("zone_name", "zone_onoff", "zone", "nz", *(f"zone{i}" for i in range(1, 9)))
+    )
+
+    def __init__(
+        self,
+        coordinator: DaikinCoordinator,
+        zone_batcher: DaikinZoneBatcher,
+        zone_id: int,
+    ) -> None:
         """Initialize the zone."""
         super().__init__(coordinator)
+        self._zone_batcher = zone_batcher
         self._zone_id = zone_id
         self._attr_unique_id = f"{self.device.mac}-zone{zone_id}"
 
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
-        return self.device.zones[self._zone_id][0]
+        return self.coordinator.data.zones[self._zone_id][0]
 
     @property
     def is_on(self) -> bool:
         """Return the state of the sensor."""
-        return self.device.zones[self._zone_id][1] == "1"
+        return self.coordinator.data.zones[self._zone_id][1] == "1"
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the zone on."""
-        await self.device.set_zone(self._zone_id, "zone_onoff", "1")
+        await self._async_set("1")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the zone off."""
-        await self.device.set_zone(self._zone_id, "zone_onoff", "0")
+        await self._async_set("0")
+
+    async def _async_set(self, value: str) -> None:
+        """Queue the zone change and wait for the write carrying it."""
+        self.coordinator.async_note_command()
+        # Shielded: the write may carry other zones' changes, which must not
+        # be cancelled along with this caller
+        await asyncio.shield(self._zone_batcher.async_submit(self._zone_id, value))
+        self.async_write_ha_state()
 
 
 class DaikinStreamerSwitch(DaikinEntity, SwitchEntity):
@@ -80,6 +192,7 @@ class DaikinStreamerSwitch(DaikinEntity, SwitchEntity):
 
     _attr_name = "Streamer"
     _attr_translation_key = "streamer"
+    _update_keys = frozenset((DAIKIN_ATTR_ADVANCED,))
 
     def __init__(self, coordinator: DaikinCoordinator) -> None:
         """Initialize switch."""
@@ -89,21 +202,30 @@ class DaikinStreamerSwitch(DaikinEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return the state of the sensor."""
-        return DAIKIN_ATTR_STREAMER in self.device.represent(DAIKIN_ATTR_ADVANCED)[1]
+        return DAIKIN_ATTR_STREAMER in self.coordinator.data.advanced
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the zone on."""
-        await self.device.set_streamer("on")
+        await self._async_set("on")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the zone off."""
-        await self.device.set_streamer("off")
+        await self._async_set("off")
+
+    async def _async_set(self, value: str) -> None:
+        """Set the streamer, timed and traced like the other writes."""
+        self.coordinator.async_note_command()
+        async with self.coordinator.async_track_write({DAIKIN_ATTR_STREAMER: value}):
+            await self.device.set_streamer(value)
+        self.coordinator.async_refresh_data()
+        self.async_write_ha_state()
 
 
 class DaikinToggleSwitch(DaikinEntity, SwitchEntity):
     """Switch state."""
 
     _attr_translation_key = "toggle"
+    _update_keys = frozenset(("pow", DAIKIN_ATTR_MODE))
 
     def __init__(self, coordinator: DaikinCoordinator) -> None:
         """Initialize switch."""
@@ -113,64 +235,39 @@ class DaikinToggleSwitch(DaikinEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return the state of the sensor."""
-        return "off" not in self.device.represent(DAIKIN_ATTR_MODE)
-
-    def _climate_entity_id(self) -> str | None:
-        """Return the climate entity for this device (unique_id IS device.mac)."""
-        return er.async_get(self.hass).async_get_entity_id(
-            "climate", DOMAIN, self.device.mac
-        )
-
-    def _usable_climate_entity_id(self) -> str | None:
-        """Return the climate entity_id only if it is actually loaded.
-
-        A disabled/unloaded climate entity still resolves in the registry, but
-        a blocking service call against it silently no-ops — so also require a
-        live state object before routing through the climate services.
-        """
-        entity_id = self._climate_entity_id()
-        if entity_id is not None and self.hass.states.get(entity_id) is not None:
-            return entity_id
-        return None
+        return self.coordinator.data.mode != "off"
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the device on.
 
-        Route through the climate entity's turn_on service so all override
-        bookkeeping (_last_any_command_time, expected state, optimistic UI,
-        last-active-mode restore) applies in one place — calling device.set()
-        directly here fired false physical-remote overrides.
+        Route through the climate entity so all override bookkeeping
+        (command grace, expected state, optimistic UI, last-active-mode
+        restore) applies in one place — calling device.set() directly here
+        fired false physical-remote overrides.
         """
-        if (entity_id := self._usable_climate_entity_id()) is not None:
-            await self.hass.services.async_call(
-                "climate",
-                SERVICE_TURN_ON,
-                {ATTR_ENTITY_ID: entity_id},
-                blocking=True,
-            )
+        if (climate := self.coordinator.climate) is not None:
+            await climate.async_turn_on()
             return
-        _LOGGER.warning(
-            "Climate entity not found or not loaded for %s, sending raw command",
-            self.device.mac,
-        )
-        await self.device.set({DAIKIN_ATTR_MODE: "auto"})
+        await self._async_set_raw("auto")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the device off.
 
-        Routed through climate.turn_off for the same bookkeeping reasons as
-        async_turn_on.
+        Routed through the climate entity for the same bookkeeping reasons
+        as async_turn_on.
         """
-        if (entity_id := self._usable_climate_entity_id()) is not None:
-            await self.hass.services.async_call(
-                "climate",
-                SERVICE_TURN_OFF,
-                {ATTR_ENTITY_ID: entity_id},
-                blocking=True,
-            )
+        if (climate := self.coordinator.climate) is not None:
+            await climate.async_turn_off()
             return
+        await self._async_set_raw("off")
+
+    async def _async_set_raw(self, mode: str) -> None:
+        """Set the mode directly, for when the climate entity is not loaded."""
         _LOGGER.warning(
             "Climate entity not found or not loaded for %s, sending raw command",
             self.device.mac,
         )
-        await self.device.set({DAIKIN_ATTR_MODE: "off"})
+        self.coordinator.async_note_command()
+        payload = {DAIKIN_ATTR_MODE: mode}
+        async with self.coordinator.async_track_write(payload):
+            await self.device.set(payload)
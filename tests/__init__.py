@@ -0,0 +1,54 @@
+"""Tests for the Daikin integration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.daikin.const import DOMAIN
+
+from .simulator import SimulatedAdapter
+
+
+def add_unit_entry(
+    hass: HomeAssistant,
+    unit: SimulatedAdapter,
+    options: Mapping[str, Any] | None = None,
+) -> MockConfigEntry:
+    """Add the config entry the config flow would create for a simulated unit."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=unit.mac,
+        title=unit.name,
+        data=unit.entry_data,
+        options=options or {},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def async_setup_unit(
+    hass: HomeAssistant,
+    unit: SimulatedAdapter,
+    options: Mapping[str, Any] | None = None,
+) -> MockConfigEntry:
+    """Set up the config entry of a simulated unit."""
+    entry = add_unit_entry(hass, unit, options)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+def entity_id(hass: HomeAssistant, entry: MockConfigEntry, platform: str) -> str:
+    """Return the entity id of an entry's first entity on a platform."""
+    return next(
+        entity.entity_id
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+        if entity.domain == platform
+    )
@@ -0,0 +1,117 @@
+"""Fixtures for the Daikin benchmarks.
+
+Entities are set up against a fake Appliance of each family: the real
+pydaikin class, with its HTTP requests answered in-process by a simulated
+adapter, so the measurements cover the integration and pydaikin's decoding
+without any network round trip.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Callable
+import tracemalloc
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import parse_qsl
+
+from aiohttp import ClientSession
+from aiohttp.web_exceptions import HTTPForbidden
+from pydaikin.daikin_base import Appliance
+from pydaikin.daikin_brp084 import DaikinBRP084
+import pytest
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.daikin.store import DEVICE_TYPES, create_device
+
+from .. import async_setup_unit
+from ..simulator import ADAPTERS, DaikinSimulator, SimulatedAdapter
+
+
+def fake_appliance(unit: SimulatedAdapter) -> Appliance:
+    """Return the pydaikin appliance of a unit, answered in-process."""
+    device = create_device(
+        DEVICE_TYPES[unit.family],
+        unit.entry_data,
+        MagicMock(spec=ClientSession),
+        ssl_context=None,
+    )
+
+    if isinstance(device, DaikinBRP084):
+
+        async def _get_resource(
+            path: str, params: dict[str, Any] | None = None
+        ) -> dict[str, Any]:
+            _, body = unit.respond("POST", "dsiot/multireq", {}, params, device.headers)
+            return body
+
+        device._get_resource = _get_resource  # noqa: SLF001
+        return device
+
+    # Replaces the HTTP request below pydaikin's request coalescing and the
+    # AirBase path prefix; answers as the adapter's status codes would be
+    async def _do_get_resource(path: str, params: dict[str, Any]) -> dict[str, Any]:
+        path, _, query = path.partition("?")
+        query_params = dict(parse_qsl(query))
+        query_params.update((key, str(value)) for key, value in params.items())
+        status, body = unit.respond("GET", path, query_params, None, device.headers)
+        if status == 403:
+            raise HTTPForbidden
+        if status == 404:
+            return {}
+        return device.parse_response(body)
+
+    device._do_get_resource = _do_get_resource  # noqa: SLF001
+    return device
+
+
+@pytest.fixture(params=list(ADAPTERS))
+async def unit_entry(
+    hass: HomeAssistant, request: pytest.FixtureRequest
+) -> AsyncGenerator[MockConfigEntry]:
+    """Set up a unit of each family against its fake appliance."""
+    unit = DaikinSimulator().add_unit(request.param)
+    device = fake_appliance(unit)
+    await device.init()
+    with patch(
+        "custom_components.daikin.DaikinFactory", AsyncMock(return_value=device)
+    ):
+        entry = await async_setup_unit(hass, unit)
+    yield entry
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.fixture
+def record_allocations(benchmark: Any) -> Callable[..., None]:
+    """Return a recorder of the allocations of a benchmarked call.
+
+    Runs the call under tracemalloc (apart from the timed rounds, which it
+    would slow down) and adds to the benchmark's extra info the peak memory
+    of the calls and the blocks and bytes they left allocated, per call.
+    """
+    # The snapshots themselves are not the call's allocations
+    untraced = (tracemalloc.Filter(False, tracemalloc.__file__),)
+
+    def _record(func: Callable[..., Any], *args: Any, rounds: int = 100) -> None:
+        func(*args)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot().filter_traces(untraced)
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            for _ in range(rounds):
+                func(*args)
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(untraced)
+        finally:
+            tracemalloc.stop()
+        retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+        benchmark.extra_info.update(
+            peak_bytes=peak - baseline,
+            retained_blocks_per_call=retained / rounds,
+            retained_bytes_per_call=(current - baseline) / rounds,
+        )
+
+    return _record
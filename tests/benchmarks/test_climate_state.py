@@ -0,0 +1,49 @@
+"""Benchmark of the climate state transitions run on every poll.
+
+Run with ``pytest tests/benchmarks/test_climate_state.py --benchmark-only``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from custom_components.daikin.climate_state import (
+    DaikinClimateState,
+    DeviceReading,
+    observe,
+    record_optimistic,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+READING = DeviceReading(
+    success=True,
+    power="1",
+    hvac_mode="cool",
+    active_mode="cool",
+    target_temperature=None,
+    fan_mode=None,
+    swing_mode=None,
+)
+
+
+@pytest.mark.parametrize("optimistic", [False, True], ids=["idle", "optimistic"])
+def test_observe(benchmark: Any, optimistic: bool) -> None:
+    """Benchmark a poll that changed nothing, with and without pending values.
+
+    The optimistic values are never confirmed and the time stands still, so
+    each round compares them and none expires.
+    """
+    state = DaikinClimateState(
+        init_at=0.0, last_known_power="1", last_coordinator_success=True
+    )
+    reading = READING
+    if optimistic:
+        record_optimistic(
+            state, 1000.0, target_temp=21.0, hvac_mode="heat", fan_mode="Auto"
+        )
+        reading = READING._replace(target_temperature=24.0, fan_mode="Silence")
+
+    benchmark(lambda: observe(state, reading, 1000.0, "climate.benchmark"))
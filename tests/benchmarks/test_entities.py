@@ -0,0 +1,164 @@
+"""Benchmarks of the per-poll and per-command work of the Daikin entities.
+
+Run with ``pytest tests/benchmarks --benchmark-only``; the extra info of each
+benchmark carries the tracemalloc figures of the same call.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import nullcontext
+import itertools
+from operator import attrgetter
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.climate import (
+    ATTR_TEMPERATURE,
+    DATA_COMPONENT as CLIMATE_COMPONENT,
+    DOMAIN as CLIMATE_DOMAIN,
+)
+from homeassistant.components.sensor import (
+    DATA_COMPONENT as SENSOR_COMPONENT,
+    DOMAIN as SENSOR_DOMAIN,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.daikin.climate import DaikinClimate
+from custom_components.daikin.coordinator import DaikinCoordinator
+from custom_components.daikin.data import DaikinData
+from custom_components.daikin.sensor import DaikinSensor
+
+from .. import entity_id
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _climate(hass: HomeAssistant, entry: MockConfigEntry) -> DaikinClimate:
+    """Return the climate entity of an entry."""
+    return hass.data[CLIMATE_COMPONENT].get_entity(
+        entity_id(hass, entry, CLIMATE_DOMAIN)
+    )
+
+
+def _sensors(hass: HomeAssistant, entry: MockConfigEntry) -> list[DaikinSensor]:
+    """Return the data sensors of an entry."""
+    component = hass.data[SENSOR_COMPONENT]
+    sensors = [
+        component.get_entity(entity.entity_id)
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+        if entity.domain == SENSOR_DOMAIN
+    ]
+    # Not the diagnostic sensors, which read the coordinator's statistics
+    return [sensor for sensor in sensors if isinstance(sensor, DaikinSensor)]
+
+
+def test_climate_coordinator_update(
+    hass: HomeAssistant,
+    unit_entry: MockConfigEntry,
+    benchmark: Any,
+    record_allocations: Callable[..., None],
+) -> None:
+    """Benchmark the climate entity handling a poll that changed nothing."""
+    handle = _climate(hass, unit_entry)._handle_coordinator_update  # noqa: SLF001
+    benchmark(handle)
+    record_allocations(handle)
+
+
+@pytest.mark.parametrize("per_read", [False, True], ids=["per_poll", "per_read"])
+def test_climate_write_state(
+    hass: HomeAssistant,
+    unit_entry: MockConfigEntry,
+    benchmark: Any,
+    record_allocations: Callable[..., None],
+    per_read: bool,
+) -> None:
+    """Benchmark a state write of the climate entity.
+
+    per_read decodes the device values on every read of the poll's data, as
+    the properties did before they shared one DaikinData per poll.
+    """
+    write = _climate(hass, unit_entry).async_write_ha_state
+    with patch.object(
+        DaikinCoordinator,
+        "data",
+        property(lambda coordinator: DaikinData.from_device(coordinator.device)),
+        create=True,
+    ) if per_read else nullcontext():
+        benchmark(write)
+        record_allocations(write)
+
+
+def test_climate_hvac_mode(
+    hass: HomeAssistant,
+    unit_entry: MockConfigEntry,
+    benchmark: Any,
+    record_allocations: Callable[..., None],
+) -> None:
+    """Benchmark reading the HVAC mode."""
+    climate = _climate(hass, unit_entry)
+    get = attrgetter("hvac_mode")
+    benchmark(get, climate)
+    record_allocations(get, climate)
+
+
+def test_climate_extra_state_attributes(
+    hass: HomeAssistant,
+    unit_entry: MockConfigEntry,
+    benchmark: Any,
+    record_allocations: Callable[..., None],
+) -> None:
+    """Benchmark reading the extra state attributes."""
+    climate = _climate(hass, unit_entry)
+    get = attrgetter("extra_state_attributes")
+    benchmark(get, climate)
+    record_allocations(get, climate)
+
+
+def test_sensor_native_value(
+    hass: HomeAssistant,
+    unit_entry: MockConfigEntry,
+    benchmark: Any,
+    record_allocations: Callable[..., None],
+) -> None:
+    """Benchmark reading the value of every data sensor of a unit."""
+    sensors = _sensors(hass, unit_entry)
+    assert sensors
+
+    def read_all() -> None:
+        for sensor in sensors:
+            _ = sensor.native_value
+
+    benchmark(read_all)
+    record_allocations(read_all)
+
+
+def test_climate_set(
+    hass: HomeAssistant,
+    unit_entry: MockConfigEntry,
+    benchmark: Any,
+    record_allocations: Callable[..., None],
+) -> None:
+    """Benchmark a temperature command, from _set() to the adapter's answer.
+
+    The merge window is a fixed wait, not work, and is left out. Targets
+    alternate so no command is skipped as redundant.
+    """
+    climate = _climate(hass, unit_entry)
+    targets = itertools.cycle((21, 22))
+
+    def send() -> None:
+        hass.loop.run_until_complete(
+            climate._set({ATTR_TEMPERATURE: next(targets)})  # noqa: SLF001
+        )
+
+    with patch("custom_components.daikin.climate.COMMAND_MERGE_WINDOW", 0):
+        benchmark.pedantic(send, rounds=50, warmup_rounds=2)
+        record_allocations(send, rounds=20)
+    assert unit_entry.runtime_data.command_stats.writes >= 50
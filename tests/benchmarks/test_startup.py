@@ -0,0 +1,82 @@
+"""Benchmark of setting up many config entries at once, as at startup.
+
+Compares the shared SSL context with building one per entry, as every entry
+did before it was shared. Run with
+``pytest tests/benchmarks/test_startup.py --benchmark-only``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.daikin import ssl_context
+from custom_components.daikin.ssl_context import get_daikin_ssl_context
+
+from .. import add_unit_entry
+from ..simulator import DaikinSimulator
+from .conftest import fake_appliance
+
+pytest.importorskip("pytest_benchmark")
+
+# Entries set up per round
+ENTRIES = 20
+
+
+async def _async_build_ssl_context(hass: HomeAssistant) -> ssl.SSLContext:
+    """Build a context per call, like every entry did before it was shared."""
+    return await hass.async_add_executor_job(get_daikin_ssl_context)
+
+
+@pytest.mark.parametrize("shared", [True, False], ids=["shared", "per_entry"])
+def test_setup_entries(hass: HomeAssistant, benchmark: Any, shared: bool) -> None:
+    """Benchmark setting up ENTRIES entries concurrently."""
+    units = [DaikinSimulator().add_unit("DaikinBRP069") for _ in range(ENTRIES)]
+    devices = {unit.host: fake_appliance(unit) for unit in units}
+    for device in devices.values():
+        hass.loop.run_until_complete(device.init())
+
+    def add_entries() -> tuple[tuple[Any, ...], dict[str, Any]]:
+        # Every round starts cold: new entries and no context built yet
+        ssl_context._SSL_CONTEXT = None  # noqa: SLF001
+        return ([add_unit_entry(hass, unit) for unit in units],), {}
+
+    async def _async_setup(entries: list[Any]) -> None:
+        await asyncio.gather(
+            *(hass.config_entries.async_setup(entry.entry_id) for entry in entries)
+        )
+        await hass.async_block_till_done()
+
+    entries_per_round = []
+
+    def setup(entries: list[Any]) -> None:
+        hass.loop.run_until_complete(_async_setup(entries))
+        entries_per_round.append(entries)
+
+    with (
+        patch(
+            "custom_components.daikin.DaikinFactory",
+            AsyncMock(side_effect=lambda host, *args, **kwargs: devices[host]),
+        ),
+        patch(
+            "custom_components.daikin.async_get_daikin_ssl_context",
+            ssl_context.async_get_daikin_ssl_context
+            if shared
+            else _async_build_ssl_context,
+        ),
+    ):
+        benchmark.pedantic(setup, setup=add_entries, rounds=5)
+
+    for entries in entries_per_round:
+        assert all(entry.runtime_data.connected for entry in entries)
+        for entry in entries:
+            hass.loop.run_until_complete(
+                hass.config_entries.async_remove(entry.entry_id)
+            )
+    hass.loop.run_until_complete(hass.async_block_till_done())
@@ -0,0 +1,102 @@
+"""Fixtures for the Daikin tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Callable
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from .simulator import DaikinSimulator
+
+# Reports of the load runs, printed in the terminal summary
+LOAD_REPORTS = pytest.StashKey[list[str]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the options of the load run."""
+    group = parser.getgroup("daikin-load", "Daikin load harness")
+    group.addoption(
+        "--load", action="store_true", help="run the tests marked load"
+    )
+    group.addoption("--load-units", type=int, default=8, help="simulated units")
+    group.addoption(
+        "--load-duration", type=float, default=15.0, help="seconds to measure"
+    )
+    group.addoption(
+        "--load-latency", type=float, default=0.05, help="adapter latency (s)"
+    )
+    group.addoption(
+        "--load-jitter", type=float, default=0.02, help="adapter jitter (s)"
+    )
+    group.addoption(
+        "--load-timeout-rate",
+        type=float,
+        default=0.0,
+        help="share of unanswered requests",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip the load runs unless asked for; they take a while."""
+    if config.getoption("--load"):
+        return
+    skip = pytest.mark.skip(reason="load run, pass --load to run it")
+    for item in items:
+        if "load" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter,
+    exitstatus: int,
+    config: pytest.Config,
+) -> None:
+    """Print the reports of the load runs."""
+    if not (reports := config.stash.get(LOAD_REPORTS, None)):
+        return
+    terminalreporter.section("Daikin load")
+    for report in reports:
+        terminalreporter.write_line(report)
+
+
+@pytest.fixture
+def load_report(request: pytest.FixtureRequest) -> Callable[[object], None]:
+    """Return a callback recording a report for the terminal summary."""
+    reports = request.config.stash.setdefault(LOAD_REPORTS, [])
+
+    def _record(report: object) -> None:
+        reports.append(f"{request.node.nodeid}\n{report}")
+
+    return _record
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    recorder_mock: None, enable_custom_integrations: None
+) -> None:
+    """Enable the integration, with the recorder its energy import writes to."""
+
+
+@pytest.fixture
+async def simulator(
+    hass: HomeAssistant, socket_enabled: None
+) -> AsyncGenerator[DaikinSimulator]:
+    """Serve simulated adapters and route the integration's requests to them."""
+    simulator = DaikinSimulator()
+    await simulator.async_start()
+    # DaikinFactory looks every host up with a blocking UDP discovery (seconds
+    # on the event loop) that no simulated unit answers
+    with (
+        patch(
+            "custom_components.daikin.async_get_clientsession",
+            return_value=simulator.session,
+        ),
+        patch("pydaikin.factory.get_name", return_value=None),
+    ):
+        yield simulator
+    await simulator.async_stop()
@@ -0,0 +1,172 @@
+"""Load harness: many simulated units polled by real coordinators.
+
+Sets up one config entry per simulated unit, lets the coordinators poll for a
+while and sends a climate command at a fixed interval, measuring what a large
+installation costs the event loop:
+
+- poll throughput, from the status reads the simulated adapters served
+- event loop lag, as the oversleep of a task that wakes every LAG_INTERVAL
+- poll scheduling lag and slot waits, from the poll orchestrator
+- command latency, from the service call to its return
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+import itertools
+import time
+
+from homeassistant.components.climate import ATTR_TEMPERATURE, SERVICE_SET_TEMPERATURE
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+
+from custom_components.daikin.orchestrator import async_get_poll_orchestrator
+from custom_components.daikin.stats import DaikinCallStats
+
+from . import add_unit_entry, entity_id
+from .simulator import ADAPTERS, AdapterProfile, DaikinSimulator
+
+# How often the lag sampler wakes (seconds)
+LAG_INTERVAL = 0.05
+# Samples kept per measurement; enough for any run of the harness
+SAMPLES = 100_000
+
+
+def _ms(seconds: float | None) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.1f} ms"
+
+
+@dataclass(kw_only=True)
+class LoadReport:
+    """What one load run measured."""
+
+    units: int
+    duration: float
+    setup_time: float
+    polls: int
+    requests: int
+    unavailable: int
+    loop_lag: DaikinCallStats
+    tick_lag: DaikinCallStats
+    slot_wait: DaikinCallStats
+    commands: DaikinCallStats
+
+    @property
+    def polls_per_second(self) -> float:
+        """Return the status reads served per second."""
+        return self.polls / self.duration
+
+    @property
+    def requests_per_second(self) -> float:
+        """Return the requests served per second."""
+        return self.requests / self.duration
+
+    def __str__(self) -> str:
+        """Return the report as a table."""
+        rows = [
+            ("units", f"{self.units} ({self.unavailable} unavailable at the end)"),
+            ("setup", f"{self.setup_time:.2f} s"),
+            ("polls", f"{self.polls} ({self.polls_per_second:.2f}/s)"),
+            ("requests", f"{self.requests} ({self.requests_per_second:.2f}/s)"),
+        ]
+        for label, stats in (
+            ("loop lag", self.loop_lag),
+            ("poll tick lag", self.tick_lag),
+            ("poll slot wait", self.slot_wait),
+            ("command latency", self.commands),
+        ):
+            rows.append(
+                (
+                    label,
+                    f"n={stats.count} p50={_ms(stats.percentile(50))} "
+                    f"p95={_ms(stats.percentile(95))} "
+                    f"max={_ms(stats.percentile(100))}",
+                )
+            )
+        width = max(len(label) for label, _ in rows)
+        return "\n".join(f"{label:<{width}}  {value}" for label, value in rows)
+
+
+async def _async_sample_lag(stats: DaikinCallStats) -> None:
+    """Record how late the loop wakes a sleeping task, until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(LAG_INTERVAL)
+        stats.record(max(loop.time() - started - LAG_INTERVAL, 0.0))
+
+
+async def async_run_load(
+    hass: HomeAssistant,
+    simulator: DaikinSimulator,
+    *,
+    units: int,
+    duration: float,
+    families: Iterable[str] = tuple(ADAPTERS),
+    profile: AdapterProfile | None = None,
+    command_interval: float = 1.0,
+) -> LoadReport:
+    """Poll units of the given families (round-robin) and report the load."""
+    added = [
+        simulator.add_unit(
+            family, profile=AdapterProfile(**vars(profile)) if profile else None
+        )
+        for family, _ in zip(itertools.cycle(families), range(units), strict=False)
+    ]
+    entries = [add_unit_entry(hass, unit) for unit in added]
+
+    started = time.monotonic()
+    await asyncio.gather(
+        *(hass.config_entries.async_setup(entry.entry_id) for entry in entries)
+    )
+    await hass.async_block_till_done()
+    setup_time = time.monotonic() - started
+
+    climates = [entity_id(hass, entry, CLIMATE_DOMAIN) for entry in entries]
+    polls = {unit.host: unit.polls for unit in added}
+    requests = {unit.host: unit.requests.total() for unit in added}
+    loop_lag = DaikinCallStats(SAMPLES)
+    commands = DaikinCallStats(SAMPLES)
+    sampler = asyncio.create_task(_async_sample_lag(loop_lag))
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+    targets = itertools.cycle((21, 22, 23, 24))
+    for climate in itertools.cycle(climates):
+        if (remaining := deadline - loop.time()) <= 0:
+            break
+        sent = loop.time()
+        async with commands.async_track():
+            await hass.services.async_call(
+                CLIMATE_DOMAIN,
+                SERVICE_SET_TEMPERATURE,
+                {ATTR_ENTITY_ID: climate, ATTR_TEMPERATURE: next(targets)},
+                blocking=True,
+            )
+        await asyncio.sleep(
+            min(max(command_interval - (loop.time() - sent), 0), remaining)
+        )
+
+    sampler.cancel()
+    orchestrator = async_get_poll_orchestrator(hass)
+    report = LoadReport(
+        units=units,
+        duration=duration,
+        setup_time=setup_time,
+        polls=sum(unit.polls - polls[unit.host] for unit in added),
+        requests=sum(unit.requests.total() - requests[unit.host] for unit in added),
+        unavailable=sum(
+            hass.states.get(climate).state == STATE_UNAVAILABLE for climate in climates
+        ),
+        loop_lag=loop_lag,
+        tick_lag=orchestrator.tick_lag_stats,
+        slot_wait=orchestrator.slot_wait_stats,
+        commands=commands,
+    )
+    for entry in entries:
+        await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    return report
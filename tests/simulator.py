@@ -0,0 +1,764 @@
+"""In-process simulator of Daikin Wi-Fi adapters.
+
+Serves the HTTP APIs of the adapter families DaikinFactory detects (BRP069,
+BRP072C over HTTPS with a key, BRP084 and AirBase) from one local aiohttp
+server, so the integration can be set up against any number of units without
+hardware. Every unit gets a host name under SIM_DOMAIN; the client session of
+the simulator resolves those names to the local server, on its HTTP or HTTPS
+port depending on the port the client asked for.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+import random
+import socket
+import ssl
+import tempfile
+from typing import Any, ClassVar
+from urllib.parse import quote
+
+from aiohttp import ClientSession, TCPConnector, web
+from aiohttp.abc import AbstractResolver, ResolveResult
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+SIM_DOMAIN = "daikin.test"
+
+# Answer of a request the adapter did not understand or rejected
+PARAM_NG = "ret=PARAM NG"
+
+type Response = tuple[int, str | dict[str, Any]]
+
+
+@dataclass(kw_only=True)
+class AdapterProfile:
+    """How a simulated adapter answers."""
+
+    # Seconds before an answer, +/- up to jitter
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Share of requests that are never answered (the client times out)
+    timeout_rate: float = 0.0
+    # How long an unanswered request keeps the adapter busy (seconds)
+    hang: float = 60.0
+    # Requests served at once, the rest queue (BRP069 firmware serves one)
+    max_concurrency: int = 1
+
+
+def _encode(values: Mapping[str, str]) -> str:
+    """Return a 'ret=OK,key=value,...' answer."""
+    return ",".join(("ret=OK", *(f"{key}={value}" for key, value in values.items())))
+
+
+def _hourly(values: list[int]) -> str:
+    return "/".join(map(str, values))
+
+
+class SimulatedAdapter:
+    """One simulated unit behind its Wi-Fi adapter."""
+
+    # Name of the pydaikin class DaikinFactory should detect
+    family: ClassVar[str]
+    # Port the family is reached on
+    port: ClassVar[int] = 80
+
+    def __init__(
+        self,
+        host: str,
+        mac: str,
+        name: str,
+        profile: AdapterProfile,
+        rng: random.Random,
+    ) -> None:
+        """Initialize the unit."""
+        self.host = host
+        self.mac = mac
+        self.name = name
+        self.profile = profile
+        self._rng = rng
+        self._semaphore = asyncio.Semaphore(profile.max_concurrency)
+        # Requests received per path
+        self.requests: Counter[str] = Counter()
+        # Status reads, one per poll of the integration
+        self.polls = 0
+
+    @property
+    def entry_data(self) -> dict[str, Any]:
+        """Return the config entry data the config flow would store."""
+        return {"host": self.host, "mac": self.mac}
+
+    async def async_handle(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, str],
+        body: Any,
+        headers: Mapping[str, str],
+    ) -> Response:
+        """Answer a request the way the adapter would, in its own time."""
+        self.requests[path] += 1
+        async with self._semaphore:
+            profile = self.profile
+            if profile.timeout_rate and self._rng.random() < profile.timeout_rate:
+                await asyncio.sleep(profile.hang)
+                return 503, ""
+            delay = profile.latency
+            if profile.jitter:
+                delay += self._rng.uniform(-profile.jitter, profile.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return self.respond(method, path, query, body, headers)
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, str],
+        body: Any,
+        headers: Mapping[str, str],
+    ) -> Response:
+        """Return the answer to a request, right away."""
+        raise NotImplementedError
+
+    def set_power(self, on: bool) -> None:
+        """Switch the unit on or off at the unit (e.g. with the IR remote)."""
+        raise NotImplementedError
+
+    def set_inside_temperature(self, celsius: float) -> None:
+        """Change the room temperature the unit measures."""
+        raise NotImplementedError
+
+
+class SimulatedBRP069(SimulatedAdapter):
+    """BRP069 adapter: 'key=value' answers to GET requests."""
+
+    family = "DaikinBRP069"
+    # Path prefix of every resource (AirBase: 'skyfi/')
+    prefix = ""
+
+    def __init__(self, *args: Any) -> None:
+        """Initialize the unit."""
+        super().__init__(*args)
+        self.basic_info = {
+            "type": "aircon",
+            "reg": "eu",
+            "dst": "1",
+            "ver": "1_14_88",
+            "rev": "4BD1B0C",
+            "pow": "1",
+            "err": "0",
+            "location": "0",
+            "name": quote(self.name),
+            "icon": "0",
+            "method": "home only",
+            "port": "30050",
+            "id": "",
+            "pw": "",
+            "lpw_flag": "0",
+            "adp_kind": "3",
+            "pv": "2",
+            "cpv": "2",
+            "cpv_minor": "00",
+            "led": "1",
+            "en_setzone": "1",
+            "mac": self.mac,
+            "adp_mode": "run",
+            "en_hol": "0",
+            "grp_name": "",
+            "en_grp": "0",
+        }
+        self.model_info = {
+            "model": "NOTSUPPORT",
+            "type": "N",
+            "pv": "2",
+            "cpv": "2",
+            "cpv_minor": "00",
+            "mid": "NA",
+            "humd": "0",
+            "s_humd": "0",
+            "acled": "0",
+            "land": "0",
+            "elec": "1",
+            "temp": "1",
+            "temp_rng": "0",
+            "m_dtct": "1",
+            "ac_dst": "--",
+            "disp_dry": "0",
+            "dmnd": "0",
+            "en_scdltmr": "1",
+            "en_frate": "1",
+            "en_fdir": "1",
+            "s_fdir": "3",
+            "en_rtemp_a": "0",
+            "en_spmode": "7",
+            "en_ipw_sep": "1",
+            "en_mompow": "0",
+        }
+        self.sensor_info = {
+            "htemp": "25.0",
+            "hhum": "-",
+            "otemp": "30.0",
+            "err": "0",
+            "cmpfreq": "20",
+        }
+        self.control_info = {
+            "pow": "1",
+            "mode": "3",
+            "adv": "",
+            "stemp": "24.0",
+            "shum": "0",
+            **{f"dt{mode}": "24.0" for mode in "0123457"},
+            **{f"dh{mode}": "0" for mode in "0123457"},
+            "dhh": "50",
+            "b_mode": "3",
+            "b_stemp": "24.0",
+            "b_shum": "0",
+            "alert": "255",
+            "f_rate": "A",
+            "f_dir": "0",
+            "b_f_rate": "A",
+            "b_f_dir": "0",
+            **{f"dfr{mode}": "A" for mode in "0123457"},
+            "dfrh": "5",
+            **{f"dfd{mode}": "0" for mode in "0123457"},
+            "dfdh": "0",
+        }
+        # Energy per hour of today and yesterday (0.1 kWh), per day of the
+        # last week (Wh) and per month (kWh)
+        self.day_power = {
+            "curr_day_heat": _hourly([0] * 24),
+            "prev_1day_heat": _hourly([0] * 24),
+            "curr_day_cool": _hourly([3] * 12 + [0] * 12),
+            "prev_1day_cool": _hourly([2] * 24),
+        }
+        self.week_power = {
+            "today_runtime": "182",
+            "datas": _hourly([4100, 3600, 0, 1200, 5100, 4800, 2200]),
+        }
+        self.year_power = {
+            "previous_year": _hourly([0, 0, 0, 4, 21, 63, 98, 87, 40, 6, 0, 0]),
+            "this_year": _hourly([0, 0, 0, 3, 18, 71, 104, 92, 45, 8]),
+        }
+        self._resources = {
+            "common/basic_info": lambda query: self.basic_info,
+            "common/get_datetime": self._get_datetime,
+            "common/notify_date_time": lambda query: {},
+            "common/set_holiday": self._set_holiday,
+            "aircon/get_model_info": lambda query: self.model_info,
+            "aircon/get_sensor_info": self._get_sensor_info,
+            "aircon/get_control_info": lambda query: self.control_info,
+            "aircon/set_control_info": self._set_control_info,
+            "aircon/set_special_mode": self._set_special_mode,
+            "aircon/get_day_power_ex": lambda query: self.day_power,
+            "aircon/get_week_power": lambda query: self.week_power,
+            "aircon/get_year_power": lambda query: self.year_power,
+        }
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, str],
+        body: Any,
+        headers: Mapping[str, str],
+    ) -> Response:
+        """Return the answer to a request, right away."""
+        if (
+            method != "GET"
+            or not path.startswith(self.prefix)
+            or (resource := self._resources.get(path.removeprefix(self.prefix)))
+            is None
+        ):
+            return 404, ""
+        if (values := resource(query)) is None:
+            return 200, PARAM_NG
+        return 200, _encode(values)
+
+    def _get_datetime(self, query: Mapping[str, str]) -> dict[str, str]:
+        # sta=2: the adapter's clock is set
+        now = datetime.now(UTC)
+        return {"sta": "2", "cur": now.strftime("%Y/%m/%d %H:%M:%S"), "reg": "eu"}
+
+    def _get_sensor_info(self, query: Mapping[str, str]) -> dict[str, str]:
+        self.polls += 1
+        return self.sensor_info
+
+    def _set_control_info(self, query: Mapping[str, str]) -> dict[str, str] | None:
+        control = self.control_info
+        if not all(key in query for key in ("pow", "mode", "stemp", "shum")):
+            return None
+        control.update((key, value) for key, value in query.items() if key in control)
+        # The unit remembers the settings of each mode
+        mode = control["mode"]
+        for key, memory in (("stemp", "dt"), ("shum", "dh"), ("f_rate", "dfr")):
+            if f"{memory}{mode}" in control and key in query:
+                control[f"{memory}{mode}"] = query[key]
+        self.basic_info["pow"] = control["pow"]
+        return {}
+
+    def _set_holiday(self, query: Mapping[str, str]) -> dict[str, str] | None:
+        if query.get("en_hol") not in ("0", "1"):
+            return None
+        self.basic_info["en_hol"] = query["en_hol"]
+        return {}
+
+    def _set_special_mode(self, query: Mapping[str, str]) -> dict[str, str] | None:
+        # adv lists the active modes: 2 powerful, 12 econo, 13 streamer
+        active = set(filter(None, self.control_info["adv"].split("/")))
+        if "en_streamer" in query:
+            changes = {"13": query["en_streamer"] == "1"}
+        elif (kind := {"0": "13", "1": "2", "2": "12"}.get(query.get("spmode_kind"))):
+            changes = {kind: query.get("set_spmode") == "1"}
+            if changes[kind] and kind in ("2", "12"):
+                # Powerful and econo exclude each other
+                active.discard("12" if kind == "2" else "2")
+        else:
+            return None
+        for mode, on in changes.items():
+            if on:
+                active.add(mode)
+            else:
+                active.discard(mode)
+        adv = "/".join(sorted(active, key=int))
+        self.control_info["adv"] = adv
+        return {"adv": adv}
+
+    def set_power(self, on: bool) -> None:
+        """Switch the unit on or off at the unit (e.g. with the IR remote)."""
+        self.control_info["pow"] = self.basic_info["pow"] = "1" if on else "0"
+
+    def set_inside_temperature(self, celsius: float) -> None:
+        """Change the room temperature the unit measures."""
+        self.sensor_info["htemp"] = f"{celsius:.1f}"
+
+
+class SimulatedBRP072C(SimulatedBRP069):
+    """BRP072C adapter: the BRP069 API over HTTPS, for registered terminals.
+
+    A client registers its X-Daikin-uuid header with the key printed on the
+    adapter; requests from unregistered terminals are answered with 403.
+    """
+
+    family = "DaikinBRP072C"
+    port = 443
+
+    def __init__(self, *args: Any) -> None:
+        """Initialize the unit."""
+        super().__init__(*args)
+        self.key = f"{self._rng.getrandbits(64):016x}"
+        self.uuid = f"{self._rng.getrandbits(128):032x}"
+        # X-Daikin-uuid of the registered terminals
+        self.terminals: set[str] = set()
+
+    @property
+    def entry_data(self) -> dict[str, Any]:
+        """Return the config entry data the config flow would store."""
+        return {**super().entry_data, "api_key": self.key, "uuid": self.uuid}
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, str],
+        body: Any,
+        headers: Mapping[str, str],
+    ) -> Response:
+        """Return the answer to a request, right away."""
+        terminal = headers.get("X-Daikin-uuid", "")
+        if path == "common/register_terminal":
+            if query.get("key") != self.key:
+                return 200, PARAM_NG
+            self.terminals.add(terminal)
+            return 200, _encode({})
+        if terminal not in self.terminals:
+            return 403, ""
+        return super().respond(method, path, query, body, headers)
+
+
+class SimulatedAirBase(SimulatedBRP069):
+    """AirBase (BRP15B61) adapter: the BRP069 API under /skyfi, with zones."""
+
+    family = "DaikinAirBase"
+    prefix = "skyfi/"
+    ZONES = ("Living", "Kitchen", "Bed 1", "Bed 2")
+
+    def __init__(self, *args: Any) -> None:
+        """Initialize the unit."""
+        super().__init__(*args)
+        del self.basic_info["en_hol"]
+        self.model_info = {
+            "model": "NOTSUPPORT",
+            "type": "N",
+            "pv": "3",
+            "cpv": "3",
+            "mid": "NA",
+            "s_fdir": "1",
+            "en_scdltmr": "1",
+            "en_frate": "1",
+            "frate_steps": "3",
+            "en_frate_auto": "1",
+            "en_zone": str(len(self.ZONES)),
+            "en_linear_zone": "0",
+            "en_filter_sign": "1",
+            "acled": "0",
+            "land": "0",
+            "elec": "0",
+            "temp": "1",
+            "m_dtct": "0",
+            "ac_dst": "--",
+            "dmnd": "0",
+            "en_temp_setting": "1",
+            "en_rtemp_a": "0",
+            "en_spmode": "0",
+            "en_ipw_sep": "0",
+            "en_mompow": "0",
+            "hmlmt_l": "10.0",
+        }
+        self.sensor_info = {"err": "0", "htemp": "22", "otemp": "-"}
+        # Modes: 0 fan, 1 heat, 2 cool, 3 auto (operate: 1/2), 7 dry
+        self.control_info = {
+            "pow": "1",
+            "mode": "2",
+            "operate": "2",
+            "bk_auto": "2",
+            "stemp": "23",
+            **{f"dt{mode}": "23" for mode in "01237"},
+            "shum": "0",
+            **{f"dh{mode}": "0" for mode in "01237"},
+            "f_rate": "1",
+            **{f"dfr{mode}": "1" for mode in "01237"},
+            "f_auto": "0",
+            **{f"auto{mode}": "0" for mode in "01237"},
+            "f_airside": "0",
+            "f_dir": "0",
+            "adv": "",
+        }
+        self.zone_setting = {
+            "zone_name": ";".join(self.ZONES),
+            "zone_onoff": ";".join("1" if i < 2 else "0" for i in range(len(self.ZONES))),
+            "lztemp_c": ";".join("23" for _ in self.ZONES),
+            "lztemp_h": ";".join("21" for _ in self.ZONES),
+        }
+        for resource in (
+            "common/set_holiday",
+            "aircon/set_special_mode",
+            "aircon/get_day_power_ex",
+            "aircon/get_week_power",
+            "aircon/get_year_power",
+        ):
+            del self._resources[resource]
+        self._resources["aircon/get_zone_setting"] = lambda query: {
+            key: quote(value) for key, value in self.zone_setting.items()
+        }
+        self._resources["aircon/set_zone_setting"] = self._set_zone_setting
+
+    def _set_control_info(self, query: Mapping[str, str]) -> dict[str, str] | None:
+        if (values := super()._set_control_info(query)) is not None:
+            control = self.control_info
+            if control["mode"] != "3":
+                control["operate"] = control["mode"]
+            control[f"auto{control['mode']}"] = control["f_auto"]
+        return values
+
+    def _set_zone_setting(self, query: Mapping[str, str]) -> dict[str, str] | None:
+        zones = self.zone_setting
+        if query.get("zone_name") != zones["zone_name"] or len(
+            query.get("zone_onoff", "").split(";")
+        ) != len(self.ZONES):
+            return None
+        zones.update(
+            (key, value) for key, value in query.items() if key in zones
+        )
+        return {}
+
+
+class SimulatedBRP084(SimulatedAdapter):
+    """BRP084 adapter (firmware 2.8.0): JSON requests to /dsiot/multireq.
+
+    State is a tree of 'pn' nodes per 'to' address. Reads (op 2) return the
+    tree, writes (op 3) set the leaves they carry.
+    """
+
+    family = "DaikinBRP084"
+
+    INDOOR = "/dsiot/edge/adr_0100.dgc_status"
+    OUTDOOR = "/dsiot/edge/adr_0200.dgc_status"
+    WEEK_POWER = "/dsiot/edge/adr_0100.i_power.week_power"
+    ADAPTER = "/dsiot/edge.adp_i"
+
+    def __init__(self, *args: Any) -> None:
+        """Initialize the unit."""
+        super().__init__(*args)
+        # Leaves below the root node of each address, by their pn path
+        self.leaves: dict[str, dict[tuple[str, ...], Any]] = {
+            self.INDOOR: {
+                # Power, mode (0200: cool), target temperature (half degrees)
+                ("e_1002", "e_A002", "p_01"): "01",
+                ("e_1002", "e_3001", "p_01"): "0200",
+                ("e_1002", "e_3001", "p_02"): "30",
+                ("e_1002", "e_3001", "p_03"): "2C",
+                ("e_1002", "e_3001", "p_1D"): "30",
+                # Fan rate per mode (0A00: auto)
+                **{
+                    ("e_1002", "e_3001", pn): "0A00"
+                    for pn in ("p_09", "p_0A", "p_26", "p_28")
+                },
+                # Vertical and horizontal swing per mode
+                **{
+                    ("e_1002", "e_3001", f"p_{index:02X}"): "000000"
+                    for index in (5, 6, 7, 8, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25)
+                },
+                ("e_1002", "e_3001", "p_34"): "00",
+                # Comfort airflow and econo
+                ("e_1002", "e_3003", "p_1D"): "00",
+                ("e_1002", "e_3003", "p_24"): "00",
+                # Room temperature (degrees) and humidity (%)
+                ("e_1002", "e_A00B", "p_01"): "19",
+                ("e_1002", "e_A00B", "p_02"): "32",
+                # Indoor unit model, space-padded ASCII
+                ("e_1002", "e_A001", "p_01"): "FTXB50A".ljust(16).encode().hex().upper(),
+            },
+            self.OUTDOOR: {
+                # Outdoor temperature (little-endian half degrees)
+                ("e_1003", "e_A00D", "p_01"): "3C00",
+                ("e_1003", "e_A005", "p_01"): "8C0000",
+                ("e_1003", "e_3002", "p_3D"): "00",
+                ("e_1003", "e_3002", "p_44"): "00",
+            },
+            self.WEEK_POWER: {
+                ("today_runtime",): "182",
+                ("datas",): [4100, 3600, 0, 1200, 5100, 4800, 2200],
+            },
+            self.ADAPTER: {
+                ("mac",): self.mac,
+                ("ver",): "2_8_0",
+                ("api_ver",): "1",
+            },
+        }
+        self._roots = {
+            self.INDOOR: "dgc_status",
+            self.OUTDOOR: "dgc_status",
+            self.WEEK_POWER: "week_power",
+            self.ADAPTER: "adp_i",
+        }
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, str],
+        body: Any,
+        headers: Mapping[str, str],
+    ) -> Response:
+        """Return the answer to a request, right away."""
+        if method != "POST" or path != "dsiot/multireq":
+            return 404, ""
+        if not isinstance(body, dict) or not isinstance(body.get("requests"), list):
+            return 400, ""
+        responses = []
+        for request in body["requests"]:
+            to = request.get("to", "").split("?")[0]
+            if to not in self.leaves:
+                responses.append({"fr": to, "rsc": 4004})
+            elif request.get("op") == 2:
+                if to == self.INDOOR:
+                    self.polls += 1
+                responses.append({"fr": to, "pc": self._tree(to), "rsc": 2000})
+            elif request.get("op") == 3:
+                for node in request.get("pc", {}).get("pch", []):
+                    self._apply(self.leaves[to], node, ())
+                responses.append({"fr": to, "rsc": 2004})
+            else:
+                responses.append({"fr": to, "rsc": 4000})
+        return 200, {"responses": responses}
+
+    def _tree(self, to: str) -> dict[str, Any]:
+        """Return the state at an address as a pn tree."""
+        root: dict[str, Any] = {"pn": self._roots[to], "pch": []}
+        for path, value in self.leaves[to].items():
+            children = root["pch"]
+            for pn in path[:-1]:
+                node = next((node for node in children if node["pn"] == pn), None)
+                if node is None:
+                    node = {"pn": pn, "pch": []}
+                    children.append(node)
+                children = node["pch"]
+            children.append({"pn": path[-1], "pv": value})
+        return root
+
+    def _apply(
+        self,
+        leaves: dict[tuple[str, ...], Any],
+        node: dict[str, Any],
+        path: tuple[str, ...],
+    ) -> None:
+        """Set the leaves a written pn tree carries."""
+        path = (*path, node["pn"])
+        if "pv" in node:
+            leaves[path] = node["pv"]
+        for child in node.get("pch", []):
+            self._apply(leaves, child, path)
+
+    def set_power(self, on: bool) -> None:
+        """Switch the unit on or off at the unit (e.g. with the IR remote)."""
+        self.leaves[self.INDOOR][("e_1002", "e_A002", "p_01")] = "01" if on else "00"
+
+    def set_inside_temperature(self, celsius: float) -> None:
+        """Change the room temperature the unit measures."""
+        self.leaves[self.INDOOR][("e_1002", "e_A00B", "p_01")] = f"{round(celsius):02X}"
+
+
+ADAPTERS: dict[str, type[SimulatedAdapter]] = {
+    cls.family: cls
+    for cls in (SimulatedBRP069, SimulatedBRP072C, SimulatedBRP084, SimulatedAirBase)
+}
+
+
+class _SimulatorResolver(AbstractResolver):
+    """Resolve the host names of simulated units to the simulator."""
+
+    def __init__(self, simulator: DaikinSimulator) -> None:
+        self._simulator = simulator
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        simulator = self._simulator
+        if host not in simulator.units:
+            raise OSError(f"Unknown host {host}")
+        return [
+            ResolveResult(
+                hostname=host,
+                host="127.0.0.1",
+                port=simulator.https_port if port == 443 else simulator.http_port,
+                family=socket.AF_INET,
+                proto=0,
+                flags=0,
+            )
+        ]
+
+    async def close(self) -> None:
+        pass
+
+
+def _server_ssl_context() -> ssl.SSLContext:
+    """Return a server context with a fresh self-signed certificate."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, SIM_DOMAIN)])
+    now = datetime.now(UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    with tempfile.TemporaryDirectory() as directory:
+        cert_file, key_file = Path(directory, "cert.pem"), Path(directory, "key.pem")
+        cert_file.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+        key_file.write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        context.load_cert_chain(cert_file, key_file)
+    return context
+
+
+def _local_socket() -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    return sock
+
+
+class DaikinSimulator:
+    """Serve any number of simulated adapters from one local server."""
+
+    def __init__(self, *, seed: int = 0) -> None:
+        """Initialize the simulator; seed makes jitter and timeouts repeatable."""
+        self.units: dict[str, SimulatedAdapter] = {}
+        self._rng = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self.http_port = 0
+        self.https_port = 0
+        self.session: ClientSession | None = None
+
+    def add_unit(
+        self,
+        family: str,
+        *,
+        profile: AdapterProfile | None = None,
+        name: str | None = None,
+    ) -> SimulatedAdapter:
+        """Add a unit of a family (a pydaikin class name) and return it."""
+        index = len(self.units) + 1
+        unit = ADAPTERS[family](
+            f"unit{index}.{SIM_DOMAIN}",
+            f"F0C8{index:08X}",
+            name or f"Unit {index}",
+            profile or AdapterProfile(),
+            self._rng,
+        )
+        self.units[unit.host] = unit
+        return unit
+
+    async def async_start(self) -> None:
+        """Start serving and create the client session that reaches the units."""
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app, shutdown_timeout=0.1)
+        await self._runner.setup()
+        ssl_context = await asyncio.get_running_loop().run_in_executor(
+            None, _server_ssl_context
+        )
+        http, https = _local_socket(), _local_socket()
+        self.http_port = http.getsockname()[1]
+        self.https_port = https.getsockname()[1]
+        await web.SockSite(self._runner, http).start()
+        await web.SockSite(self._runner, https, ssl_context=ssl_context).start()
+        # No DNS cache, no connection limit: every unit is its own host
+        self.session = ClientSession(
+            connector=TCPConnector(
+                resolver=_SimulatorResolver(self), use_dns_cache=False, limit=0
+            )
+        )
+
+    async def async_stop(self) -> None:
+        """Close the client session and stop serving."""
+        if self.session is not None:
+            await self.session.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Route a request to the unit its Host header names."""
+        unit = self.units.get(request.host.partition(":")[0])
+        if unit is None or request.secure != (unit.port == 443):
+            raise web.HTTPNotFound
+        body = await request.json() if request.can_read_body else None
+        status, payload = await unit.async_handle(
+            request.method,
+            request.path.lstrip("/"),
+            request.query,
+            body,
+            request.headers,
+        )
+        if isinstance(payload, dict):
+            return web.json_response(payload, status=status)
+        return web.Response(text=payload, status=status)
+
@@ -0,0 +1,147 @@
+"""Tests of the Daikin climate entity against a simulated unit."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, patch
+
+from pydaikin.exceptions import DaikinException
+import pytest
+
+from homeassistant.components.climate import (
+    ATTR_TEMPERATURE,
+    DATA_COMPONENT as CLIMATE_COMPONENT,
+    DOMAIN as CLIMATE_DOMAIN,
+)
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.daikin.climate import DaikinClimate
+
+from . import async_setup_unit, entity_id
+from .simulator import DaikinSimulator, SimulatedBRP069
+
+SET_CONTROL_INFO = "aircon/set_control_info"
+
+
+@pytest.fixture
+def unit(simulator: DaikinSimulator) -> SimulatedBRP069:
+    """Return a simulated BRP069 unit."""
+    return simulator.add_unit("DaikinBRP069")
+
+
+@pytest.fixture
+async def entry(
+    hass: HomeAssistant, unit: SimulatedBRP069
+) -> AsyncGenerator[MockConfigEntry]:
+    """Set up the unit and unload it after the test."""
+    entry = await async_setup_unit(hass, unit)
+    yield entry
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+def _climate(hass: HomeAssistant, entry: MockConfigEntry) -> DaikinClimate:
+    """Return the climate entity of an entry."""
+    return hass.data[CLIMATE_COMPONENT].get_entity(
+        entity_id(hass, entry, CLIMATE_DOMAIN)
+    )
+
+
+async def test_commands_in_the_window_are_merged(
+    hass: HomeAssistant, unit: SimulatedBRP069, entry: MockConfigEntry
+) -> None:
+    """Test commands sent within the merge window make one write."""
+    climate = _climate(hass, entry)
+    fan_mode = climate.fan_modes[1]
+
+    await asyncio.gather(
+        climate.async_set_temperature(**{ATTR_TEMPERATURE: 21}),
+        climate.async_set_fan_mode(fan_mode),
+    )
+
+    stats = entry.runtime_data.command_stats
+    assert (stats.commands, stats.merged, stats.writes) == (2, 1, 1)
+    assert unit.requests[SET_CONTROL_INFO] == 1
+    assert float(unit.control_info["stemp"]) == 21
+    await entry.runtime_data.async_refresh()
+    assert climate.fan_mode == fan_mode
+
+
+async def test_merged_write_error_reaches_every_caller(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> None:
+    """Test a failed merged write fails each caller and clears its state."""
+    climate = _climate(hass, entry)
+    with patch.object(
+        entry.runtime_data.device,
+        "set",
+        AsyncMock(side_effect=DaikinException("refused")),
+    ):
+        results = await asyncio.gather(
+            climate.async_set_temperature(**{ATTR_TEMPERATURE: 21}),
+            climate.async_set_fan_mode(climate.fan_modes[1]),
+            return_exceptions=True,
+        )
+
+    assert [type(result) for result in results] == [DaikinException] * 2
+    assert entry.runtime_data.command_stats.writes == 1
+    assert climate.target_temperature == 24
+    assert climate.extra_state_attributes["expected_temperature"] is None
+
+
+async def test_cancelled_caller_keeps_the_merged_write(
+    hass: HomeAssistant, unit: SimulatedBRP069, entry: MockConfigEntry
+) -> None:
+    """Test cancelling one caller neither drops its values nor the others'."""
+    climate = _climate(hass, entry)
+    fan_mode = climate.fan_modes[1]
+
+    cancelled = hass.async_create_task(
+        climate.async_set_temperature(**{ATTR_TEMPERATURE: 21})
+    )
+    await asyncio.sleep(0)
+    other = hass.async_create_task(climate.async_set_fan_mode(fan_mode))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await other
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    await hass.async_block_till_done()
+
+    assert unit.requests[SET_CONTROL_INFO] == 1
+    assert float(unit.control_info["stemp"]) == 21
+    await entry.runtime_data.async_refresh()
+    assert climate.fan_mode == fan_mode
+
+
+async def test_matching_command_is_not_written(
+    hass: HomeAssistant, unit: SimulatedBRP069, entry: MockConfigEntry
+) -> None:
+    """Test a command the unit already matches completes without a write."""
+    climate = _climate(hass, entry)
+    assert climate.target_temperature == 24
+
+    async with asyncio.timeout(5):
+        await climate.async_set_temperature(**{ATTR_TEMPERATURE: 24})
+
+    stats = entry.runtime_data.command_stats
+    assert (stats.commands, stats.writes, stats.skipped) == (1, 0, 1)
+    assert unit.requests[SET_CONTROL_INFO] == 0
+
+
+async def test_matching_keys_are_dropped(
+    hass: HomeAssistant, unit: SimulatedBRP069, entry: MockConfigEntry
+) -> None:
+    """Test only the keys the unit does not match yet are written."""
+    climate = _climate(hass, entry)
+
+    await asyncio.gather(
+        climate.async_set_temperature(**{ATTR_TEMPERATURE: 21}),
+        climate.async_set_fan_mode(climate.fan_mode),
+    )
+
+    stats = entry.runtime_data.command_stats
+    assert (stats.writes, stats.skipped_keys) == (1, 1)
+    assert unit.requests[SET_CONTROL_INFO] == 1
@@ -0,0 +1,304 @@
+"""Tests of the climate entity's optimistic, expected and override state."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from custom_components.daikin.climate_state import (
+    MODE_OFF,
+    OVERRIDE_TURNED_OFF,
+    OVERRIDE_TURNED_ON,
+    DaikinClimateState,
+    DeviceReading,
+    _confirm_optimistic,
+    _detect_override,
+    displayed_hvac_mode,
+    expire,
+    next_expiry,
+    observe,
+    record_command,
+    record_expected,
+    record_optimistic,
+)
+from custom_components.daikin.const import (
+    COMMAND_GRACE_PERIOD,
+    EXPECTED_STATE_TIMEOUT,
+    OPTIMISTIC_TIMEOUT,
+    OVERRIDE_EVENT_DEBOUNCE,
+    STARTUP_GRACE_PERIOD,
+)
+
+NAME = "climate.test"
+
+# Well past the startup grace of a state created at 0
+LATER = STARTUP_GRACE_PERIOD + 1000.0
+
+
+def _state(power: str = "1", init_at: float = 0.0) -> DaikinClimateState:
+    """Return the state of an entity created at init_at."""
+    return DaikinClimateState(
+        init_at=init_at, last_known_power=power, last_coordinator_success=True
+    )
+
+
+def _reading(
+    power: str = "1",
+    hvac_mode: str = "cool",
+    *,
+    success: bool = True,
+    target_temperature: float | None = None,
+    fan_mode: str | None = None,
+    swing_mode: str | None = None,
+) -> DeviceReading:
+    """Return a coordinator reading."""
+    return DeviceReading(
+        success=success,
+        power=power,
+        hvac_mode=MODE_OFF if power == "0" else hvac_mode,
+        active_mode=hvac_mode,
+        target_temperature=target_temperature,
+        fan_mode=fan_mode,
+        swing_mode=swing_mode,
+    )
+
+
+@pytest.mark.parametrize(
+    ("previous", "power", "override"),
+    [("1", "0", OVERRIDE_TURNED_OFF), ("0", "1", OVERRIDE_TURNED_ON)],
+)
+def test_power_change_is_an_override(
+    previous: str, power: str, override: str
+) -> None:
+    """Test a pow change nobody commanded is reported as an override."""
+    state = _state(previous)
+
+    assert _detect_override(state, power, LATER, NAME) == override
+    assert state.last_override_event_at == LATER
+
+
+def test_unchanged_power_is_no_override() -> None:
+    """Test the same pow as before reports nothing."""
+    assert _detect_override(_state("1"), "1", LATER, NAME) is None
+
+
+def test_startup_grace() -> None:
+    """Test pow changes sync silently until STARTUP_GRACE_PERIOD has passed."""
+    assert _detect_override(_state(), "0", STARTUP_GRACE_PERIOD - 0.1, NAME) is None
+    assert (
+        _detect_override(_state(), "0", STARTUP_GRACE_PERIOD, NAME)
+        == OVERRIDE_TURNED_OFF
+    )
+
+
+def test_reconnect_grace() -> None:
+    """Test a recovery that changed pow opens a grace window of its own."""
+    state = _state("1")
+    state.last_coordinator_success = False
+
+    assert observe(state, _reading("0"), LATER, NAME) is None
+    assert state.recovery_at == LATER
+    assert observe(state, _reading("1"), LATER + STARTUP_GRACE_PERIOD - 1, NAME) is None
+    assert (
+        observe(state, _reading("0"), LATER + STARTUP_GRACE_PERIOD, NAME)
+        == OVERRIDE_TURNED_OFF
+    )
+
+
+def test_recovery_without_power_change_opens_no_grace() -> None:
+    """Test a blip that left pow as it was does not hide a later remote press."""
+    state = _state("1")
+    state.last_coordinator_success = False
+
+    assert observe(state, _reading("1"), LATER, NAME) is None
+    assert state.recovery_at is None
+    assert observe(state, _reading("0"), LATER + 1, NAME) == OVERRIDE_TURNED_OFF
+
+
+def test_command_grace_covers_the_power_bounce() -> None:
+    """Test the pow 1→0→1 bounce of a mode change is not an override."""
+    state = _state("1")
+    record_command(state, LATER)
+
+    assert observe(state, _reading("0"), LATER + 5, NAME) is None
+    assert observe(state, _reading("1"), LATER + 10, NAME) is None
+    # Once the window closed the same change is a remote press again
+    assert (
+        observe(state, _reading("0"), LATER + COMMAND_GRACE_PERIOD, NAME)
+        == OVERRIDE_TURNED_OFF
+    )
+
+
+def test_override_events_are_debounced() -> None:
+    """Test a second pow change within OVERRIDE_EVENT_DEBOUNCE reports nothing."""
+    state = _state("1")
+
+    assert observe(state, _reading("0"), LATER, NAME) == OVERRIDE_TURNED_OFF
+    assert observe(state, _reading("1"), LATER + 1, NAME) is None
+    assert (
+        observe(state, _reading("0"), LATER + 1 + OVERRIDE_EVENT_DEBOUNCE, NAME)
+        == OVERRIDE_TURNED_OFF
+    )
+
+
+def test_observe_tracks_the_last_active_mode() -> None:
+    """Test only powered, mapped modes are remembered for turn_on."""
+    state = _state("1")
+
+    observe(state, _reading("1", "heat"), LATER, NAME)
+    assert state.last_active_hvac_mode == "heat"
+
+    observe(state, _reading("0", "cool"), LATER + 1, NAME)
+    observe(state, _reading("1", None), LATER + 2, NAME)
+    assert state.last_active_hvac_mode == "heat"
+
+
+def test_confirm_clears_what_the_device_reports() -> None:
+    """Test optimistic values the device shows are dropped, others kept."""
+    state = _state()
+    record_optimistic(
+        state, LATER, target_temp=21.0, fan_mode="Auto", swing_mode="Vertical"
+    )
+
+    _confirm_optimistic(
+        state,
+        _reading(target_temperature=21.04, fan_mode="Auto", swing_mode="Stop"),
+        NAME,
+    )
+
+    assert state.optimistic_target_temp is None
+    assert state.optimistic_fan_mode is None
+    assert state.optimistic_swing_mode == "Vertical"
+    assert state.optimistic_set_at == LATER
+
+    _confirm_optimistic(state, _reading(swing_mode="Vertical"), NAME)
+    assert state.optimistic_swing_mode is None
+    assert state.optimistic_set_at is None
+
+
+def test_confirm_hvac_mode() -> None:
+    """Test an optimistic OFF clears on pow 0, an ON mode on its own mode."""
+    state = _state()
+    record_optimistic(state, LATER, hvac_mode=MODE_OFF)
+    _confirm_optimistic(state, _reading("1"), NAME)
+    assert state.optimistic_hvac_mode == MODE_OFF
+    _confirm_optimistic(state, _reading("0"), NAME)
+    assert state.optimistic_hvac_mode is None
+
+    record_optimistic(state, LATER, hvac_mode="heat")
+    _confirm_optimistic(state, _reading("0", "heat"), NAME)
+    _confirm_optimistic(state, _reading("1", "cool"), NAME)
+    assert state.optimistic_hvac_mode == "heat"
+    _confirm_optimistic(state, _reading("1", "heat"), NAME)
+    assert state.optimistic_hvac_mode is None
+
+
+def test_expire_at_the_deadline() -> None:
+    """Test each window closes at exactly the time next_expiry() reports."""
+    state = _state()
+    record_optimistic(state, LATER, fan_mode="Auto")
+    record_expected(state, "cool", LATER)
+    assert next_expiry(state) == LATER + OPTIMISTIC_TIMEOUT
+
+    assert not expire(state, LATER + OPTIMISTIC_TIMEOUT - 0.001)
+    assert expire(state, LATER + OPTIMISTIC_TIMEOUT)
+    assert state.optimistic_fan_mode is None
+    assert state.expected_hvac_mode == "cool"
+    assert next_expiry(state) == LATER + EXPECTED_STATE_TIMEOUT
+
+    assert expire(state, LATER + EXPECTED_STATE_TIMEOUT)
+    assert state.expected_hvac_mode is None
+    assert next_expiry(state) is None
+    assert not expire(state, LATER + EXPECTED_STATE_TIMEOUT * 2)
+
+
+@pytest.mark.parametrize(
+    ("optimistic", "power", "age", "shown"),
+    [
+        (None, "0", 0, MODE_OFF),
+        (None, "1", 0, "cool"),
+        # Sent OFF: shown while fresh, the device wins afterwards
+        (MODE_OFF, "1", 0, MODE_OFF),
+        (MODE_OFF, "1", OPTIMISTIC_TIMEOUT, "cool"),
+        (MODE_OFF, "0", OPTIMISTIC_TIMEOUT, MODE_OFF),
+        # Sent an ON mode: shown while fresh, OFF if the unit stayed off
+        ("heat", "0", 0, "heat"),
+        ("heat", "0", OPTIMISTIC_TIMEOUT, MODE_OFF),
+        ("heat", "1", OPTIMISTIC_TIMEOUT, "heat"),
+    ],
+)
+def test_displayed_hvac_mode(
+    optimistic: str | None, power: str, age: float, shown: str
+) -> None:
+    """Test the mode shown for each optimistic mode, pow and age."""
+    state = _state()
+    if optimistic is not None:
+        record_optimistic(state, LATER, hvac_mode=optimistic)
+
+    assert displayed_hvac_mode(state, power, "cool", LATER + age) == shown
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_observe_invariants(seed: int) -> None:
+    """Fuzz commands and readings and check what must always hold."""
+    rng = random.Random(seed)
+    state = _state(rng.choice("01"), init_at=rng.uniform(0, 100))
+    now = state.init_at
+    modes = ["cool", "heat", "auto", MODE_OFF]
+    overrides: list[float] = []
+
+    for _ in range(500):
+        now += rng.choice((0.5, 2.0, 10.0, 40.0, 3700.0)) * rng.random()
+        action = rng.random()
+        if action < 0.2:
+            record_command(state, now)
+            record_optimistic(
+                state,
+                now,
+                target_temp=rng.choice((None, 20.0, 21.5)),
+                hvac_mode=rng.choice([None, *modes]),
+                fan_mode=rng.choice((None, "Auto", "Silence")),
+            )
+            if rng.random() < 0.5:
+                record_expected(state, rng.choice(modes), now)
+            continue
+        previous = state.last_known_power
+        suppressed = now - state.init_at < STARTUP_GRACE_PERIOD or (
+            state.last_command_at is not None
+            and now - state.last_command_at < COMMAND_GRACE_PERIOD
+        )
+        reading = _reading(
+            rng.choice("01"),
+            rng.choice(modes[:3]),
+            success=rng.random() > 0.1,
+            target_temperature=rng.choice((20.0, 21.5)),
+            fan_mode=rng.choice(("Auto", "Silence")),
+        )
+
+        override = observe(state, reading, now, NAME)
+
+        assert state.last_known_power == reading.power
+        if override is not None:
+            assert not suppressed
+            assert previous != reading.power
+            assert override == (
+                OVERRIDE_TURNED_ON if reading.power == "1" else OVERRIDE_TURNED_OFF
+            )
+            overrides.append(now)
+        deadline = next_expiry(state)
+        assert deadline is None or deadline > now
+        optimistic = (
+            state.optimistic_target_temp,
+            state.optimistic_hvac_mode,
+            state.optimistic_fan_mode,
+            state.optimistic_swing_mode,
+        )
+        assert (state.optimistic_set_at is None) == all(
+            value is None for value in optimistic
+        )
+
+    assert all(
+        later - earlier >= OVERRIDE_EVENT_DEBOUNCE
+        for earlier, later in zip(overrides, overrides[1:])
+    )
@@ -0,0 +1,259 @@
+"""Tests of the Daikin coordinator against a simulated unit."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.climate import ATTR_TEMPERATURE, SERVICE_SET_TEMPERATURE
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.daikin.const import (
+    CONF_MAX_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    FAST_UPDATE_INTERVAL,
+    POLL_REASON_COMMAND,
+    POLL_REASON_IDLE,
+    POLL_REASON_POWER_CHANGE,
+    POLL_REASON_STATE_CHANGE,
+)
+
+from custom_components.daikin.coordinator import ENERGY_RESOURCES
+from custom_components.daikin.entity import DaikinEntity
+
+from . import async_setup_unit, entity_id
+from .simulator import DaikinSimulator, SimulatedBRP069
+
+
+@pytest.fixture
+def unit(simulator: DaikinSimulator) -> SimulatedBRP069:
+    """Return a simulated BRP069 unit."""
+    return simulator.add_unit("DaikinBRP069")
+
+
+async def test_idle_backs_off_to_the_options_ceiling(
+    hass: HomeAssistant, unit: SimulatedBRP069
+) -> None:
+    """Test an unchanged unit doubles the interval up to the configured maximum."""
+    entry = await async_setup_unit(hass, unit, {CONF_MAX_UPDATE_INTERVAL: 40})
+    coordinator = entry.runtime_data
+    # The first refresh found the values read during setup
+    assert coordinator.poll_interval == DEFAULT_UPDATE_INTERVAL * 2
+    assert coordinator.poll_interval_reason == POLL_REASON_IDLE
+
+    intervals = []
+    for _ in range(3):
+        await coordinator.async_refresh()
+        intervals.append(coordinator.poll_interval)
+
+    assert intervals == [40, 40, 40]
+    assert coordinator.poll_interval_reason == POLL_REASON_IDLE
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_sensor_drift_keeps_backing_off(
+    hass: HomeAssistant, unit: SimulatedBRP069
+) -> None:
+    """Test changing sensor readings do not count as activity."""
+    entry = await async_setup_unit(hass, unit)
+    coordinator = entry.runtime_data
+    interval = coordinator.poll_interval
+
+    unit.set_inside_temperature(19)
+    unit.sensor_info["otemp"] = "12.0"
+    await coordinator.async_refresh()
+
+    assert coordinator.data.inside_temperature == 19
+    assert coordinator.poll_interval == interval * 2
+    assert coordinator.poll_interval_reason == POLL_REASON_IDLE
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_state_change_returns_to_default(
+    hass: HomeAssistant, unit: SimulatedBRP069
+) -> None:
+    """Test a setting changed at the unit resets the interval to the default."""
+    entry = await async_setup_unit(hass, unit)
+    coordinator = entry.runtime_data
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval > DEFAULT_UPDATE_INTERVAL
+
+    unit.control_info["stemp"] = "21.0"
+    await coordinator.async_refresh()
+
+    assert coordinator.poll_interval == DEFAULT_UPDATE_INTERVAL
+    assert coordinator.poll_interval_reason == POLL_REASON_STATE_CHANGE
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_power_change_polls_fast_for_the_window(
+    hass: HomeAssistant, unit: SimulatedBRP069
+) -> None:
+    """Test a power change at the unit polls fast, also when nothing else moves."""
+    entry = await async_setup_unit(hass, unit)
+    coordinator = entry.runtime_data
+
+    unit.set_power(False)
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval == FAST_UPDATE_INTERVAL
+    assert coordinator.poll_interval_reason == POLL_REASON_POWER_CHANGE
+
+    # Inside the window an idle poll keeps the fast interval
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval == FAST_UPDATE_INTERVAL
+    assert coordinator.poll_interval_reason == POLL_REASON_POWER_CHANGE
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_fast_window_ends_in_backoff(
+    hass: HomeAssistant, unit: SimulatedBRP069
+) -> None:
+    """Test the interval doubles from the fast one once the window closed."""
+    entry = await async_setup_unit(hass, unit)
+    coordinator = entry.runtime_data
+
+    with patch("custom_components.daikin.coordinator.FAST_POLL_WINDOW", 0):
+        unit.set_power(False)
+        await coordinator.async_refresh()
+    assert coordinator.poll_interval == FAST_UPDATE_INTERVAL
+
+    await coordinator.async_refresh()
+
+    assert coordinator.poll_interval == FAST_UPDATE_INTERVAL * 2
+    assert coordinator.poll_interval_reason == POLL_REASON_IDLE
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_command_polls_fast(hass: HomeAssistant, unit: SimulatedBRP069) -> None:
+    """Test a command moves a backed-off unit to the fast interval at once."""
+    entry = await async_setup_unit(hass, unit)
+    coordinator = entry.runtime_data
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval > FAST_UPDATE_INTERVAL
+
+    climate = entity_id(hass, entry, CLIMATE_DOMAIN)
+
+    with patch.object(
+        coordinator, "_async_schedule_poll", wraps=coordinator._async_schedule_poll
+    ) as schedule_poll:
+        await hass.services.async_call(
+            CLIMATE_DOMAIN,
+            SERVICE_SET_TEMPERATURE,
+            {ATTR_ENTITY_ID: climate, ATTR_TEMPERATURE: 21},
+            blocking=True,
+        )
+
+    assert coordinator.poll_interval == FAST_UPDATE_INTERVAL
+    assert coordinator.poll_interval_reason == POLL_REASON_COMMAND
+    # The poll scheduled at the slow interval was moved up
+    schedule_poll.assert_called()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+def _energy_reads(unit: SimulatedBRP069) -> int:
+    """Return how often the unit's energy resources were read."""
+    return sum(unit.requests[resource] for resource in ENERGY_RESOURCES)
+
+
+async def test_energy_tier_waits_for_its_interval(
+    hass: HomeAssistant, unit: SimulatedBRP069
+) -> None:
+    """Test the energy resources are read once per ENERGY_UPDATE_INTERVAL."""
+    entry = await async_setup_unit(hass, unit)
+    coordinator = entry.runtime_data
+    # The first poll after a sensor asked for them reads them
+    reads = _energy_reads(unit)
+    await coordinator.async_refresh()
+    assert _energy_reads(unit) == reads + len(ENERGY_RESOURCES)
+    reads, polls = _energy_reads(unit), unit.polls
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    assert unit.polls == polls + 2
+    assert _energy_reads(unit) == reads
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_energy_tier_read_when_due(
+    hass: HomeAssistant, unit: SimulatedBRP069
+) -> None:
+    """Test every poll reads the energy resources once they are due."""
+    with patch("custom_components.daikin.coordinator.ENERGY_UPDATE_INTERVAL", 0):
+        entry = await async_setup_unit(hass, unit)
+        reads = _energy_reads(unit)
+
+        await entry.runtime_data.async_refresh()
+
+    assert _energy_reads(unit) == reads + len(ENERGY_RESOURCES)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_energy_tier_needs_a_consumer(
+    hass: HomeAssistant, unit: SimulatedBRP069
+) -> None:
+    """Test the energy resources are not read while no sensor uses them."""
+    entry = await async_setup_unit(hass, unit)
+    registry = er.async_get(hass)
+    for entity in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if entity.domain == SENSOR_DOMAIN:
+            registry.async_update_entity(
+                entity.entity_id, disabled_by=er.RegistryEntryDisabler.USER
+            )
+    with patch("custom_components.daikin.coordinator.ENERGY_UPDATE_INTERVAL", 0):
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        # Fast-started from the snapshot: wait for the background connect
+        async with asyncio.timeout(5):
+            while not entry.runtime_data.connected:
+                await asyncio.sleep(0.01)
+        await hass.async_block_till_done()
+        device = entry.runtime_data.device
+        # Asked for rather than read: pydaikin itself skips resources whose
+        # values nobody read since they were fetched
+        with patch.object(
+            device, "update_status", wraps=device.update_status
+        ) as update_status:
+            await entry.runtime_data.async_refresh()
+
+    (resources,), _ = update_status.call_args
+    assert resources is not None
+    assert not set(resources) & set(ENERGY_RESOURCES)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_unchanged_poll_writes_no_state(
+    hass: HomeAssistant, unit: SimulatedBRP069
+) -> None:
+    """Test a poll returning the same values writes no entity state."""
+    entry = await async_setup_unit(hass, unit)
+    coordinator = entry.runtime_data
+    await coordinator.async_refresh()
+    written: list[DaikinEntity] = []
+    write_state = DaikinEntity.async_write_ha_state
+
+    def _record_write(entity: DaikinEntity) -> None:
+        written.append(entity)
+        write_state(entity)
+
+    with patch.object(DaikinEntity, "async_write_ha_state", _record_write):
+        await coordinator.async_refresh()
+        # Only entities without update keys write every poll: the diagnostic
+        # sensors (which report the poll itself) and pydaikin's estimates
+        assert written
+        assert all(entity._update_keys is None for entity in written)  # noqa: SLF001
+        written.clear()
+
+        unit.set_inside_temperature(19)
+        await coordinator.async_refresh()
+
+    assert any(
+        entity.entity_id.startswith(f"{CLIMATE_DOMAIN}.") for entity in written
+    )
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,150 @@
+"""Tests of the shared UDP discovery."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+from ipaddress import ip_network
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from pydaikin.discovery import DISCOVERY_MSG, UDP_DST_PORT
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.daikin.discovery import DaikinDiscovery
+
+LOCAL = ip_network("192.168.1.0/24")
+UNITS = {
+    "192.168.1.10": "AABBCC000010",
+    "192.168.1.11": "AABBCC000011",
+    "192.168.1.12": "AABBCC000012",
+    # Behind a router: not on any local network
+    "10.0.5.20": "AABBCC000020",
+}
+
+
+@pytest.fixture
+def transport(hass: HomeAssistant) -> Generator[MagicMock]:
+    """Replace the UDP socket with a transport recording what is sent."""
+    transport = MagicMock(spec=asyncio.DatagramTransport)
+
+    async def _create_endpoint(
+        factory: Any, **kwargs: Any
+    ) -> tuple[MagicMock, asyncio.DatagramProtocol]:
+        protocol = factory()
+        protocol.connection_made(transport)
+        return transport, protocol
+
+    with (
+        patch("custom_components.daikin.discovery.socket.socket"),
+        patch(
+            "custom_components.daikin.discovery._broadcast_networks",
+            return_value=[LOCAL],
+        ),
+        patch.object(hass.loop, "create_datagram_endpoint", _create_endpoint),
+        patch("custom_components.daikin.discovery.DISCOVERY_BATCH_WINDOW", 0.01),
+        patch("custom_components.daikin.discovery.DISCOVERY_TIMEOUT", 0.05),
+    ):
+        yield transport
+
+
+def _targets(transport: MagicMock) -> list[str]:
+    """Return the addresses the discovery message was sent to."""
+    targets = []
+    for (message, (target, port)), _ in transport.sendto.call_args_list:
+        assert (message, port) == (DISCOVERY_MSG.encode(), UDP_DST_PORT)
+        targets.append(target)
+    return sorted(targets)
+
+
+async def _async_lookup(
+    discovery: DaikinDiscovery, transport: MagicMock, hosts: list[str]
+) -> list[str | None]:
+    """Look the hosts up, each unit in UNITS answering once asked."""
+    lookups = [
+        asyncio.create_task(discovery.async_get_mac(host)) for host in hosts
+    ]
+    async with asyncio.timeout(1):
+        while not transport.sendto.called:
+            await asyncio.sleep(0.001)
+    for host, mac in UNITS.items():
+        discovery.datagram_received(f"ret=OK,mac={mac}".encode(), (host, 30050))
+    return await asyncio.gather(*lookups)
+
+
+async def test_batch_is_one_broadcast(
+    hass: HomeAssistant, transport: MagicMock
+) -> None:
+    """Test local hosts looked up together share one broadcast."""
+    discovery = DaikinDiscovery(hass)
+    hosts = ["192.168.1.10", "192.168.1.11", "10.0.5.20"]
+
+    macs = await _async_lookup(discovery, transport, hosts)
+
+    assert macs == [UNITS[host] for host in hosts]
+    # The routed host is asked directly
+    assert _targets(transport) == ["10.0.5.20", str(LOCAL.broadcast_address)]
+    # No lookup waits any more: the socket is closed
+    transport.close.assert_called_once()
+
+
+async def test_lone_host_is_asked_directly(
+    hass: HomeAssistant, transport: MagicMock
+) -> None:
+    """Test a single lookup does not wake every unit on the network."""
+    discovery = DaikinDiscovery(hass)
+
+    assert await _async_lookup(discovery, transport, ["192.168.1.10"]) == [
+        UNITS["192.168.1.10"]
+    ]
+    assert _targets(transport) == ["192.168.1.10"]
+
+
+async def test_replies_are_cached_for_the_ttl(
+    hass: HomeAssistant, transport: MagicMock
+) -> None:
+    """Test every reply, asked for or not, answers lookups until its TTL."""
+    discovery = DaikinDiscovery(hass)
+    with patch("custom_components.daikin.discovery.DISCOVERY_CACHE_TTL", 0.2):
+        await _async_lookup(discovery, transport, ["192.168.1.10", "192.168.1.11"])
+        transport.sendto.reset_mock()
+
+        # 192.168.1.12 answered the broadcast without being asked for
+        assert await discovery.async_get_mac("192.168.1.12") == UNITS["192.168.1.12"]
+        assert not transport.sendto.called
+
+        await asyncio.sleep(0.2)
+        assert await _async_lookup(discovery, transport, ["192.168.1.12"]) == [
+            UNITS["192.168.1.12"]
+        ]
+    assert _targets(transport) == ["192.168.1.12"]
+
+
+async def test_silent_unit_times_out(
+    hass: HomeAssistant, transport: MagicMock
+) -> None:
+    """Test a lookup nobody answers returns None and closes the socket."""
+    discovery = DaikinDiscovery(hass)
+
+    assert await discovery.async_get_mac("192.168.1.99") is None
+    assert _targets(transport) == ["192.168.1.99"]
+    transport.close.assert_called_once()
+
+
+async def test_timed_out_lookup_leaves_others_waiting(
+    hass: HomeAssistant, transport: MagicMock
+) -> None:
+    """Test the socket stays open while another lookup still waits."""
+    discovery = DaikinDiscovery(hass)
+    silent = asyncio.create_task(discovery.async_get_mac("192.168.1.99"))
+    await asyncio.sleep(0.03)
+    # Queued in a later batch: still waiting when the first lookup gives up
+    answered = asyncio.create_task(discovery.async_get_mac("192.168.1.10"))
+
+    assert await silent is None
+    transport.close.assert_not_called()
+    discovery.datagram_received(b"ret=OK,mac=AABBCC000010", ("192.168.1.10", 30050))
+    assert await answered == UNITS["192.168.1.10"]
+    transport.close.assert_called_once()
@@ -0,0 +1,124 @@
+"""Tests of the hourly energy import into long-term statistics."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.daikin.energy import DAY_POWER_RESOURCE, DaikinEnergyImporter
+
+STATISTIC_ID = "daikin:aa_bb_cc_dd_ee_ff_cool_energy"
+
+
+def _hourly(tenths: list[int]) -> str:
+    """Return the day power value of a day, in 0.1 kWh per hour."""
+    return "/".join(str(value) for value in tenths)
+
+
+def _importer(hass: HomeAssistant, values: dict[str, str]) -> DaikinEnergyImporter:
+    """Return an importer of a connected unit reporting values."""
+    coordinator = MagicMock(connected=True, failing=False)
+    coordinator.name = "Unit"
+    coordinator.data.name = "Unit"
+    device = coordinator.device
+    device.mac = "aa:bb:cc:dd:ee:ff"
+    device.support_energy_consumption = True
+    device.get_info_resources.return_value = [DAY_POWER_RESOURCE]
+    device.update_status = AsyncMock()
+    device.values.get.side_effect = lambda key, invalidate=True: values.get(key)
+    return DaikinEnergyImporter(hass, coordinator)
+
+
+async def _async_statistics(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return the imported cool energy rows."""
+    await async_wait_recording_done(hass)
+    rows = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        dt_util.utc_from_timestamp(0),
+        None,
+        {STATISTIC_ID},
+        "hour",
+        None,
+        {"state", "sum"},
+    )
+    return rows.get(STATISTIC_ID, [])
+
+
+async def test_import_is_idempotent(hass: HomeAssistant) -> None:
+    """Test imports continue from the last hour instead of repeating it."""
+    importer = _importer(hass, {})
+    start = datetime(2026, 3, 1, tzinfo=dt_util.UTC)
+    hours = [(start + timedelta(hours=hour), 0.5) for hour in range(5)]
+
+    await importer._async_import_hours("cool_energy", hours[:3])  # noqa: SLF001
+    await _async_statistics(hass)
+    await importer._async_import_hours("cool_energy", hours)  # noqa: SLF001
+    await _async_statistics(hass)
+    await importer._async_import_hours("cool_energy", hours)  # noqa: SLF001
+    rows = await _async_statistics(hass)
+
+    assert [row["start"] for row in rows] == [
+        hour.timestamp() for hour, _ in hours
+    ]
+    assert [row["sum"] for row in rows] == pytest.approx([0.5, 1, 1.5, 2, 2.5])
+
+
+@pytest.mark.parametrize(
+    ("now", "yesterday_hours", "today_hours"),
+    [
+        # 05:30 after a regular day: yesterday whole, today until 05:00
+        ("2026-03-27 04:30:00+00:00", 24, 5),
+        # 05:30 after the 23-hour day clocks went forward: the adapter's last
+        # hour of yesterday would overlap today
+        ("2026-03-30 03:30:00+00:00", 23, 5),
+        # 05:30 after the 25-hour day clocks went back: the adapter reports
+        # 24 hours of it
+        ("2026-10-26 04:30:00+00:00", 24, 5),
+    ],
+    ids=["regular", "dst_start", "dst_end"],
+)
+async def test_import_takes_finished_hours(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    now: str,
+    yesterday_hours: int,
+    today_hours: int,
+) -> None:
+    """Test only finished hours are imported, in order and without overlap."""
+    await hass.config.async_set_time_zone("Europe/Berlin")
+    freezer.move_to(now)
+    importer = _importer(
+        hass,
+        {
+            "prev_1day_cool": _hourly([1] * 24),
+            "curr_day_cool": _hourly([2] * 24),
+            "prev_1day_heat": _hourly([0] * 24),
+            "curr_day_heat": _hourly([0] * 24),
+        },
+    )
+
+    with patch.object(importer, "_async_import_hours") as import_hours:
+        await importer.async_import()
+
+    importer._coordinator.device.update_status.assert_awaited_once_with(  # noqa: SLF001
+        [DAY_POWER_RESOURCE], force_refresh=True
+    )
+    hours = dict(call.args for call in import_hours.call_args_list)["cool_energy"]
+    starts = [start for start, _ in hours]
+    assert starts == sorted(set(starts))
+    assert [kwh for _, kwh in hours] == [0.1] * yesterday_hours + [0.2] * today_hours
+    assert starts[-1] + timedelta(hours=1) <= dt_util.utcnow()
+    assert starts[yesterday_hours] == dt_util.as_utc(dt_util.start_of_local_day())
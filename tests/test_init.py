@@ -0,0 +1,160 @@
+"""Tests of setting up Daikin entries, fast start included."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+import logging
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import ClientConnectionError
+import pytest
+
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.daikin import _async_create_device
+from custom_components.daikin.const import DOMAIN, FAST_START_TIMEOUT, TIMEOUT
+
+from . import async_setup_unit, entity_id
+from .simulator import DaikinSimulator, SimulatedBRP069
+
+
+def _snapshot(hass_storage: dict[str, Any], entry: MockConfigEntry) -> dict[str, Any]:
+    """Return the stored snapshot of an entry."""
+    return hass_storage[f"{DOMAIN}.{entry.entry_id}"]["data"]
+
+
+async def _async_fire(hass: HomeAssistant, seconds: float) -> None:
+    """Move time on and let the background connect run.
+
+    Not waiting for background tasks: the connect task sleeps between tries.
+    """
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+    await hass.async_block_till_done()
+
+
+async def _async_wait(hass: HomeAssistant, condition: Callable[[], bool]) -> None:
+    """Wait for a condition that depends on requests to the simulated unit."""
+    async with asyncio.timeout(5):
+        while not condition():
+            await asyncio.sleep(0.01)
+    await hass.async_block_till_done()
+
+
+@pytest.fixture
+async def snapshotted(
+    hass: HomeAssistant, simulator: DaikinSimulator, hass_storage: dict[str, Any]
+) -> tuple[SimulatedBRP069, MockConfigEntry]:
+    """Return a unit whose entry was set up once and left a snapshot."""
+    unit = simulator.add_unit("DaikinBRP069")
+    entry = await async_setup_unit(hass, unit)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert _snapshot(hass_storage, entry)["device_type"] == "DaikinBRP069"
+    return unit, entry
+
+
+def _failing_first(attempts: int) -> Any:
+    """Return an _async_create_device failing its first attempts."""
+    calls = 0
+
+    async def _async_create(*args: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        if calls <= attempts:
+            raise ClientConnectionError("unreachable")
+        return await _async_create_device(*args)
+
+    return _async_create
+
+
+async def test_fast_start_from_snapshot(
+    hass: HomeAssistant, snapshotted: tuple[SimulatedBRP069, MockConfigEntry]
+) -> None:
+    """Test an unreachable unit sets up from its snapshot and connects later."""
+    unit, entry = snapshotted
+    with (
+        patch("custom_components.daikin._async_create_device", _failing_first(2)),
+        patch(
+            "custom_components.daikin.DaikinFactory",
+            side_effect=AssertionError("probed"),
+        ),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        climate = entity_id(hass, entry, CLIMATE_DOMAIN)
+
+        assert entry.state is ConfigEntryState.LOADED
+        assert not entry.runtime_data.connected
+        assert hass.states.get(climate).state == STATE_UNAVAILABLE
+
+        unit.set_power(False)
+        for seconds in (FAST_START_TIMEOUT, FAST_START_TIMEOUT * 2):
+            await _async_fire(hass, seconds + 1)
+        await _async_wait(hass, lambda: hass.states.get(climate).state == "off")
+
+    assert entry.runtime_data.connected
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_connect_retries_back_off(
+    hass: HomeAssistant,
+    snapshotted: tuple[SimulatedBRP069, MockConfigEntry],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the background connect doubles its timeout up to TIMEOUT."""
+    _, entry = snapshotted
+    caplog.set_level(logging.DEBUG, logger="custom_components.daikin")
+    with patch(
+        "custom_components.daikin._async_create_device", _failing_first(100)
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        for _ in range(6):
+            await _async_fire(hass, TIMEOUT + 1)
+
+    delays = [
+        record.args[-1]
+        for record in caplog.records
+        if record.getMessage().startswith("Connection to")
+        and "retrying" in record.getMessage()
+    ]
+    assert delays[:6] == [
+        min(FAST_START_TIMEOUT * 2**attempt, TIMEOUT) for attempt in range(6)
+    ]
+    assert not entry.runtime_data.connected
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_capability_change_reloads(
+    hass: HomeAssistant,
+    snapshotted: tuple[SimulatedBRP069, MockConfigEntry],
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test a unit reporting other firmware than stored is set up again."""
+    unit, entry = snapshotted
+    unit.basic_info["ver"] = "1_16_0"
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    restored = entry.runtime_data
+    await _async_wait(
+        hass,
+        lambda: entry.state is ConfigEntryState.LOADED
+        and getattr(entry, "runtime_data", restored) is not restored,
+    )
+
+    # The reload went through the regular setup, connected from the start
+    assert entry.runtime_data.connected
+    assert entry.runtime_data.device.values.get("ver") == "1_16_0"
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert _snapshot(hass_storage, entry)["capabilities"]["ver"] == "1_16_0"
@@ -0,0 +1,44 @@
+"""Load run of the integration against simulated units.
+
+Skipped unless ``--load`` is given. The defaults make a short smoke run; raise
+the options for a real measurement, e.g.
+``pytest tests/test_load.py --load --load-units 200 --load-duration 120``.
+The report is printed in the terminal summary.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from .harness import async_run_load
+from .simulator import AdapterProfile, DaikinSimulator
+
+
+@pytest.mark.load
+async def test_load(
+    hass: HomeAssistant,
+    simulator: DaikinSimulator,
+    load_report: Callable[[object], None],
+    request: pytest.FixtureRequest,
+) -> None:
+    """Test the units keep polling and answering commands under load."""
+    option = request.config.getoption
+    report = await async_run_load(
+        hass,
+        simulator,
+        units=option("--load-units"),
+        duration=option("--load-duration"),
+        profile=AdapterProfile(
+            latency=option("--load-latency"),
+            jitter=option("--load-jitter"),
+            timeout_rate=option("--load-timeout-rate"),
+        ),
+    )
+    load_report(report)
+
+    assert report.polls > 0
+    assert report.commands.count > 0
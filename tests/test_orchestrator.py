@@ -0,0 +1,202 @@
+"""Tests of the domain-wide poll orchestration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.daikin.const import (
+    COORDINATOR_UPDATE_TIMEOUT,
+    MAX_CONCURRENT_FAILING_POLLS,
+    MAX_CONCURRENT_POLLS,
+    POLL_SLOT_TIMEOUT,
+)
+from custom_components.daikin.coordinator import DaikinCoordinator
+from custom_components.daikin.orchestrator import (
+    DaikinPollOrchestrator,
+    async_get_poll_orchestrator,
+)
+
+from . import async_setup_unit
+from .simulator import DaikinSimulator
+
+
+def _coordinator(name: str, *, failing: bool = False) -> MagicMock:
+    """Return a stand-in for a coordinator."""
+    return MagicMock(spec=DaikinCoordinator, failing=failing, name=name)
+
+
+def _phase(orchestrator: DaikinPollOrchestrator, when: float, interval: float) -> float:
+    """Return the position of a poll time within its grid cycle."""
+    return (when - orchestrator._epoch) % interval
+
+
+async def test_next_poll_time_spreads_phases(hass: HomeAssistant) -> None:
+    """Test N coordinators polling every T seconds are spaced T/N apart."""
+    orchestrator = DaikinPollOrchestrator(hass)
+    coordinators = [_coordinator(f"unit{index}") for index in range(4)]
+    for coordinator in coordinators:
+        orchestrator.async_register(coordinator)
+    interval = 20.0
+
+    now = hass.loop.time()
+    times = [
+        orchestrator.async_next_poll_time(coordinator, interval)
+        for coordinator in coordinators
+    ]
+
+    for index, when in enumerate(times):
+        assert now + interval / 2 <= when <= now + interval * 1.5
+        assert _phase(orchestrator, when, interval) == pytest.approx(
+            interval * index / 4
+        )
+
+
+async def test_next_poll_time_follows_registrations(hass: HomeAssistant) -> None:
+    """Test the phases are respread when a coordinator leaves."""
+    orchestrator = DaikinPollOrchestrator(hass)
+    first, second, third = (_coordinator(name) for name in ("a", "b", "c"))
+    orchestrator.async_register(first)
+    unregister = orchestrator.async_register(second)
+    orchestrator.async_register(third)
+
+    unregister()
+
+    assert orchestrator.coordinator_count == 2
+    assert _phase(
+        orchestrator, orchestrator.async_next_poll_time(third, 10), 10
+    ) == pytest.approx(5)
+
+
+async def _max_concurrent(
+    orchestrator: DaikinPollOrchestrator, coordinators: list[MagicMock]
+) -> tuple[int, set[float]]:
+    """Hold a slot per coordinator until all queued; return the peak and budgets."""
+    holding = 0
+    peak = 0
+    budgets: set[float] = set()
+    release = asyncio.Event()
+
+    async def _poll(coordinator: MagicMock) -> None:
+        nonlocal holding, peak
+        async with orchestrator.async_poll_slot(coordinator) as budget:
+            budgets.add(budget)
+            holding += 1
+            peak = max(peak, holding)
+            await release.wait()
+            holding -= 1
+
+    tasks = [asyncio.create_task(_poll(coordinator)) for coordinator in coordinators]
+    await asyncio.sleep(0.01)
+    release.set()
+    await asyncio.gather(*tasks)
+    return peak, budgets
+
+
+async def test_poll_slots_are_capped(hass: HomeAssistant) -> None:
+    """Test at most MAX_CONCURRENT_POLLS polls hold a slot at once."""
+    orchestrator = DaikinPollOrchestrator(hass)
+
+    peak, budgets = await _max_concurrent(
+        orchestrator, [_coordinator(f"unit{index}") for index in range(10)]
+    )
+
+    assert peak == MAX_CONCURRENT_POLLS
+    assert budgets == {POLL_SLOT_TIMEOUT}
+    assert orchestrator.slot_wait_stats.count == 10
+
+
+async def test_failing_poll_slots_are_capped(hass: HomeAssistant) -> None:
+    """Test failing units share MAX_CONCURRENT_FAILING_POLLS slots."""
+    orchestrator = DaikinPollOrchestrator(hass)
+
+    peak, budgets = await _max_concurrent(
+        orchestrator,
+        [_coordinator(f"unit{index}", failing=True) for index in range(10)],
+    )
+
+    assert peak == MAX_CONCURRENT_FAILING_POLLS
+    assert budgets == {COORDINATOR_UPDATE_TIMEOUT}
+
+
+async def test_failing_polls_leave_slots_free(hass: HomeAssistant) -> None:
+    """Test failing units holding their slots do not block reachable ones."""
+    orchestrator = DaikinPollOrchestrator(hass)
+    release = asyncio.Event()
+
+    async def _hold(coordinator: MagicMock) -> None:
+        async with orchestrator.async_poll_slot(coordinator):
+            await release.wait()
+
+    stuck = [
+        asyncio.create_task(_hold(_coordinator(f"down{index}", failing=True)))
+        for index in range(MAX_CONCURRENT_FAILING_POLLS)
+    ]
+    await asyncio.sleep(0)
+
+    async with asyncio.timeout(1):
+        peak, _ = await _max_concurrent(
+            orchestrator, [_coordinator(f"unit{index}") for index in range(6)]
+        )
+
+    assert peak == MAX_CONCURRENT_POLLS
+    release.set()
+    await asyncio.gather(*stuck)
+
+
+async def test_polls_land_on_the_grid(
+    hass: HomeAssistant, simulator: DaikinSimulator
+) -> None:
+    """Test the coordinators schedule their polls on their own phase."""
+    ticks: list[tuple[DaikinCoordinator, float, float]] = []
+    handle_tick = DaikinCoordinator._handle_poll_tick
+
+    def _record_tick(coordinator: DaikinCoordinator, when: float) -> None:
+        ticks.append((coordinator, when, coordinator.poll_interval))
+        handle_tick(coordinator, when)
+
+    with patch.object(DaikinCoordinator, "_handle_poll_tick", _record_tick):
+        entries = [
+            await async_setup_unit(hass, simulator.add_unit("DaikinBRP069"))
+            for _ in range(4)
+        ]
+        for round_ in range(3):
+            if round_ == 1:
+                # The first polls were scheduled before every unit was set up
+                ticks.clear()
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=200))
+            await hass.async_block_till_done(wait_background_tasks=True)
+    orchestrator = async_get_poll_orchestrator(hass)
+    coordinators = [entry.runtime_data for entry in entries]
+
+    assert {coordinator for coordinator, _, _ in ticks} == set(coordinators)
+    for coordinator, when, interval in ticks:
+        index = coordinators.index(coordinator)
+        assert _phase(orchestrator, when, interval) == pytest.approx(
+            interval * index / len(coordinators)
+        )
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_unloaded_coordinator_stops_polling(
+    hass: HomeAssistant, simulator: DaikinSimulator
+) -> None:
+    """Test no poll is scheduled once the entry is unloaded."""
+    unit = simulator.add_unit("DaikinBRP069")
+    entry = await async_setup_unit(hass, unit)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    polls = unit.polls
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=200))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert unit.polls == polls
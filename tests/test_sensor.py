@@ -0,0 +1,249 @@
+"""Tests of the Daikin sensors' publishing policies."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Callable
+from datetime import datetime
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.daikin.const import ATTR_INSIDE_TEMPERATURE
+from custom_components.daikin.sensor import DaikinPublishPolicy
+
+from . import async_setup_unit
+from .simulator import DaikinSimulator, SimulatedBRP069
+
+# The inside temperature sensor's policy
+DEADBAND = 0.5
+MIN_INTERVAL = 60
+HEARTBEAT = 900
+
+
+@pytest.mark.parametrize(
+    ("value", "last", "significant"),
+    [
+        (24.4, 24.0, False),
+        (24.5, 24.0, True),
+        (23.5, 24.0, True),
+        (None, 24.0, True),
+        (24.0, None, True),
+    ],
+)
+def test_deadband(value: float | None, last: float | None, significant: bool) -> None:
+    """Test moves of at least the deadband are significant."""
+    policy = DaikinPublishPolicy(deadband=DEADBAND)
+
+    assert policy.is_significant(value, last) is significant
+
+
+@pytest.mark.parametrize(
+    ("value", "last", "significant"),
+    [
+        (43, 40, False),
+        (44, 40, True),
+        (36, 40, True),
+        # Near zero the absolute deadband takes over
+        (0.5, 0.1, False),
+        (1.1, 0.1, True),
+    ],
+)
+def test_relative_deadband(value: float, last: float, significant: bool) -> None:
+    """Test the threshold is the larger of the absolute and relative deadband."""
+    policy = DaikinPublishPolicy(deadband=1, relative_deadband=0.1)
+
+    assert policy.is_significant(value, last) is significant
+
+
+@pytest.fixture
+def unit(simulator: DaikinSimulator) -> SimulatedBRP069:
+    """Return a simulated BRP069 unit."""
+    return simulator.add_unit("DaikinBRP069")
+
+
+class FakeClock:
+    """The sensors' monotonic clock and timers, which only the test moves.
+
+    Leaves the event loop's own time alone, and with it the polls and
+    request timeouts scheduled on it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = 1000.0
+        # [due, action] of the timers not fired or cancelled yet
+        self._timers: list[list[Any]] = []
+
+    def monotonic(self) -> float:
+        """Return the current time."""
+        return self.now
+
+    def call_later(
+        self, hass: HomeAssistant, delay: float, action: Callable[[datetime], None]
+    ) -> CALLBACK_TYPE:
+        """Schedule action like async_call_later; return its cancel callback."""
+        timer = [self.now + delay, action]
+        self._timers.append(timer)
+        return lambda: self._timers.remove(timer) if timer in self._timers else None
+
+    def advance(self, seconds: float) -> None:
+        """Move time on and run the timers due by then, in order."""
+        self.now += seconds
+        while due := [timer for timer in self._timers if timer[0] <= self.now]:
+            timer = min(due, key=lambda timer: timer[0])
+            self._timers.remove(timer)
+            timer[1](dt_util.utcnow())
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Return the sensors' clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+async def entry(
+    hass: HomeAssistant, unit: SimulatedBRP069, clock: FakeClock
+) -> AsyncGenerator[MockConfigEntry]:
+    """Set up the unit with the sensors' clock under the test's control."""
+    with (
+        patch("custom_components.daikin.sensor.time", clock),
+        patch("custom_components.daikin.sensor.async_call_later", clock.call_later),
+    ):
+        entry = await async_setup_unit(hass, unit)
+        yield entry
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+def _inside_temperature(hass: HomeAssistant, unit: SimulatedBRP069) -> str:
+    """Return the entity id of the inside temperature sensor."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", "daikin", f"{unit.mac}-{ATTR_INSIDE_TEMPERATURE}"
+    )
+    assert entity_id is not None
+    return entity_id
+
+
+async def _async_poll(
+    hass: HomeAssistant, entry: MockConfigEntry, clock: FakeClock, seconds: float
+) -> None:
+    """Move time on by seconds and poll the unit."""
+    clock.advance(seconds)
+    await entry.runtime_data.async_refresh()
+    await hass.async_block_till_done()
+
+
+async def _async_fire(hass: HomeAssistant, clock: FakeClock, seconds: float) -> None:
+    """Move time on by seconds and run the sensors' timers due by then."""
+    clock.advance(seconds)
+    await hass.async_block_till_done()
+
+
+async def test_small_moves_are_held_back(
+    hass: HomeAssistant,
+    unit: SimulatedBRP069,
+    entry: MockConfigEntry,
+    clock: FakeClock,
+) -> None:
+    """Test a move inside the deadband is not written, a larger one is."""
+    sensor = _inside_temperature(hass, unit)
+    assert hass.states.get(sensor).state == "25.0"
+
+    unit.set_inside_temperature(25.4)
+    await _async_poll(hass, entry, clock, MIN_INTERVAL)
+    assert hass.states.get(sensor).state == "25.0"
+
+    unit.set_inside_temperature(25.5)
+    await _async_poll(hass, entry, clock, 1)
+    assert hass.states.get(sensor).state == "25.5"
+
+
+async def test_min_interval_holds_the_next_write(
+    hass: HomeAssistant,
+    unit: SimulatedBRP069,
+    entry: MockConfigEntry,
+    clock: FakeClock,
+) -> None:
+    """Test a significant move within min_interval goes out when it ends."""
+    sensor = _inside_temperature(hass, unit)
+    unit.set_inside_temperature(24)
+    await _async_poll(hass, entry, clock, MIN_INTERVAL)
+    assert hass.states.get(sensor).state == "24.0"
+
+    unit.set_inside_temperature(23)
+    await _async_poll(hass, entry, clock, 10)
+    assert hass.states.get(sensor).state == "24.0"
+
+    await _async_fire(hass, clock, MIN_INTERVAL - 10)
+    assert hass.states.get(sensor).state == "23.0"
+
+
+async def test_availability_is_written_at_once(
+    hass: HomeAssistant,
+    unit: SimulatedBRP069,
+    entry: MockConfigEntry,
+    clock: FakeClock,
+) -> None:
+    """Test going unavailable skips min_interval."""
+    sensor = _inside_temperature(hass, unit)
+    unit.set_inside_temperature(24)
+    await _async_poll(hass, entry, clock, MIN_INTERVAL)
+
+    with patch.object(
+        entry.runtime_data.device, "update_status", side_effect=TimeoutError
+    ):
+        await _async_poll(hass, entry, clock, 1)
+
+    assert hass.states.get(sensor).state == STATE_UNAVAILABLE
+
+
+async def test_heartbeat_writes_the_current_value(
+    hass: HomeAssistant,
+    unit: SimulatedBRP069,
+    entry: MockConfigEntry,
+    clock: FakeClock,
+) -> None:
+    """Test heartbeat writes a held-back move, then the same value again."""
+    sensor = _inside_temperature(hass, unit)
+    unit.set_inside_temperature(25.2)
+    await _async_poll(hass, entry, clock, MIN_INTERVAL)
+    written = hass.states.get(sensor)
+    assert written.state == "25.0"
+
+    await _async_fire(hass, clock, HEARTBEAT - MIN_INTERVAL)
+    heartbeat = hass.states.get(sensor)
+    assert heartbeat.state == "25.2"
+    assert heartbeat.last_updated > written.last_updated
+
+    # Nothing moved: the next heartbeat still records a state
+    await _async_fire(hass, clock, HEARTBEAT)
+    repeated = hass.states.get(sensor)
+    assert repeated.state == "25.2"
+    assert repeated.last_updated > heartbeat.last_updated
+
+
+async def test_writes_restart_the_heartbeat(
+    hass: HomeAssistant,
+    unit: SimulatedBRP069,
+    entry: MockConfigEntry,
+    clock: FakeClock,
+) -> None:
+    """Test the heartbeat counts from the last write, not the last beat."""
+    sensor = _inside_temperature(hass, unit)
+    await _async_fire(hass, clock, HEARTBEAT - 100)
+    unit.set_inside_temperature(24)
+    await _async_poll(hass, entry, clock, 0)
+    written = hass.states.get(sensor)
+    assert written.state == "24.0"
+
+    await _async_fire(hass, clock, 100)
+    assert hass.states.get(sensor).last_updated == written.last_updated
+    await _async_fire(hass, clock, HEARTBEAT - 100)
+    assert hass.states.get(sensor).last_updated > written.last_updated
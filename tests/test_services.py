@@ -0,0 +1,89 @@
+"""Tests of the Daikin services against simulated units."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from homeassistant.components.climate import (
+    ATTR_FAN_MODE,
+    ATTR_HVAC_MODE,
+    DOMAIN as CLIMATE_DOMAIN,
+)
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.setup import async_setup_component
+
+from custom_components.daikin.const import DOMAIN, SERVICE_BULK_SET
+from custom_components.daikin.services import RESULT_ERROR, RESULT_OK
+
+from . import async_setup_unit, entity_id
+from .simulator import DaikinSimulator
+
+SET_CONTROL_INFO = "aircon/set_control_info"
+
+
+async def _async_bulk_set(hass: HomeAssistant, **data: Any) -> dict[str, Any]:
+    """Call daikin.bulk_set and return its per-entity results."""
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_BULK_SET, data, blocking=True, return_response=True
+    )
+    return response["results"]
+
+
+async def test_bulk_set_writes_every_unit(
+    hass: HomeAssistant, simulator: DaikinSimulator
+) -> None:
+    """Test each targeted unit gets the settings."""
+    units = [simulator.add_unit("DaikinBRP069") for _ in range(3)]
+    entries = [await async_setup_unit(hass, unit) for unit in units]
+    climates = [entity_id(hass, entry, CLIMATE_DOMAIN) for entry in entries]
+
+    results = await _async_bulk_set(
+        hass, **{ATTR_ENTITY_ID: climates, ATTR_TEMPERATURE: 21}
+    )
+
+    assert {result["result"] for result in results.values()} == {RESULT_OK}
+    assert [float(unit.control_info["stemp"]) for unit in units] == [21] * 3
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        # HVACMode.AUTO passes the schema but Daikin units do not offer it
+        {ATTR_HVAC_MODE: "auto"},
+        {ATTR_HVAC_MODE: "cool", ATTR_TEMPERATURE: 50},
+        {ATTR_HVAC_MODE: "cool", ATTR_FAN_MODE: "Turbo"},
+    ],
+    ids=["hvac_mode", "temperature", "fan_mode"],
+)
+async def test_bulk_set_rejects_unsupported_settings(
+    hass: HomeAssistant, simulator: DaikinSimulator, settings: dict[str, Any]
+) -> None:
+    """Test a setting the unit cannot take is reported and records nothing."""
+    unit = simulator.add_unit("DaikinBRP069")
+    entry = await async_setup_unit(hass, unit)
+    climate = entity_id(hass, entry, CLIMATE_DOMAIN)
+
+    results = await _async_bulk_set(hass, **{ATTR_ENTITY_ID: climate, **settings})
+
+    assert results[climate]["result"] == RESULT_ERROR
+    assert "ServiceValidationError" in results[climate]["error"]
+    assert unit.requests[SET_CONTROL_INFO] == 0
+    attributes = hass.states.get(climate).attributes
+    assert attributes["expected_hvac_mode"] is None
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_bulk_set_without_the_climate_platform(hass: HomeAssistant) -> None:
+    """Test the service fails cleanly while no climate platform is loaded."""
+    assert await async_setup_component(hass, DOMAIN, {})
+
+    with pytest.raises(ServiceValidationError):
+        await _async_bulk_set(
+            hass, **{ATTR_ENTITY_ID: "climate.nowhere", ATTR_TEMPERATURE: 21}
+        )
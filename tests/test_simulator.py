@@ -0,0 +1,157 @@
+"""Tests of the integration against the simulated adapters."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from aiohttp import ClientTimeout
+import pytest
+
+from homeassistant.components.climate import (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_TEMPERATURE,
+    SERVICE_SET_TEMPERATURE,
+)
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from . import async_setup_unit, entity_id
+from .simulator import (
+    ADAPTERS,
+    AdapterProfile,
+    DaikinSimulator,
+    SimulatedAirBase,
+    SimulatedBRP072C,
+    SimulatedBRP084,
+)
+
+
+@pytest.mark.parametrize("family", ADAPTERS)
+async def test_setup_detects_family(
+    hass: HomeAssistant, simulator: DaikinSimulator, family: str
+) -> None:
+    """Test each simulated family is detected as its pydaikin class."""
+    unit = simulator.add_unit(family)
+    entry = await async_setup_unit(hass, unit)
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert type(entry.runtime_data.device).__name__ == family
+    state = hass.states.get(entity_id(hass, entry, CLIMATE_DOMAIN))
+    assert state.state not in (STATE_OFF, "unavailable")
+    assert unit.polls > 0
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.parametrize("family", ADAPTERS)
+async def test_command_and_remote_change(
+    hass: HomeAssistant, simulator: DaikinSimulator, family: str
+) -> None:
+    """Test a command reaches the unit and a change at the unit comes back."""
+    unit = simulator.add_unit(family)
+    entry = await async_setup_unit(hass, unit)
+    climate = entity_id(hass, entry, CLIMATE_DOMAIN)
+
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        SERVICE_SET_TEMPERATURE,
+        {ATTR_ENTITY_ID: climate, ATTR_TEMPERATURE: 21},
+        blocking=True,
+    )
+    if isinstance(unit, SimulatedBRP084):
+        # Half degrees
+        assert int(unit.leaves[unit.INDOOR][("e_1002", "e_3001", "p_02")], 16) == 42
+    else:
+        assert float(unit.control_info["stemp"]) == 21
+    assert hass.states.get(climate).attributes[ATTR_TEMPERATURE] == 21
+
+    unit.set_power(False)
+    unit.set_inside_temperature(18)
+    await entry.runtime_data.async_refresh()
+    await hass.async_block_till_done()
+    state = hass.states.get(climate)
+    assert state.state == STATE_OFF
+    assert state.attributes[ATTR_CURRENT_TEMPERATURE] == 18
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_airbase_zone(hass: HomeAssistant, simulator: DaikinSimulator) -> None:
+    """Test a zone switch writes the zone setting of an AirBase unit."""
+    unit = simulator.add_unit(SimulatedAirBase.family)
+    entry = await async_setup_unit(hass, unit)
+    zone = er.async_get(hass).async_get_entity_id(
+        SWITCH_DOMAIN, "daikin", f"{unit.mac}-zone2"
+    )
+    assert hass.states.get(zone).state == STATE_OFF
+
+    await hass.services.async_call(
+        SWITCH_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: zone}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    assert unit.zone_setting["zone_onoff"] == "1;1;1;0"
+    assert unit.zone_setting["zone_name"] == ";".join(SimulatedAirBase.ZONES)
+    assert hass.states.get(zone).state == STATE_ON
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_brp072c_rejects_unregistered_terminal(
+    simulator: DaikinSimulator,
+) -> None:
+    """Test a BRP072C unit answers 403 until the terminal is registered."""
+    unit = simulator.add_unit(SimulatedBRP072C.family)
+    url = f"https://{unit.host}/common/basic_info"
+    headers = {"X-Daikin-uuid": unit.uuid}
+
+    async with simulator.session.get(url, headers=headers, ssl=False) as response:
+        assert response.status == 403
+    async with simulator.session.get(
+        f"https://{unit.host}/common/register_terminal",
+        params={"key": unit.key},
+        headers=headers,
+        ssl=False,
+    ) as response:
+        assert await response.text() == "ret=OK"
+    async with simulator.session.get(url, headers=headers, ssl=False) as response:
+        assert response.status == 200
+
+
+async def test_profile_latency_and_concurrency(simulator: DaikinSimulator) -> None:
+    """Test the adapter delays answers and serves one request at a time."""
+    unit = simulator.add_unit(
+        "DaikinBRP069", profile=AdapterProfile(latency=0.1, max_concurrency=1)
+    )
+    url = f"http://{unit.host}/aircon/get_sensor_info"
+
+    async def _get() -> None:
+        async with simulator.session.get(url) as response:
+            assert response.status == 200
+
+    started = time.monotonic()
+    await asyncio.gather(_get(), _get(), _get())
+    # Queued behind each other: three latencies, not one
+    assert time.monotonic() - started >= 0.3
+    assert unit.polls == 3
+
+
+async def test_profile_timeout(simulator: DaikinSimulator) -> None:
+    """Test an adapter that never answers makes the client time out."""
+    unit = simulator.add_unit("DaikinBRP069", profile=AdapterProfile(timeout_rate=1))
+
+    with pytest.raises(TimeoutError):
+        async with simulator.session.get(
+            f"http://{unit.host}/common/basic_info", timeout=ClientTimeout(total=0.2)
+        ):
+            pass
@@ -0,0 +1,55 @@
+"""Tests of the Daikin switches against a simulated unit."""
+
+from __future__ import annotations
+
+from homeassistant.components.switch import (
+    DOMAIN as SWITCH_DOMAIN,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+)
+from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from . import async_setup_unit
+from .simulator import DaikinSimulator
+
+SET_ZONE_SETTING = "skyfi/aircon/set_zone_setting"
+
+
+async def test_zone_changes_in_the_window_make_one_write(
+    hass: HomeAssistant, simulator: DaikinSimulator
+) -> None:
+    """Test switching every zone at once writes the zone setting once."""
+    unit = simulator.add_unit("DaikinAirBase")
+    entry = await async_setup_unit(hass, unit)
+    zones = [
+        entity.entity_id
+        for entity in sorted(
+            er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id),
+            key=lambda entity: entity.unique_id,
+        )
+        if entity.unique_id.startswith(f"{unit.mac}-zone")
+    ]
+    assert len(zones) == len(unit.ZONES)
+
+    # Zones 0 and 1 start on: flip all of them within the merge window
+    await hass.services.async_call(
+        SWITCH_DOMAIN, SERVICE_TURN_OFF, {ATTR_ENTITY_ID: zones[:2]}, blocking=False
+    )
+    await hass.services.async_call(
+        SWITCH_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: zones[2:]}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    stats = entry.runtime_data.command_stats
+    assert (stats.commands, stats.writes) == (len(zones), 1)
+    assert unit.requests[SET_ZONE_SETTING] == 1
+    assert unit.zone_setting["zone_onoff"] == "0;0;1;1"
+    assert [hass.states.get(zone).state for zone in zones] == [
+        STATE_OFF,
+        STATE_OFF,
+        STATE_ON,
+        STATE_ON,
+    ]
+    assert await hass.config_entries.async_unload(entry.entry_id)